@@ -0,0 +1,607 @@
+# ----------------------------------------------------------------------
+# File Name     : assignment.py
+# Author        : Worralop Srichainont
+# Description   : AssignmentFile class for writing the seating result to a
+#                 compact binary file, and reading it back with a memory
+#                 map and binary search.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import bisect
+import mmap
+import os
+
+import numpy as np
+
+import config
+import inventory
+import logs
+import room
+import student
+
+# The magic number and version at the start of the assignment file.
+ASSIGNMENT_MAGIC = 0x534541544153
+ASSIGNMENT_VERSION = 1
+
+# The flags of the assignment file.
+STUDENT_IDS_INT = 1
+RANDOM_MODE = 2
+
+# The marker of a student without a room or a seat.
+UNASSIGNED = -1
+
+# The layout of each record of the seat table.
+SEAT_DTYPE = np.dtype(
+    [
+        ("id_offset", "<u8"),
+        ("id_length", "<u4"),
+        ("name_offset", "<u8"),
+        ("name_length", "<u4"),
+        ("is_available", "<u1"),
+    ]
+)
+
+# The layout of each student record, sorted by student ID. The key is the integer value
+# of the student ID if all student IDs are integer keys, so the binary search does not
+# decode any string.
+RECORD_DTYPE = np.dtype(
+    [
+        ("key", "<i8"),
+        ("id_offset", "<u8"),
+        ("id_length", "<u4"),
+        ("name_offset", "<u8"),
+        ("name_length", "<u4"),
+        ("room_index", "<i4"),
+        ("seat_index", "<i8"),
+    ]
+)
+
+# The layout of the header: magic, version, flags, students, rooms, seats,
+# string table bytes, and the offset and length of the seed.
+HEADER_DTYPE = np.dtype("<u8")
+HEADER_LENGTH = 9
+
+
+class AssignmentFile:
+    """
+    AssignmentFile class for writing the seating result to a compact binary file,
+    and reading it back with a memory map and binary search, without parsing.
+
+    The file contains a header, the room table with the same layout as the shared
+    room inventory, the seat table of all seats of each room, the fixed-width student
+    records sorted by student ID with the index of their room and seat, and a string
+    table with all IDs and names in UTF-8. The tables are read as zero-copy NumPy views
+    of the memory map, so opening the file does not depend on its size.
+
+    Attributes:
+        path (str): The path of the assignment file.
+        memory_map (mmap.mmap): The read-only memory map of the file.
+        flags (int): The flags of the file.
+        seed (str): The seed of the assigned run.
+        rooms (numpy.ndarray): The room table.
+        seats (numpy.ndarray): The seat table.
+        records (numpy.ndarray): The student records, sorted by student ID.
+        strings (numpy.ndarray): The string table.
+    """
+
+    def __init__(self, path, memory_map):
+        """
+        Initialize an AssignmentFile object with zero-copy views of a memory map.
+        Use open() instead of calling it directly.
+
+        Args:
+            path (str): The path of the assignment file.
+            memory_map (mmap.mmap): The read-only memory map of the file.
+
+        Raises:
+            ValueError: If the file is not an assignment file.
+        """
+
+        # Initialize attributes.
+        self.path = path
+        self.memory_map = memory_map
+
+        # Read the header.
+        header = np.frombuffer(memory_map, HEADER_DTYPE, HEADER_LENGTH, 0)
+        (
+            magic,
+            version,
+            self.flags,
+            student_count,
+            room_count,
+            seat_count,
+            string_bytes,
+            seed_offset,
+            seed_length,
+        ) = (int(value) for value in header)
+        if magic != ASSIGNMENT_MAGIC or version != ASSIGNMENT_VERSION:
+            raise ValueError(f"{path} is not an assignment file.")
+
+        # Create the views of the tables.
+        offset = header.nbytes
+        self.rooms = np.frombuffer(memory_map, inventory.ROOM_DTYPE, room_count, offset)
+        offset += self.rooms.nbytes
+        self.seats = np.frombuffer(memory_map, SEAT_DTYPE, seat_count, offset)
+        offset += self.seats.nbytes
+        self.records = np.frombuffer(memory_map, RECORD_DTYPE, student_count, offset)
+        offset += self.records.nbytes
+        self.strings = np.frombuffer(memory_map, "<u1", string_bytes, offset)
+        self.seed = self.get_string(seed_offset, seed_length)
+
+    @staticmethod
+    def write(randomizer, output_path=None, students_db=None, rooms_db=None):
+        """
+        Write the assigned students and rooms to an assignment file atomically.
+
+        Args:
+            randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+            output_path (str or None, optional): The path of the assignment file.
+            Defaults to None, which uses config.GENERATED_ASSIGNMENT_PATH.
+            students_db (dict or None, optional): The assigned students.
+            Defaults to None, which uses the global STUDENTS_DB.
+            rooms_db (dict or None, optional): The assigned rooms.
+            Defaults to None, which uses the global ROOMS_DB.
+        """
+
+        if output_path is None:
+            output_path = config.GENERATED_ASSIGNMENT_PATH
+        if students_db is None:
+            students_db = config.STUDENTS_DB
+        if rooms_db is None:
+            rooms_db = config.ROOMS_DB
+
+        # Collect the strings and their references.
+        strings = bytearray()
+
+        def add_string(value):
+            encoded = str(value).encode()
+            strings.extend(encoded)
+            return len(strings) - len(encoded), len(encoded)
+
+        seed_ref = add_string(randomizer.seed)
+
+        # Write the room table and the seat table of all seats of each room.
+        ROOM_RECORDS = []
+        SEAT_RECORDS = []
+        room_indexes = {}
+        seat_starts = {}
+        for room_id, room_obj in rooms_db.items():
+            flags = 0
+            if all(isinstance(value, int) for value in room_obj.seat_ids):
+                flags |= inventory.SEAT_IDS_INT
+            if all(isinstance(value, int) for value in room_obj.seat_names):
+                flags |= inventory.SEAT_NAMES_INT
+            if isinstance(room_id, int):
+                flags |= inventory.ROOM_ID_INT
+            if isinstance(room_obj.room_name, int):
+                flags |= inventory.ROOM_NAME_INT
+
+            room_indexes[room_id] = len(ROOM_RECORDS)
+            seat_starts[room_id] = len(SEAT_RECORDS)
+            ROOM_RECORDS.append(
+                (
+                    *add_string(room_id),
+                    *add_string(room_obj.room_name),
+                    int(room_obj.capacity),
+                    len(SEAT_RECORDS),
+                    len(room_obj.seat_ids),
+                    flags,
+                )
+            )
+            SEAT_RECORDS.extend(
+                (*add_string(seat_id), *add_string(seat_name), is_available)
+                for seat_id, seat_name, is_available in zip(
+                    room_obj.seat_ids, room_obj.seat_names, room_obj.seat_availability
+                )
+            )
+
+        # Write the student records sorted by student ID. The student IDs are only
+        # used as keys if they are all integer keys of the same length.
+        student_ids = sorted(students_db)
+        is_int_ids = bool(student_ids) and all(
+            AssignmentFile.is_int_key(student_id, len(student_ids[0]))
+            for student_id in student_ids
+        )
+        STUDENT_RECORDS = []
+        for student_id in student_ids:
+            student_obj = students_db[student_id]
+            room_index = seat_index = UNASSIGNED
+            if student_obj.room is not None:
+                room_index = room_indexes[student_obj.room.room_id]
+            if student_obj.seat is not None:
+                seat_index = (
+                    seat_starts[student_obj.room.room_id]
+                    + student_obj.room.seat_positions[student_obj.seat.seat_id]
+                )
+            STUDENT_RECORDS.append(
+                (
+                    int(student_id) if is_int_ids else 0,
+                    *add_string(student_id),
+                    *add_string(student_obj.student_name),
+                    room_index,
+                    seat_index,
+                )
+            )
+
+        # Write the header and the tables to a temporary file first, then rename it,
+        # so the readers never open a partially written file.
+        flags = (STUDENT_IDS_INT if is_int_ids else 0) | (
+            RANDOM_MODE if randomizer.is_random_mode else 0
+        )
+        header = np.array(
+            [
+                ASSIGNMENT_MAGIC,
+                ASSIGNMENT_VERSION,
+                flags,
+                len(STUDENT_RECORDS),
+                len(ROOM_RECORDS),
+                len(SEAT_RECORDS),
+                len(strings),
+                *seed_ref,
+            ],
+            dtype=HEADER_DTYPE,
+        )
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        temporary_path = f"{output_path}.tmp"
+        with open(temporary_path, "wb") as output_file:
+            output_file.write(header.tobytes())
+            output_file.write(
+                np.array(ROOM_RECORDS, dtype=inventory.ROOM_DTYPE).tobytes()
+            )
+            output_file.write(np.array(SEAT_RECORDS, dtype=SEAT_DTYPE).tobytes())
+            output_file.write(np.array(STUDENT_RECORDS, dtype=RECORD_DTYPE).tobytes())
+            output_file.write(strings)
+        os.replace(temporary_path, output_path)
+
+        # Write logs.
+        messages = [
+            "ASSIGNMENT FILE WRITTEN",
+            f"PATH = {output_path}",
+            f"TOTAL STUDENTS = {len(STUDENT_RECORDS)}",
+            f"TOTAL ROOMS = {len(ROOM_RECORDS)}",
+            f"TOTAL SEATS = {len(SEAT_RECORDS)}",
+            f"SIZE = {os.path.getsize(output_path)} BYTES",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def open(path=None):
+        """
+        Open an assignment file with a read-only memory map.
+
+        Args:
+            path (str or None, optional): The path of the assignment file.
+            Defaults to None, which uses config.GENERATED_ASSIGNMENT_PATH.
+
+        Returns:
+            AssignmentFile: The opened assignment file.
+        """
+
+        if path is None:
+            path = config.GENERATED_ASSIGNMENT_PATH
+        # The memory map keeps its own handle of the file, so the file can be closed.
+        with open(path, "rb") as file:
+            memory_map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return AssignmentFile(path, memory_map)
+
+    def is_random_mode(self):
+        """
+        Check whether the assigned run was in random mode.
+
+        Returns:
+            bool: True if random mode was enabled, False otherwise.
+        """
+
+        return bool(self.flags & RANDOM_MODE)
+
+    def get_string(self, offset, length, is_int=False):
+        """
+        Read a value from the string table.
+
+        Args:
+            offset (int): The offset of the value in the string table.
+            length (int): The length of the value in bytes.
+            is_int (bool, optional): Whether to read the value as an integer. Defaults to False.
+
+        Returns:
+            str or int: The value.
+        """
+
+        value = self.strings[offset : offset + length].tobytes().decode()
+        return int(value) if is_int else value
+
+    @staticmethod
+    def is_int_key(student_id, length):
+        """
+        Check whether a student ID can be used as an integer key. It must be written
+        with the given number of digits without a leading zero, so the integer keys are
+        sorted in the same order as the student IDs, and it must fit in the key.
+
+        Args:
+            student_id (str): The student ID.
+            length (int): The number of digits of all student IDs.
+
+        Returns:
+            bool: True if the student ID can be used as an integer key, False otherwise.
+        """
+
+        return (
+            len(student_id) == length
+            and student_id.isascii()
+            and student_id.isdigit()
+            and not student_id.startswith("0")
+            and int(student_id) < 2**63
+        )
+
+    def get_student_key(self, position):
+        """
+        Get the sort key of the student at a position of the student records.
+
+        Args:
+            position (int): The position of the student record.
+
+        Returns:
+            str or int: The integer key, or the student ID if the keys are not used.
+        """
+
+        record = self.records[position]
+        if self.flags & STUDENT_IDS_INT:
+            return int(record["key"])
+        return self.get_string(int(record["id_offset"]), int(record["id_length"]))
+
+    def get_student_id(self, position):
+        """
+        Get the ID of the student at a position of the student records.
+
+        Args:
+            position (int): The position of the student record.
+
+        Returns:
+            str: The student ID.
+        """
+
+        return str(self.get_student_key(position))
+
+    def find_student(self, student_id):
+        """
+        Find the position of a student in the student records by binary search.
+
+        Args:
+            student_id (str): The student ID.
+
+        Returns:
+            int: The position of the student record.
+
+        Raises:
+            KeyError: If the student is not in the assignment file.
+        """
+
+        # The student IDs are compared with the same keys as they were sorted.
+        sorted_keys = _SortedStudentKeys(self)
+        key = str(student_id)
+        if self.flags & STUDENT_IDS_INT:
+            if not AssignmentFile.is_int_key(key, len(self.get_student_id(0))):
+                raise KeyError(student_id)
+            key = int(key)
+
+        position = bisect.bisect_left(sorted_keys, key)
+        if position < len(sorted_keys) and sorted_keys[position] == key:
+            return position
+        raise KeyError(student_id)
+
+    def get_room_row(self, room_index):
+        """
+        Get the ID and name of a room of the room table.
+
+        Args:
+            room_index (int): The position of the room.
+
+        Returns:
+            tuple: The room ID and room name.
+        """
+
+        record = self.rooms[room_index]
+        flags = int(record["flags"])
+        return (
+            self.get_string(
+                int(record["id_offset"]),
+                int(record["id_length"]),
+                bool(flags & inventory.ROOM_ID_INT),
+            ),
+            self.get_string(
+                int(record["name_offset"]),
+                int(record["name_length"]),
+                bool(flags & inventory.ROOM_NAME_INT),
+            ),
+        )
+
+    def get_seat_row(self, room_index, seat_index):
+        """
+        Get the ID and name of a seat of the seat table.
+
+        Args:
+            room_index (int): The position of the room of the seat.
+            seat_index (int): The position of the seat.
+
+        Returns:
+            tuple: The seat ID and seat name.
+        """
+
+        flags = int(self.rooms[room_index]["flags"])
+        record = self.seats[seat_index]
+        return (
+            self.get_string(
+                int(record["id_offset"]),
+                int(record["id_length"]),
+                bool(flags & inventory.SEAT_IDS_INT),
+            ),
+            self.get_string(
+                int(record["name_offset"]),
+                int(record["name_length"]),
+                bool(flags & inventory.SEAT_NAMES_INT),
+            ),
+        )
+
+    def lookup(self, student_id):
+        """
+        Look up the room and seat of a student.
+
+        Args:
+            student_id (str or int): The student ID.
+
+        Returns:
+            dict: The student ID, student name, room ID, room name, seat ID and
+            seat name of the student, where the room and seat are None if unassigned.
+
+        Raises:
+            KeyError: If the student is not in the assignment file.
+        """
+
+        position = self.find_student(student_id)
+        record = self.records[position]
+        room_index = int(record["room_index"])
+        seat_index = int(record["seat_index"])
+
+        room_id = room_name = seat_id = seat_name = None
+        if room_index != UNASSIGNED:
+            room_id, room_name = self.get_room_row(room_index)
+        if seat_index != UNASSIGNED:
+            seat_id, seat_name = self.get_seat_row(room_index, seat_index)
+
+        return {
+            "student_id": self.get_student_id(position),
+            "student_name": self.get_string(
+                int(record["name_offset"]), int(record["name_length"])
+            ),
+            "room_id": room_id,
+            "room_name": room_name,
+            "seat_id": seat_id,
+            "seat_name": seat_name,
+        }
+
+    def load_databases(self):
+        """
+        Load the assigned students and rooms from the assignment file into the global
+        variables, with the same objects as after the seat assignment of the run.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["load_databases() CALLED"])
+
+        # Create the Room objects with all their seats.
+        ROOMS = []
+        for room_index, record in enumerate(self.rooms):
+            room_id, room_name = self.get_room_row(room_index)
+            start = int(record["seat_start"])
+            end = start + int(record["seat_count"])
+            seat_rows = [
+                self.get_seat_row(room_index, seat_index)
+                for seat_index in range(start, end)
+            ]
+            room_obj = room.Room(
+                room_id,
+                room_name,
+                int(record["capacity"]),
+                [seat_id for seat_id, _ in seat_rows],
+                [seat_name for _, seat_name in seat_rows],
+                bytearray(self.seats["is_available"][start:end].tobytes()),
+            )
+            room_obj.students = {}
+            room_obj.occupied_seats_id = []
+            ROOMS.append(room_obj)
+
+        # Create the Student objects, and place them on their seats.
+        STUDENTS_DB = {}
+        for position, record in enumerate(self.records):
+            student_obj = student.Student(
+                self.get_student_id(position),
+                self.get_string(int(record["name_offset"]), int(record["name_length"])),
+            )
+            STUDENTS_DB[student_obj.student_id] = student_obj
+
+            room_index = int(record["room_index"])
+            if room_index == UNASSIGNED:
+                continue
+            room_obj = ROOMS[room_index]
+            student_obj.room = room_obj
+            room_obj.students[student_obj.student_id] = student_obj
+
+            seat_index = int(record["seat_index"])
+            if seat_index == UNASSIGNED:
+                continue
+            seat_id, _ = self.get_seat_row(room_index, seat_index)
+            seat_obj = room_obj.get_seat(seat_id)
+            seat_obj.student = student_obj
+            student_obj.seat = seat_obj
+            room_obj.occupied_seats_id.append(seat_id)
+
+        for room_obj in ROOMS:
+            room_obj.set_occupied_seats(sorted(room_obj.occupied_seats_id))
+
+        # Store the databases in the global variables.
+        config.STUDENTS_DB.clear()
+        config.STUDENTS_DB.update(STUDENTS_DB)
+        config.ROOMS_DB.clear()
+        config.ROOMS_DB.update((room_obj.room_id, room_obj) for room_obj in ROOMS)
+        config.TOTAL_STUDENTS = len(STUDENTS_DB)
+        config.TOTAL_AVAILABLE_SEATS = sum(
+            len(room_obj.available_seats_id) for room_obj in ROOMS
+        )
+
+        # Write logs.
+        messages = [
+            "ASSIGNMENT FILE LOADED",
+            f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+            f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+            f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def close(self):
+        """
+        Release the views, then close the memory map.
+        """
+
+        # The views must be released before the memory map can be closed.
+        for attribute in ["rooms", "seats", "records", "strings"]:
+            setattr(self, attribute, None)
+        self.memory_map.close()
+
+
+class _SortedStudentKeys:
+    """
+    Sequence of the sort keys of the students of an assignment file in sorted order,
+    read on access, so the binary search does not read every student ID.
+
+    Attributes:
+        assignment_file (AssignmentFile): The assignment file of the students.
+    """
+
+    def __init__(self, assignment_file):
+        """
+        Initialize a _SortedStudentKeys object.
+
+        Args:
+            assignment_file (AssignmentFile): The assignment file of the students.
+        """
+
+        self.assignment_file = assignment_file
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of students.
+        """
+
+        return len(self.assignment_file.records)
+
+    def __getitem__(self, position):
+        """
+        Args:
+            position (int): The position in the sorted order.
+
+        Returns:
+            str or int: The sort key of the student at the position.
+        """
+
+        return self.assignment_file.get_student_key(position)
@@ -0,0 +1,273 @@
+# ----------------------------------------------------------------------
+# File Name     : checkpoint.py
+# Author        : Worralop Srichainont
+# Description   : Checkpoint class for saving the progress of a seating
+#                 run after each phase, and resuming an interrupted run.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+import pickle
+import shutil
+
+import config
+import logs
+import watcher
+
+# The version of the checkpoint state file format.
+CHECKPOINT_VERSION = 3
+
+# The phases after which the checkpoint state is saved, in order.
+PHASE_LOAD = "LOAD DATABASES"
+PHASE_ASSIGN = "ASSIGN SEATS"
+PHASES = [PHASE_LOAD, PHASE_ASSIGN]
+
+
+class Checkpoint:
+    """
+    Checkpoint class for saving the progress of a seating run after each phase,
+    and resuming an interrupted run with exactly the same outputs.
+
+    The state file keeps the parsed databases after the load phase, and the assigned
+    databases after the assignment phase, together with the seed, the random mode, the
+    room allocation and assignment configurations and the signatures of the input
+    files. The progress file lists the output files which are already written in the
+    generate phase, one line for each file.
+
+    Attributes:
+        state (dict or None): The saved state, or None if there is no usable checkpoint.
+        is_students_written (bool): Whether the output students CSV file is written.
+        written_room_ids (set): The IDs of the rooms whose output CSV files are written.
+    """
+
+    def __init__(self):
+        """
+        Initialize a Checkpoint object without any saved state.
+        """
+
+        # Initialize attributes.
+        self.state = None
+        self.is_students_written = False
+        self.written_room_ids = set()
+
+    @staticmethod
+    def get_state_path():
+        """
+        Get the path of the checkpoint state file.
+
+        Returns:
+            str: The path of the state file.
+        """
+
+        return os.path.join(config.CHECKPOINT_PATH, "state.pkl")
+
+    @staticmethod
+    def get_progress_path():
+        """
+        Get the path of the checkpoint progress file.
+
+        Returns:
+            str: The path of the progress file.
+        """
+
+        return os.path.join(config.CHECKPOINT_PATH, "progress.txt")
+
+    def load(self):
+        """
+        Load the checkpoint of an interrupted run, if its input files have not changed.
+
+        Returns:
+            bool: True if a usable checkpoint is loaded, False otherwise.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["load() CALLED"])
+
+        if not os.path.exists(Checkpoint.get_state_path()):
+            return False
+
+        with open(Checkpoint.get_state_path(), "rb") as state_file:
+            state = pickle.load(state_file)
+
+        # The checkpoint cannot be used if the input files have changed since it
+        # was saved.
+        if (
+            state.get("version") != CHECKPOINT_VERSION
+            or state.get("signatures") != watcher.Watcher.get_signatures()
+        ):
+            logs.Logs.write_logs(["CHECKPOINT IGNORED", "REASON = INPUT FILES CHANGED"])
+            return False
+        self.state = state
+
+        # Read the output files which are already written.
+        if os.path.exists(Checkpoint.get_progress_path()):
+            with open(
+                Checkpoint.get_progress_path(), encoding="utf-8"
+            ) as progress_file:
+                for line in progress_file:
+                    kind, _, value = line.rstrip("\n").partition(" ")
+                    if kind == "STUDENTS":
+                        self.is_students_written = True
+                    elif kind == "ROOM":
+                        self.written_room_ids.add(value)
+
+        # Write logs.
+        messages = [
+            "CHECKPOINT LOADED",
+            f"PHASE = {self.state['phase']}",
+            f"STUDENTS CSV WRITTEN = {self.is_students_written}",
+            f"ROOM CSVS WRITTEN = {len(self.written_room_ids)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return True
+
+    def is_phase_completed(self, phase):
+        """
+        Check whether a phase was completed by the interrupted run.
+
+        Args:
+            phase (str): The name of the phase.
+
+        Returns:
+            bool: True if the phase is completed, False otherwise.
+        """
+
+        return self.state is not None and PHASES.index(
+            self.state["phase"]
+        ) >= PHASES.index(phase)
+
+    def save(self, phase, randomizer):
+        """
+        Save the databases and counters after a completed phase,
+        replacing the previous state file atomically.
+
+        Args:
+            phase (str): The name of the completed phase.
+            randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+        """
+
+        self.state = {
+            "version": CHECKPOINT_VERSION,
+            "phase": phase,
+            "signatures": watcher.Watcher.get_signatures(),
+            "is_random_mode": randomizer.is_random_mode,
+            "seed": randomizer.seed,
+            "allocation_strategy": config.ALLOCATION_STRATEGY,
+            "room_fill_target": config.ROOM_FILL_TARGET,
+            "group_rooms_by_building": config.GROUP_ROOMS_BY_BUILDING,
+            "assignment_permutation": config.ASSIGNMENT_PERMUTATION,
+            "students_db": config.STUDENTS_DB,
+            "rooms_db": config.ROOMS_DB,
+            "pins_db": config.PINS_DB,
+            "total_students": config.TOTAL_STUDENTS,
+            "total_available_seats": config.TOTAL_AVAILABLE_SEATS,
+        }
+
+        # Write the state to a temporary file first, so an interrupted save
+        # never leaves a broken state file.
+        os.makedirs(config.CHECKPOINT_PATH, exist_ok=True)
+        temporary_path = f"{Checkpoint.get_state_path()}.tmp"
+        with open(temporary_path, "wb") as state_file:
+            pickle.dump(self.state, state_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, Checkpoint.get_state_path())
+
+        # A new assignment invalidates the output files written before.
+        if phase == PHASE_ASSIGN:
+            open(Checkpoint.get_progress_path(), "w", encoding="utf-8").close()
+            self.is_students_written = False
+            self.written_room_ids = set()
+
+        # Write logs.
+        messages = ["CHECKPOINT SAVED", f"PHASE = {phase}"]
+        logs.Logs.write_logs(messages)
+
+    def restore_configurations(self):
+        """
+        Restore the room allocation and assignment configurations of the loaded
+        checkpoint, so the resumed run assigns the seats in the same way as the
+        interrupted run.
+        """
+
+        config.ALLOCATION_STRATEGY = self.state["allocation_strategy"]
+        config.ROOM_FILL_TARGET = self.state["room_fill_target"]
+        config.GROUP_ROOMS_BY_BUILDING = self.state["group_rooms_by_building"]
+        config.ASSIGNMENT_PERMUTATION = self.state["assignment_permutation"]
+
+        # Write logs.
+        messages = [
+            "CHECKPOINT CONFIGURATIONS RESTORED",
+            f"ALLOCATION STRATEGY = {config.ALLOCATION_STRATEGY}",
+            f"ROOM FILL TARGET = {config.ROOM_FILL_TARGET}",
+            f"GROUP ROOMS BY BUILDING = {config.GROUP_ROOMS_BY_BUILDING}",
+            f"ASSIGNMENT PERMUTATION = {config.ASSIGNMENT_PERMUTATION}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def restore(self):
+        """
+        Restore the databases and counters of the loaded checkpoint to the global
+        variables.
+        """
+
+        # Keep the same dictionary objects, since other modules refer to them.
+        config.STUDENTS_DB.clear()
+        config.STUDENTS_DB.update(self.state["students_db"])
+        config.ROOMS_DB.clear()
+        config.ROOMS_DB.update(self.state["rooms_db"])
+        config.PINS_DB.clear()
+        config.PINS_DB.update(self.state["pins_db"])
+        config.TOTAL_STUDENTS = self.state["total_students"]
+        config.TOTAL_AVAILABLE_SEATS = self.state["total_available_seats"]
+
+        # Write logs.
+        messages = [
+            "CHECKPOINT RESTORED",
+            f"PHASE = {self.state['phase']}",
+            f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+            f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def mark_written(self, line):
+        """
+        Append an output file to the progress file as soon as it is written.
+
+        Args:
+            line (str): The progress line of the output file.
+        """
+
+        with open(
+            Checkpoint.get_progress_path(), "a", encoding="utf-8"
+        ) as progress_file:
+            progress_file.write(f"{line}\n")
+
+    def mark_students_written(self):
+        """
+        Mark the output students CSV file as written.
+        """
+
+        self.is_students_written = True
+        self.mark_written("STUDENTS")
+
+    def mark_room_written(self, room_id):
+        """
+        Mark the output CSV file of a room as written.
+
+        Args:
+            room_id (str): The unique identifier for the room.
+        """
+
+        self.written_room_ids.add(str(room_id))
+        self.mark_written(f"ROOM {room_id}")
+
+    def clear(self):
+        """
+        Remove the checkpoint after the run is completed.
+        """
+
+        shutil.rmtree(config.CHECKPOINT_PATH, ignore_errors=True)
+        self.state = None
+
+        # Write logs.
+        logs.Logs.write_logs(["CHECKPOINT CLEARED"])
@@ -15,17 +15,58 @@ DB_PATH = os.path.join(ROOT_PATH, "database")
 ROOMS_PATH = os.path.join(DB_PATH, "rooms", "rooms.csv")
 SEATS_PATH = os.path.join(DB_PATH, "rooms", "seats")
 STUDENTS_PATH = os.path.join(DB_PATH, "students", "students.csv")
+PINS_PATH = os.path.join(DB_PATH, "pins", "pins.csv")
+EXAMS_PATH = os.path.join(DB_PATH, "exams", "exams.csv")
+EXAM_STUDENTS_PATH = os.path.join(DB_PATH, "exams", "students")
 
 GENERATED_PATH = os.path.join(ROOT_PATH, "generated")
 GENERATED_STUDENT_PATH = os.path.join(GENERATED_PATH, "output_students.csv")
 GENERATED_ROOMS_PATH = os.path.join(GENERATED_PATH, "rooms")
+GENERATED_ALL_ROOMS_PATH = os.path.join(GENERATED_PATH, "output_all_rooms")
+GENERATED_ASSIGNMENT_PATH = os.path.join(GENERATED_PATH, "output_assignment.bin")
+GENERATED_SCHEDULE_PATH = os.path.join(GENERATED_PATH, "schedule")
+GENERATED_INTERLEAVED_PATH = os.path.join(GENERATED_PATH, "interleaved")
+GENERATED_SHARDS_PATH = os.path.join(GENERATED_PATH, "shards")
+CHECKPOINT_PATH = os.path.join(GENERATED_PATH, "checkpoint")
+GENERATED_HTML_PATH = os.path.join(GENERATED_PATH, "html")
 
 REPORT_PATH = os.path.join(GENERATED_PATH, "logs", "report.txt")
 LOGS_PATH = os.path.join(GENERATED_PATH, "logs", "logs.txt")
+MEMORY_PROFILE_PATH = os.path.join(GENERATED_PATH, "logs", "memory_profile.json")
+METRICS_PATH = os.path.join(GENERATED_PATH, "logs", "seat_randomizer.prom")
+
+# Logging modes
+# - "full" writes every log entry to the logs file as it happens.
+# - "flight" keeps the most recent log entries in memory, and only writes
+#   them to the logs file when the program fails or receives a signal.
+LOGS_MODE_FULL = "full"
+LOGS_MODE_FLIGHT = "flight"
+LOGS_MODES = [LOGS_MODE_FULL, LOGS_MODE_FLIGHT]
+LOGS_MODE = LOGS_MODE_FULL
+
+# Maximum number of log entries kept in memory in flight recorder mode.
+FLIGHT_RECORDER_SIZE = 5000
+
+# Compression of the logs and report files, and the file extension of each one.
+# The "zstd" compression requires the optional "zstandard" package.
+LOGS_COMPRESSION_NONE = "none"
+LOGS_COMPRESSION_GZIP = "gzip"
+LOGS_COMPRESSION_ZSTD = "zstd"
+LOGS_COMPRESSION_EXTENSIONS = {
+    LOGS_COMPRESSION_NONE: "",
+    LOGS_COMPRESSION_GZIP: ".gz",
+    LOGS_COMPRESSION_ZSTD: ".zst",
+}
+LOGS_COMPRESSION = LOGS_COMPRESSION_NONE
+
+# Maximum size in bytes of each logs and report file segment on disk,
+# before continuing in the next segment. Set to 0 to disable rotation.
+LOGS_MAX_SEGMENT_BYTES = 0
 
 # Initialize global variables for databases
 STUDENTS_DB = {}
 ROOMS_DB = {}
+PINS_DB = {}
 
 # Initialize global counters
 TOTAL_STUDENTS = 0
@@ -38,6 +79,7 @@ ROOM_COL = "ห้อง"
 SEAT_COL = "เลขที่นั่ง"
 ACTUAL_SEAT_COL = "เลขที่นั่งจริง"
 SIGNATURE_COL = "ลงชื่อ"
+EXAM_COL = "รหัสวิชา"
 
 # Output CSV Headers
 OUTPUT_STUDENTS_CSV_HEADER = [
@@ -55,3 +97,105 @@ OUTPUT_ROOM_CSV_HEADER = [
     ACTUAL_SEAT_COL,
     SIGNATURE_COL,
 ]
+
+OUTPUT_INTERLEAVED_ROOM_CSV_HEADER = [
+    SEAT_COL,
+    EXAM_COL,
+    STUDENT_ID_COL,
+    STUDENT_NAME_COL,
+    ACTUAL_SEAT_COL,
+    SIGNATURE_COL,
+]
+
+# Additional output formats written alongside the CSV files, and the file extension
+# of each one. The "arrow" and "parquet" formats require the optional "pyarrow" package.
+OUTPUT_FORMAT_JSONL = "jsonl"
+OUTPUT_FORMAT_ARROW = "arrow"
+OUTPUT_FORMAT_PARQUET = "parquet"
+OUTPUT_FORMAT_EXTENSIONS = {
+    OUTPUT_FORMAT_JSONL: ".jsonl",
+    OUTPUT_FORMAT_ARROW: ".arrow",
+    OUTPUT_FORMAT_PARQUET: ".parquet",
+}
+OUTPUT_FORMATS = []
+
+# Fields of the records in the additional output formats. All fields are strings,
+# so student IDs with leading zeros are kept as they are.
+OUTPUT_RECORD_FIELDS = [
+    "room_id",
+    "room_name",
+    "seat_id",
+    "seat_name",
+    "student_id",
+    "student_name",
+]
+
+# Whether to write the seating result to the binary assignment file.
+WRITE_ASSIGNMENT_FILE = False
+
+# Number of worker threads in pipeline mode.
+PIPELINE_WORKERS = 4
+
+# Whether to render the printable HTML seat maps and door lists of all rooms.
+RENDER_HTML = False
+
+# Number of worker processes for rendering the HTML pages. Set to 0 to use
+# the number of CPUs.
+RENDER_WORKERS = 0
+
+# Number of seats in each row of the HTML seat maps.
+SEAT_MAP_COLUMNS = 6
+
+# Utilisation ratio from which a room is marked as near its capacity in plan mode.
+PLAN_NEAR_CAPACITY_RATIO = 0.9
+
+# Allocation strategies of the rooms.
+# - "proportional" opens all rooms, and partitions the students to each room
+#   by the ratio of its available seats.
+# - "fewest-rooms" only opens the fewest rooms which fit all students, each
+#   filled up to ROOM_FILL_TARGET of its available seats.
+ALLOCATION_PROPORTIONAL = "proportional"
+ALLOCATION_FEWEST_ROOMS = "fewest-rooms"
+ALLOCATION_STRATEGIES = [ALLOCATION_PROPORTIONAL, ALLOCATION_FEWEST_ROOMS]
+ALLOCATION_STRATEGY = ALLOCATION_PROPORTIONAL
+
+# Ratio of the available seats of each room to fill in the "fewest-rooms" strategy.
+ROOM_FILL_TARGET = 1.0
+
+# Whether to select the rooms from the fewest buildings in the "fewest-rooms"
+# strategy. The building of a room is the prefix of its room ID before the
+# first BUILDING_SEPARATOR.
+GROUP_ROOMS_BY_BUILDING = False
+BUILDING_SEPARATOR = "-"
+
+# Whether to assign the seats with keyed permutations in random mode, so the
+# seat of any student can be computed directly from the seed.
+ASSIGNMENT_PERMUTATION = False
+
+# Number of rounds of the Feistel network of the keyed permutations.
+FEISTEL_ROUNDS = 6
+
+# Number of rows of each chunk when reading the students CSV database file.
+STUDENTS_CHUNK_SIZE = 100000
+
+# Number of shards in sharded mode. Set to None to disable sharded mode.
+SHARDS = None
+
+# Number of top allocation sites kept for each phase in memory profiling mode.
+MEMORY_PROFILE_TOP_AMOUNT = 10
+
+# Interval in seconds between checks for changed database files in watch mode.
+WATCH_INTERVAL = 1.0
+
+# Separator of the candidate time slots of each exam in the exams CSV file.
+EXAM_SLOTS_SEPARATOR = ";"
+
+# Output schedule CSV header.
+OUTPUT_SCHEDULE_CSV_HEADER = [
+    "exam_id",
+    "exam_name",
+    "slot",
+    "room_id",
+    "room_name",
+    "students",
+]
@@ -5,32 +5,93 @@
 # Date          : 2025-10-13
 # ----------------------------------------------------------------------
 
+import contextlib
+import json
 import os
+import threading
+from typing import ClassVar
 
 import pandas as pd
 
 import config
 import logs
 
+# The "pyarrow" package is optional, it is only required for "arrow" and "parquet" formats.
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
 
 class Generator:
     """
     Generator class for generating seating arrangements as CSV files.
 
     Attributes:
-        None
+        OUTPUT_BYTES (int): The total size in bytes of the output CSV files written.
+        ROOM_SEATS (dict): A dictionary mapping room IDs to their
+        [capacity, assigned seats, unassigned seats] from the room reports.
+        COUNTERS_LOCK (threading.Lock): The lock of the counters, since the output
+        CSV files are written from worker threads in pipeline mode.
     """
 
+    OUTPUT_BYTES: ClassVar[int] = 0
+    ROOM_SEATS: ClassVar[dict] = {}
+    COUNTERS_LOCK = threading.Lock()
+
+    @staticmethod
+    def count_output_bytes(output_path):
+        """
+        Add the size of a written output file to the output bytes counter.
+
+        Args:
+            output_path (str): The path of the written output file.
+        """
+
+        size = os.path.getsize(output_path)
+        with Generator.COUNTERS_LOCK:
+            Generator.OUTPUT_BYTES += size
+
     @staticmethod
-    def generate_output_students_csv():
+    def generate_output_students_csv(students_db=None, output_path=None):
         """
         Generate the output CSV file for students with their assigned rooms and seats.
+
+        Args:
+            students_db (dict or None, optional): The students to write.
+            Defaults to None, which uses the global STUDENTS_DB.
+            output_path (str or None, optional): The path of the output CSV file.
+            Defaults to None, which uses config.GENERATED_STUDENT_PATH.
         """
 
         # Write logs.
         messages = ["generate_output_students_csv() CALLED"]
         logs.Logs.write_logs(messages)
 
+        # Get the output data of all students, then write it to the CSV file.
+        report_data_frame = Generator.get_students_data_frame(students_db)
+        Generator.write_students_data_frame(report_data_frame, output_path)
+
+        # Write report.
+        logs.Logs.write_report("Output students CSV generated successfully.")
+        logs.Logs.write_report(f"Total Students: {len(report_data_frame)}")
+
+    @staticmethod
+    def get_students_data_frame(students_db=None):
+        """
+        Get the output data of all students with their assigned rooms and seats,
+        sorted by student ID.
+
+        Args:
+            students_db (dict or None, optional): The students to get.
+            Defaults to None, which uses the global STUDENTS_DB.
+
+        Returns:
+            pandas.DataFrame: The output data with the output students CSV headers.
+        """
+
         # Initialize an empty dictionary to hold the data for the output CSV.
         REPORT_DATA = {}
 
@@ -44,7 +105,9 @@ class Generator:
         logs.Logs.write_logs(messages)
 
         # Populate the REPORT_DATA dictionary with student information.
-        for student_id, student_obj in sorted(config.STUDENTS_DB.items()):
+        if students_db is None:
+            students_db = config.STUDENTS_DB
+        for student_id, student_obj in sorted(students_db.items()):
             # Get the current student's information.
             current_student_info = student_obj.get_student_info()
 
@@ -66,55 +129,145 @@ class Generator:
                 logs.Logs.write_logs(messages)
 
         # Create a DataFrame from the REPORT_DATA dictionary.
-        report_data_frame = pd.DataFrame(REPORT_DATA)
+        return pd.DataFrame(REPORT_DATA)
+
+    @staticmethod
+    def write_students_data_frame(report_data_frame, output_path=None):
+        """
+        Write the output data of all students to the output students CSV file.
+
+        Args:
+            report_data_frame (pandas.DataFrame): The output data from get_students_data_frame().
+            output_path (str or None, optional): The path of the output CSV file.
+            Defaults to None, which uses config.GENERATED_STUDENT_PATH.
+        """
 
         # Write the DataFrame to a CSV file.
-        report_data_frame.to_csv(
-            config.GENERATED_STUDENT_PATH, index=False, encoding="utf-8-sig"
-        )
+        if output_path is None:
+            output_path = config.GENERATED_STUDENT_PATH
+        report_data_frame.to_csv(output_path, index=False, encoding="utf-8-sig")
+        Generator.count_output_bytes(output_path)
 
         # Write logs.
         messages = [
             "OUTPUT STUDENTS CSV GENERATED",
-            f"PATH = {config.GENERATED_STUDENT_PATH}",
+            f"PATH = {output_path}",
             f"TOTAL STUDENTS = {len(report_data_frame)}",
         ]
         logs.Logs.write_logs(messages)
 
-        # Write report.
-        logs.Logs.write_report("Output students CSV generated successfully.")
-        logs.Logs.write_report(f"Total Students: {len(report_data_frame)}")
-
     @staticmethod
-    def generate_output_all_rooms_csv():
+    def generate_output_all_rooms_csv(
+        rooms_db=None, output_dir=None, written_room_ids=None, on_room_written=None
+    ):
         """
         Generate the output CSV files for all rooms.
+
+        Args:
+            rooms_db (dict or None, optional): The rooms to write.
+            Defaults to None, which uses the global ROOMS_DB.
+            output_dir (str or None, optional): The folder of the output CSV files.
+            Defaults to None, which uses config.GENERATED_ROOMS_PATH.
+            written_room_ids (set or None, optional): The IDs of the rooms whose output
+            CSV files are already written, so only their reports are written.
+            Defaults to None, which writes all rooms.
+            on_room_written (callable or None, optional): A function called with the
+            room ID after the output CSV file of each room is written. Defaults to None.
         """
         # Write logs.
         messages = ["generate_output_all_rooms_csv() CALLED"]
         logs.Logs.write_logs(messages)
 
         # Write report.
-        logs.Logs.write_report("-" * 88)
-        logs.Logs.write_report("Generating output CSV files for all rooms.")
+        Generator.write_all_rooms_report_header()
 
         # Generate the output CSV file for each room.
-        for _, room_obj in sorted(config.ROOMS_DB.items()):
-            Generator.generate_output_room_csv(room_obj)
+        if rooms_db is None:
+            rooms_db = config.ROOMS_DB
+        for room_id, room_obj in sorted(rooms_db.items()):
+            # Only write the report of a room whose output CSV file is already written.
+            if written_room_ids and str(room_id) in written_room_ids:
+                Generator.write_room_report(
+                    room_obj,
+                    len(room_obj.occupied_seats_id or []),
+                    room_obj.get_unassigned_seat_names(),
+                )
+                continue
+
+            Generator.generate_output_room_csv(room_obj, output_dir)
+            if on_room_written is not None:
+                on_room_written(room_id)
+
+    @staticmethod
+    def write_all_rooms_report_header():
+        """
+        Write the report header before the reports of all rooms.
+        """
+
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Generating output CSV files for all rooms.")
 
     @staticmethod
-    def generate_output_room_csv(room):
+    def generate_output_room_csv(room, output_dir=None):
         """
-        Generate the output CSV file for a specific room.
+        Generate the output CSV file for a specific room, and write its report.
 
         Args:
             room (Room): The room object containing seat information.
+            output_dir (str or None, optional): The folder of the output CSV file.
+            Defaults to None, which uses config.GENERATED_ROOMS_PATH.
         """
 
         # Write logs.
         messages = ["generate_output_room_csv() CALLED"]
         logs.Logs.write_logs(messages)
 
+        # Write the output CSV file, then write the report of the room.
+        assigned_amount, unassigned_seats = Generator.write_room_csv(room, output_dir)
+        Generator.write_room_report(room, assigned_amount, unassigned_seats)
+
+    @staticmethod
+    def write_room_csv(room, output_dir=None):
+        """
+        Write the output CSV file for a specific room, without writing its report.
+        It does not change any shared state, so it can be called from any thread.
+
+        Args:
+            room (Room): The room object containing seat information.
+            output_dir (str or None, optional): The folder of the output CSV file.
+            Defaults to None, which uses config.GENERATED_ROOMS_PATH.
+
+        Returns:
+            tuple: A tuple containing the number of assigned seats,
+            and a list of unassigned seat names.
+        """
+
+        # Write logs.
+        messages = ["write_room_csv() CALLED", f"ROOM ID = {room.room_id}"]
+        logs.Logs.write_logs(messages)
+
+        # Get the output data of the room, then write it to the CSV file.
+        report_data_frame, unassigned_seats = Generator.get_room_data_frame(room)
+        Generator.write_room_data_frame(
+            room, report_data_frame, unassigned_seats, output_dir
+        )
+
+        return len(report_data_frame), unassigned_seats
+
+    @staticmethod
+    def get_room_data_frame(room):
+        """
+        Get the output data of a specific room, with the students of the occupied seats
+        sorted by seat ID.
+
+        Args:
+            room (Room): The room object containing seat information.
+
+        Returns:
+            tuple: A tuple containing the output data as a pandas.DataFrame
+            with the output room CSV headers, and a list of unassigned seat names.
+        """
+
         # Initialize an empty dictionary to hold the data for the output CSV.
         REPORT_DATA = {}
 
@@ -129,26 +282,12 @@ class Generator:
         ]
         logs.Logs.write_logs(messages)
 
-        # Populate the REPORT_DATA dictionary with seat information.
-        unassigned_seats = []
-        for _, seat_obj in sorted(room.seats_db.items()):
+        # Populate the REPORT_DATA dictionary with the information of the occupied seats.
+        for seat_id in sorted(room.occupied_seats_id or []):
             # Get the current seat's information.
+            seat_obj = room.get_seat(seat_id)
             current_seat_info = seat_obj.get_seat_info()
 
-            # Skip unassigned seats
-            if current_seat_info[:2] == (None, None):
-                unassigned_seats.append(seat_obj.seat_name)
-
-                # Write logs.
-                messages = [
-                    "SEAT UNASSIGNED, SKIPPED",
-                    f"ROOM ID = {room.room_id}",
-                    f"SEAT ID = {seat_obj.seat_id}",
-                    f"SEAT NAME = {seat_obj.seat_name}",
-                ]
-                logs.Logs.write_logs(messages)
-                continue
-
             # Append each piece of information to the corresponding list in REPORT_DATA.
             for idx, data in enumerate(current_seat_info):
                 # Get the corresponding header for the current index.
@@ -168,6 +307,17 @@ class Generator:
                 ]
                 logs.Logs.write_logs(messages)
 
+        # Get the unassigned seats directly from the room's seat arrays.
+        unassigned_seats = room.get_unassigned_seat_names()
+
+        # Write logs.
+        messages = [
+            "UNASSIGNED SEATS SKIPPED",
+            f"ROOM ID = {room.room_id}",
+            f"TOTAL UNASSIGNED SEATS = {len(unassigned_seats)}",
+        ]
+        logs.Logs.write_logs(messages)
+
         # Initialize empty lists for the remaining columns in the output CSV.
         rows_amount = len(REPORT_DATA[config.OUTPUT_ROOM_CSV_HEADER[0]])
         for header in config.OUTPUT_ROOM_CSV_HEADER[config.HAS_DATA_COLS_AMOUNT :]:
@@ -181,13 +331,29 @@ class Generator:
         logs.Logs.write_logs(messages)
 
         # Create a DataFrame from the REPORT_DATA dictionary.
-        report_data_frame = pd.DataFrame(REPORT_DATA)
+        return pd.DataFrame(REPORT_DATA), unassigned_seats
+
+    @staticmethod
+    def write_room_data_frame(
+        room, report_data_frame, unassigned_seats, output_dir=None
+    ):
+        """
+        Write the output data of a specific room to its output CSV file.
+
+        Args:
+            room (Room): The room object containing seat information.
+            report_data_frame (pandas.DataFrame): The output data from get_room_data_frame().
+            unassigned_seats (list): The names of the unassigned seats.
+            output_dir (str or None, optional): The folder of the output CSV file.
+            Defaults to None, which uses config.GENERATED_ROOMS_PATH.
+        """
 
         # Write the DataFrame to a CSV file.
-        GENERATED_ROOM_PATH = os.path.join(
-            config.GENERATED_ROOMS_PATH, f"{room.room_id}.csv"
-        )
+        if output_dir is None:
+            output_dir = config.GENERATED_ROOMS_PATH
+        GENERATED_ROOM_PATH = os.path.join(output_dir, f"{room.room_id}.csv")
         report_data_frame.to_csv(GENERATED_ROOM_PATH, index=False, encoding="utf-8-sig")
+        Generator.count_output_bytes(GENERATED_ROOM_PATH)
 
         # Write logs.
         messages = [
@@ -199,12 +365,310 @@ class Generator:
         ]
         logs.Logs.write_logs(messages)
 
+    @staticmethod
+    def get_output_formats(output_formats):
+        """
+        Get the additional output formats which can be written, without the formats
+        which require the "pyarrow" package if it is not installed.
+
+        Args:
+            output_formats (list[str] or None): The requested output formats.
+
+        Returns:
+            list[str]: The output formats to write, without duplicates.
+        """
+
+        OUTPUT_FORMATS = []
+        for output_format in output_formats or []:
+            if output_format in OUTPUT_FORMATS:
+                continue
+            if output_format != config.OUTPUT_FORMAT_JSONL and pyarrow is None:
+                print(
+                    f"The 'pyarrow' package is not installed, "
+                    f"skipping the '{output_format}' output format."
+                )
+                continue
+            OUTPUT_FORMATS.append(output_format)
+        return OUTPUT_FORMATS
+
+    @staticmethod
+    def get_room_records(room):
+        """
+        Get the records of the occupied seats of a specific room for the additional
+        output formats, sorted by seat ID.
+
+        Args:
+            room (Room): The room object containing seat information.
+
+        Returns:
+            dict: A dictionary mapping the fields in config.OUTPUT_RECORD_FIELDS to
+            their lists of string values.
+        """
+
+        RECORDS = {field: [] for field in config.OUTPUT_RECORD_FIELDS}
+        for seat_id in sorted(room.occupied_seats_id or []):
+            seat_obj = room.get_seat(seat_id)
+            RECORDS["room_id"].append(str(room.room_id))
+            RECORDS["room_name"].append(str(room.room_name))
+            RECORDS["seat_id"].append(str(seat_obj.seat_id))
+            RECORDS["seat_name"].append(str(seat_obj.seat_name))
+            RECORDS["student_id"].append(str(seat_obj.student.student_id))
+            RECORDS["student_name"].append(str(seat_obj.student.student_name))
+        return RECORDS
+
+    @staticmethod
+    def generate_output_all_rooms_formats(rooms_db=None, output_dir=None):
+        """
+        Generate the output files of each room and the combined output file of all
+        rooms in the additional output formats. The records are written room by room,
+        so the records of all rooms are never kept in memory together.
+
+        Args:
+            rooms_db (dict or None, optional): The rooms to write.
+            Defaults to None, which uses the global ROOMS_DB.
+            output_dir (str or None, optional): The folder of the output files of each room.
+            Defaults to None, which uses config.GENERATED_ROOMS_PATH.
+        """
+
+        # Write logs.
+        messages = [
+            "generate_output_all_rooms_formats() CALLED",
+            f"OUTPUT FORMATS = {config.OUTPUT_FORMATS}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        if rooms_db is None:
+            rooms_db = config.ROOMS_DB
+        if output_dir is None:
+            output_dir = config.GENERATED_ROOMS_PATH
+
+        # Open the combined output file of all rooms in each format. All opened files
+        # are closed even if writing any of them fails.
+        with contextlib.ExitStack() as exit_stack:
+            all_rooms_writers = [
+                exit_stack.enter_context(
+                    OutputFormatWriter(
+                        output_format,
+                        config.GENERATED_ALL_ROOMS_PATH
+                        + config.OUTPUT_FORMAT_EXTENSIONS[output_format],
+                    )
+                )
+                for output_format in config.OUTPUT_FORMATS
+            ]
+            for room_id, room_obj in sorted(rooms_db.items()):
+                records = Generator.get_room_records(room_obj)
+                for all_rooms_writer in all_rooms_writers:
+                    # Write the output file of the room.
+                    with OutputFormatWriter(
+                        all_rooms_writer.output_format,
+                        os.path.join(
+                            output_dir,
+                            f"{room_id}"
+                            + config.OUTPUT_FORMAT_EXTENSIONS[
+                                all_rooms_writer.output_format
+                            ],
+                        ),
+                    ) as room_writer:
+                        room_writer.write(records)
+
+                    # Append the records of the room to the combined output file.
+                    all_rooms_writer.write(records)
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report(
+            f"Output files generated in formats: {', '.join(config.OUTPUT_FORMATS)}"
+        )
+        for all_rooms_writer in all_rooms_writers:
+            logs.Logs.write_report(
+                f"  {all_rooms_writer.output_path}: "
+                f"{all_rooms_writer.record_count} records"
+            )
+        logs.Logs.write_report("-" * 88)
+
+    @staticmethod
+    def write_room_report(room, assigned_amount, unassigned_seats):
+        """
+        Write the report of a specific room after its output CSV file is written.
+
+        Args:
+            room (Room): The room object containing seat information.
+            assigned_amount (int): The number of assigned seats.
+            unassigned_seats (list): The names of the unassigned seats.
+        """
+
         # Write report.
         logs.Logs.write_report(
             f"Output room CSV generated for Room Name: {room.room_name}"
         )
         logs.Logs.write_report(f"Room Capacity: {room.capacity}")
-        logs.Logs.write_report(f"Total Assigned Seats: {len(report_data_frame)}")
+        logs.Logs.write_report(f"Total Assigned Seats: {assigned_amount}")
         logs.Logs.write_report(f"Total Unassigned Seats: {len(unassigned_seats)}")
         logs.Logs.write_report(f"Unassigned Seat Names: {sorted(unassigned_seats)}")
         logs.Logs.write_report("-" * 88)
+
+        # Count the seats of the room for the metrics.
+        room_seats = Generator.ROOM_SEATS.setdefault(
+            room.room_id, [room.capacity, 0, 0]
+        )
+        room_seats[1] += assigned_amount
+        room_seats[2] += len(unassigned_seats)
+
+
+class OutputFormatWriter:
+    """
+    OutputFormatWriter class for writing the room records to a file in an additional
+    output format, one batch of records at a time.
+
+    Every format has the same explicit schema with the string fields in
+    config.OUTPUT_RECORD_FIELDS. A JSON Lines file has one JSON object for each record,
+    and is opened for appending each written batch only. An Arrow IPC file has one
+    record batch for each written batch, so it can be read with a memory map without
+    copying, and a Parquet file has one row group for each written batch. It is a
+    context manager, which closes the output file on exit.
+
+    Attributes:
+        output_format (str): The output format, one of config.OUTPUT_FORMAT_EXTENSIONS.
+        output_path (str): The path of the output file.
+        record_count (int): The number of records written.
+        is_closed (bool): Whether the output file is closed.
+        writer (object or None): The opened Arrow IPC or Parquet writer.
+        exit_stack (contextlib.ExitStack): The exit stack which closes the opened writer.
+    """
+
+    def __init__(self, output_format, output_path):
+        """
+        Initialize an OutputFormatWriter object, and open the output file.
+
+        Args:
+            output_format (str): The output format, one of config.OUTPUT_FORMAT_EXTENSIONS.
+            output_path (str): The path of the output file.
+        """
+
+        # Initialize attributes.
+        self.output_format = output_format
+        self.output_path = output_path
+        self.record_count = 0
+        self.is_closed = False
+        self.writer = None
+        self.exit_stack = contextlib.ExitStack()
+
+        # Create the empty output file, or open it with the schema of the records.
+        if output_format == config.OUTPUT_FORMAT_JSONL:
+            with open(output_path, "w", encoding="utf-8"):
+                pass
+        elif output_format == config.OUTPUT_FORMAT_ARROW:
+            self.writer = self.exit_stack.enter_context(
+                pyarrow.ipc.new_file(output_path, OutputFormatWriter.get_schema())
+            )
+        elif output_format == config.OUTPUT_FORMAT_PARQUET:
+            self.writer = self.exit_stack.enter_context(
+                pyarrow.parquet.ParquetWriter(
+                    output_path, OutputFormatWriter.get_schema()
+                )
+            )
+
+    def __enter__(self):
+        """
+        Enter the context of the OutputFormatWriter object.
+
+        Returns:
+            OutputFormatWriter: The OutputFormatWriter object itself.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Close the output file on exit. If an exception is raised, the output file is
+        only closed, without counting it as a generated file.
+
+        Args:
+            exc_type (type or None): The type of the raised exception, if any.
+            exc_value (BaseException or None): The raised exception, if any.
+            traceback (traceback or None): The traceback of the raised exception, if any.
+        """
+
+        if exc_type is None:
+            self.close()
+        else:
+            self.exit_stack.close()
+            self.is_closed = True
+
+    @staticmethod
+    def get_schema():
+        """
+        Get the Arrow schema of the records.
+
+        Returns:
+            pyarrow.Schema: The schema with a string field for each record field.
+        """
+
+        return pyarrow.schema(
+            [
+                pyarrow.field(field, pyarrow.string(), nullable=False)
+                for field in config.OUTPUT_RECORD_FIELDS
+            ]
+        )
+
+    def write(self, records):
+        """
+        Write a batch of records to the output file.
+
+        Args:
+            records (dict): A dictionary mapping the fields in config.OUTPUT_RECORD_FIELDS
+            to their lists of string values, from Generator.get_room_records().
+        """
+
+        amount = len(records[config.OUTPUT_RECORD_FIELDS[0]])
+        if amount == 0:
+            return
+
+        if self.output_format == config.OUTPUT_FORMAT_JSONL:
+            with open(
+                self.output_path, "a", encoding="utf-8", newline="\n"
+            ) as output_file:
+                output_file.writelines(
+                    json.dumps(
+                        dict(zip(config.OUTPUT_RECORD_FIELDS, values)),
+                        ensure_ascii=False,
+                    )
+                    + "\n"
+                    for values in zip(
+                        *(records[field] for field in config.OUTPUT_RECORD_FIELDS)
+                    )
+                )
+        else:
+            batch = pyarrow.record_batch(
+                [
+                    pyarrow.array(records[field], pyarrow.string())
+                    for field in config.OUTPUT_RECORD_FIELDS
+                ],
+                schema=OutputFormatWriter.get_schema(),
+            )
+            if self.output_format == config.OUTPUT_FORMAT_ARROW:
+                self.writer.write_batch(batch)
+            else:
+                self.writer.write_table(pyarrow.Table.from_batches([batch]))
+        self.record_count += amount
+
+    def close(self):
+        """
+        Close the output file, and count its size in the output bytes counter.
+        """
+
+        if self.is_closed:
+            return
+        self.exit_stack.close()
+        self.is_closed = True
+        self.writer = None
+        Generator.count_output_bytes(self.output_path)
+
+        # Write logs.
+        messages = [
+            "OUTPUT FORMAT FILE GENERATED",
+            f"PATH = {self.output_path}",
+            f"FORMAT = {self.output_format}",
+            f"TOTAL RECORDS = {self.record_count}",
+        ]
+        logs.Logs.write_logs(messages)
@@ -0,0 +1,316 @@
+# ----------------------------------------------------------------------
+# File Name     : interleaver.py
+# Author        : Worralop Srichainont
+# Description   : Interleaver class for seating several exams together in
+#                 the same rooms, alternating the exams seat by seat.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import heapq
+import os
+import random
+
+import pandas as pd
+
+import config
+import generator
+import logs
+import randomizer
+import scheduler
+import student
+import validator
+
+
+class Interleaver:
+    """
+    Interleaver class for seating several exams (cohorts) together in the same rooms,
+    alternating the exams seat by seat.
+
+    The students of all cohorts are partitioned to the rooms by the ratio of their
+    available seats. The load of each room is split between the cohorts by the ratio
+    of their remaining students, and the selected seats of the room are labelled with
+    an evenly spaced pattern of the cohorts. Then each cohort is seated randomly in its
+    own slice of seats. Each room takes O(seats + cohorts) time, plus O(log cohorts)
+    for each seat of its pattern.
+
+    Attributes:
+        randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+        random (random.Random): The random number generator of the interleaving.
+        exam_ids (list[str]): The IDs of the interleaved exams.
+        exams (list[dict]): The interleaved exams, each with its ID, name and students.
+        students_dbs (dict): A dictionary mapping exam IDs to their Student objects.
+        seat_exams (dict): A dictionary mapping room IDs to their
+        dictionaries mapping seat IDs to exam IDs.
+    """
+
+    def __init__(self, randomizer, exam_ids):
+        """
+        Initialize an Interleaver object.
+
+        Args:
+            randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+            exam_ids (list[str]): The IDs of the interleaved exams.
+        """
+
+        # Initialize attributes.
+        self.randomizer = randomizer
+        self.random = random.Random(f"{randomizer.seed}:interleave")
+        self.exam_ids = list(exam_ids)
+        self.exams = []
+        self.students_dbs = {}
+        self.seat_exams = {}
+
+        # Write logs.
+        messages = ["INTERLEAVER OBJECT CREATED", f"EXAM IDS = {self.exam_ids}"]
+        logs.Logs.write_logs(messages)
+
+    def run(self):
+        """
+        Read the interleaved exams, seat them in all rooms and generate the outputs.
+        """
+
+        self.exams = self.get_exams()
+        self.assign_seats()
+        self.generate_outputs()
+
+    def get_exams(self):
+        """
+        Read the interleaved exams from the exams database, and check whether
+        they can be seated together.
+
+        Returns:
+            list[dict]: The interleaved exams, in the given order.
+
+        Raises:
+            ValidationError: If an exam is unknown, a student takes more than one of
+            the exams, or the students do not fit in the available seats.
+        """
+
+        exams = {exam["exam_id"]: exam for exam in scheduler.Scheduler.get_exams()}
+        errors = []
+
+        # Check for unknown exams.
+        unknown_ids = [exam_id for exam_id in self.exam_ids if exam_id not in exams]
+        if unknown_ids:
+            errors.append(f"exams.csv: unknown exam_id {unknown_ids}.")
+        EXAMS = [exams[exam_id] for exam_id in self.exam_ids if exam_id in exams]
+
+        # Check for students taking more than one of the exams at the same time.
+        seen_ids = set()
+        conflict_ids = set()
+        for exam in EXAMS:
+            conflict_ids.update(seen_ids.intersection(exam["students"]))
+            seen_ids.update(exam["students"])
+        if conflict_ids:
+            errors.append(
+                f"exams/students: students in more than one interleaved exam "
+                f"{sorted(conflict_ids)}."
+            )
+
+        # Check whether all students fit in the available seats.
+        if len(seen_ids) > config.TOTAL_AVAILABLE_SEATS:
+            errors.append(
+                f"Total available seats ({config.TOTAL_AVAILABLE_SEATS}) are less than "
+                f"total interleaved students ({len(seen_ids)})."
+            )
+
+        if errors:
+            raise validator.ValidationError(errors)
+
+        return EXAMS
+
+    @staticmethod
+    def split_load(load, remaining_amounts):
+        """
+        Split the load of a room between the cohorts by the ratio of their remaining
+        students, rounding down first, then giving the rest to the largest remainders.
+
+        Args:
+            load (int): The number of students seated in the room.
+            remaining_amounts (list[int]): The remaining students of each cohort.
+
+        Returns:
+            list[int]: The number of students of each cohort seated in the room.
+        """
+
+        total_remaining = sum(remaining_amounts)
+        if total_remaining == 0:
+            return [0] * len(remaining_amounts)
+
+        shares = [amount * load / total_remaining for amount in remaining_amounts]
+        AMOUNTS = [int(share) for share in shares]
+        order = sorted(
+            range(len(shares)), key=lambda idx: (AMOUNTS[idx] - shares[idx], idx)
+        )
+        for idx in order[: load - sum(AMOUNTS)]:
+            AMOUNTS[idx] += 1
+        return AMOUNTS
+
+    @staticmethod
+    def get_pattern(amounts):
+        """
+        Get an evenly spaced pattern of the cohorts, where each cohort appears as many
+        times as its amount, so the cohorts alternate seat by seat.
+
+        Args:
+            amounts (list[int]): The number of seats of each cohort.
+
+        Returns:
+            list[int]: The cohort index of each seat.
+        """
+
+        # The k-th seat of a cohort with n seats is placed at (k + 0.5) / n,
+        # then the ideal positions of all cohorts are merged in order.
+        positions = [
+            [((k + 0.5) / amount, idx) for k in range(amount)]
+            for idx, amount in enumerate(amounts)
+        ]
+        return [idx for _, idx in heapq.merge(*positions)]
+
+    def assign_seats(self):
+        """
+        Partition the students of all cohorts to the rooms, split each room between
+        the cohorts with an alternating pattern, and seat each cohort in its slice.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["assign_seats() CALLED"])
+
+        # Create the Student objects, and order the students of each cohort.
+        queues = []
+        for exam in self.exams:
+            students_db = {
+                student_id: student.Student(student_id, student_name)
+                for student_id, student_name in exam["students"].items()
+            }
+            self.students_dbs[exam["exam_id"]] = students_db
+            student_ids = sorted(students_db)
+            if self.randomizer.is_random_mode:
+                self.random.shuffle(student_ids)
+            queues.append(student_ids)
+
+        # Partition the students of all cohorts to the rooms.
+        available_seats = {
+            room_id: len(room_obj.available_seats_id)
+            for room_id, room_obj in config.ROOMS_DB.items()
+        }
+        loads = randomizer.Randomizer.partition_seat_amount(
+            available_seats, sum(len(queue) for queue in queues)
+        )
+
+        positions = [0] * len(queues)
+        for room_id, room_obj in config.ROOMS_DB.items():
+            # Split the load of the room between the cohorts.
+            remaining_amounts = [
+                len(queue) - position for queue, position in zip(queues, positions)
+            ]
+            amounts = Interleaver.split_load(loads[room_id], remaining_amounts)
+
+            # Select the seats of the room, and label them with the pattern.
+            if self.randomizer.is_random_mode:
+                occupied_seats_id = sorted(
+                    self.random.sample(room_obj.available_seats_id, loads[room_id])
+                )
+            else:
+                occupied_seats_id = room_obj.available_seats_id[: loads[room_id]]
+            pattern = Interleaver.get_pattern(amounts)
+
+            # Seat the next students of each cohort in its slice of seats.
+            ROOM_STUDENTS = {}
+            SEAT_EXAMS = {}
+            for seat_id, idx in zip(occupied_seats_id, pattern):
+                exam_id = self.exams[idx]["exam_id"]
+                current_student = self.students_dbs[exam_id][
+                    queues[idx][positions[idx]]
+                ]
+                positions[idx] += 1
+
+                current_seat = room_obj.get_seat(seat_id)
+                current_seat.student = current_student
+                current_student.seat = current_seat
+                current_student.room = room_obj
+                ROOM_STUDENTS[current_student.student_id] = current_student
+                SEAT_EXAMS[seat_id] = exam_id
+
+            room_obj.students = ROOM_STUDENTS
+            room_obj.set_occupied_seats(occupied_seats_id)
+            self.seat_exams[room_id] = SEAT_EXAMS
+
+            # Write logs.
+            messages = [
+                "INTERLEAVED SEATS ASSIGNED IN ROOM",
+                f"ROOM ID = {room_id}",
+                f"OCCUPIED SEATS = {len(occupied_seats_id)}",
+                f"EXAM AMOUNTS = {dict(zip(self.exam_ids, amounts))}",
+            ]
+            logs.Logs.write_logs(messages)
+
+    def get_room_data_frame(self, room_obj):
+        """
+        Get the output data of a room with the exam of each occupied seat,
+        sorted by seat ID.
+
+        Args:
+            room_obj (Room): The Room object with its interleaved students.
+
+        Returns:
+            pandas.DataFrame: The output data with the interleaved room CSV headers.
+        """
+
+        rows = []
+        for seat_id, exam_id in sorted(self.seat_exams[room_obj.room_id].items()):
+            seat_obj = room_obj.get_seat(seat_id)
+            rows.append(
+                [
+                    seat_obj.seat_name,
+                    exam_id,
+                    seat_obj.student.student_id,
+                    seat_obj.student.student_name,
+                    None,
+                    None,
+                ]
+            )
+        return pd.DataFrame(rows, columns=config.OUTPUT_INTERLEAVED_ROOM_CSV_HEADER)
+
+    def generate_outputs(self):
+        """
+        Generate the output CSV file of each room with the exam of each seat,
+        and the output students CSV file of each exam.
+        """
+
+        # Write the output room CSV files.
+        rooms_path = os.path.join(config.GENERATED_INTERLEAVED_PATH, "rooms")
+        os.makedirs(rooms_path, exist_ok=True)
+        for room_id, room_obj in sorted(config.ROOMS_DB.items()):
+            GENERATED_ROOM_PATH = os.path.join(rooms_path, f"{room_id}.csv")
+            self.get_room_data_frame(room_obj).to_csv(
+                GENERATED_ROOM_PATH, index=False, encoding="utf-8-sig"
+            )
+
+            # Write logs.
+            messages = [
+                "OUTPUT INTERLEAVED ROOM CSV GENERATED",
+                f"PATH = {GENERATED_ROOM_PATH}",
+            ]
+            logs.Logs.write_logs(messages)
+
+        # Write the output students CSV file of each exam.
+        for exam_id, students_db in self.students_dbs.items():
+            exam_path = os.path.join(config.GENERATED_INTERLEAVED_PATH, exam_id)
+            os.makedirs(exam_path, exist_ok=True)
+            generator.Generator.write_students_data_frame(
+                generator.Generator.get_students_data_frame(students_db),
+                os.path.join(exam_path, "output_students.csv"),
+            )
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Interleaved exams seated successfully.")
+        for exam_id, students_db in self.students_dbs.items():
+            logs.Logs.write_report(f"  {exam_id}: {len(students_db)} students")
+        for room_id, seat_exams in sorted(self.seat_exams.items()):
+            exam_amounts = {exam_id: 0 for exam_id in self.exam_ids}
+            for exam_id in seat_exams.values():
+                exam_amounts[exam_id] += 1
+            logs.Logs.write_report(f"Room {room_id}: {exam_amounts}")
+        logs.Logs.write_report("-" * 88)
@@ -0,0 +1,470 @@
+# ----------------------------------------------------------------------
+# File Name     : inventory.py
+# Author        : Worralop Srichainont
+# Description   : SharedInventory class for sharing the room and seat
+#                 inventory with worker processes in one read-only
+#                 shared memory region.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import bisect
+from multiprocessing import resource_tracker, shared_memory
+from typing import ClassVar
+
+import numpy as np
+
+import logs
+
+# The magic number and version at the start of the shared memory region.
+INVENTORY_MAGIC = 0x534541545321
+INVENTORY_VERSION = 1
+
+# The flags of each room, telling which values were integers in the CSV files.
+SEAT_IDS_INT = 1
+SEAT_NAMES_INT = 2
+ROOM_ID_INT = 4
+ROOM_NAME_INT = 8
+
+# The layout of each record of the room table.
+ROOM_DTYPE = np.dtype(
+    [
+        ("id_offset", "<u8"),
+        ("id_length", "<u4"),
+        ("name_offset", "<u8"),
+        ("name_length", "<u4"),
+        ("capacity", "<i8"),
+        ("seat_start", "<u8"),
+        ("seat_count", "<u8"),
+        ("flags", "<u1"),
+    ]
+)
+
+# The layout of the header: magic, version, rooms, seats and string table bytes.
+HEADER_DTYPE = np.dtype("<u8")
+HEADER_LENGTH = 5
+
+
+class SharedInventory:
+    """
+    SharedInventory class for sharing the room and seat inventory with worker processes
+    in one read-only multiprocessing.shared_memory region.
+
+    The region is created once by the main process, and contains a header, a room table
+    in the order of ROOMS_DB with an offset into the seat arrays for each room,
+    a permutation of the rooms sorted by room ID, the flat seat arrays of IDs, names and
+    availability, and a string table with all IDs and names in UTF-8.
+    Worker processes attach to the region by its name and read the arrays as zero-copy
+    NumPy views, so their startup cost and memory do not grow with the number of rooms.
+
+    Attributes:
+        ATTACHED (dict): A dictionary mapping region names to the inventories
+        attached in the current process.
+        shared_memory (SharedMemory): The shared memory region.
+        is_owner (bool): Whether this process created the region and must unlink it.
+        rooms (numpy.ndarray): The room table.
+        sorted_rooms (numpy.ndarray): The positions of the rooms sorted by room ID.
+        seat_id_offsets (numpy.ndarray): The offsets of the seat IDs in the string table.
+        seat_id_lengths (numpy.ndarray): The lengths of the seat IDs in bytes.
+        seat_name_offsets (numpy.ndarray): The offsets of the seat names in the string table.
+        seat_name_lengths (numpy.ndarray): The lengths of the seat names in bytes.
+        seat_availability (numpy.ndarray): Whether each seat is available (1) or not (0).
+        strings (numpy.ndarray): The string table.
+    """
+
+    ATTACHED: ClassVar[dict] = {}
+
+    def __init__(self, region, is_owner):
+        """
+        Initialize a SharedInventory object with zero-copy views of a shared memory region.
+        Use create() or attach() instead of calling it directly.
+
+        Args:
+            region (SharedMemory): The shared memory region.
+            is_owner (bool): Whether this process created the region.
+        """
+
+        # Initialize attributes.
+        self.shared_memory = region
+        self.is_owner = is_owner
+
+        # Read the header.
+        header = np.ndarray((HEADER_LENGTH,), HEADER_DTYPE, region.buf, 0)
+        magic, version, room_count, seat_count, string_bytes = (
+            int(value) for value in header
+        )
+        if magic != INVENTORY_MAGIC or version != INVENTORY_VERSION:
+            raise ValueError(f"{region.name} is not a shared room inventory.")
+
+        # Create the views of the room table and the seat arrays.
+        offset = header.nbytes
+        self.rooms = np.ndarray((room_count,), ROOM_DTYPE, region.buf, offset)
+        offset += self.rooms.nbytes
+        self.sorted_rooms = np.ndarray((room_count,), "<u8", region.buf, offset)
+        offset += self.sorted_rooms.nbytes
+        self.seat_id_offsets = np.ndarray((seat_count,), "<u8", region.buf, offset)
+        offset += self.seat_id_offsets.nbytes
+        self.seat_id_lengths = np.ndarray((seat_count,), "<u4", region.buf, offset)
+        offset += self.seat_id_lengths.nbytes
+        self.seat_name_offsets = np.ndarray((seat_count,), "<u8", region.buf, offset)
+        offset += self.seat_name_offsets.nbytes
+        self.seat_name_lengths = np.ndarray((seat_count,), "<u4", region.buf, offset)
+        offset += self.seat_name_lengths.nbytes
+        self.seat_availability = np.ndarray((seat_count,), "<u1", region.buf, offset)
+        offset += self.seat_availability.nbytes
+        self.strings = np.ndarray((string_bytes,), "<u1", region.buf, offset)
+
+    @staticmethod
+    def create(rooms_db):
+        """
+        Create the shared memory region from the Room objects.
+
+        Args:
+            rooms_db (dict): A dictionary mapping room IDs to their Room objects,
+            or to their (room name, capacity, seat arrays) tuples from get_seat_arrays().
+
+        Returns:
+            SharedInventory: The inventory which owns the region.
+        """
+
+        # Collect the strings and their references.
+        strings = bytearray()
+
+        def add_string(value):
+            encoded = str(value).encode()
+            strings.extend(encoded)
+            return len(strings) - len(encoded), len(encoded)
+
+        room_records = []
+        seat_id_refs = []
+        seat_name_refs = []
+        availability = bytearray()
+        for room_id, room_obj in rooms_db.items():
+            if isinstance(room_obj, tuple):
+                room_name, capacity, (seat_ids, seat_names, seat_availability) = (
+                    room_obj
+                )
+            else:
+                room_name, capacity = room_obj.room_name, room_obj.capacity
+                seat_ids = room_obj.seat_ids
+                seat_names = room_obj.seat_names
+                seat_availability = room_obj.seat_availability
+
+            # Keep which values were integers, so they are read back with the same type.
+            flags = 0
+            if all(isinstance(value, int) for value in seat_ids):
+                flags |= SEAT_IDS_INT
+            if all(isinstance(value, int) for value in seat_names):
+                flags |= SEAT_NAMES_INT
+            if isinstance(room_id, int):
+                flags |= ROOM_ID_INT
+            if isinstance(room_name, int):
+                flags |= ROOM_NAME_INT
+
+            room_records.append(
+                (
+                    *add_string(room_id),
+                    *add_string(room_name),
+                    int(capacity),
+                    len(seat_id_refs),
+                    len(seat_ids),
+                    flags,
+                )
+            )
+            seat_id_refs.extend(add_string(seat_id) for seat_id in seat_ids)
+            seat_name_refs.extend(add_string(seat_name) for seat_name in seat_names)
+            availability.extend(seat_availability)
+
+        # Sort the positions of the rooms by room ID for the binary search.
+        room_ids = list(rooms_db)
+        sorted_rooms = sorted(range(len(room_ids)), key=lambda idx: str(room_ids[idx]))
+
+        # Allocate the region, then copy the arrays into it.
+        room_count, seat_count = len(room_records), len(seat_id_refs)
+        size = (
+            HEADER_DTYPE.itemsize * HEADER_LENGTH
+            + ROOM_DTYPE.itemsize * room_count
+            + 8 * room_count
+            + (8 + 4 + 8 + 4 + 1) * seat_count
+            + len(strings)
+        )
+        region = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        header = np.ndarray((HEADER_LENGTH,), HEADER_DTYPE, region.buf, 0)
+        header[:] = [
+            INVENTORY_MAGIC,
+            INVENTORY_VERSION,
+            room_count,
+            seat_count,
+            len(strings),
+        ]
+        del header
+        inventory = SharedInventory(region, True)
+        inventory.rooms[:] = np.array(room_records, dtype=ROOM_DTYPE)
+        inventory.sorted_rooms[:] = sorted_rooms
+        if seat_count:
+            inventory.seat_id_offsets[:], inventory.seat_id_lengths[:] = zip(
+                *seat_id_refs
+            )
+            inventory.seat_name_offsets[:], inventory.seat_name_lengths[:] = zip(
+                *seat_name_refs
+            )
+        inventory.seat_availability[:] = np.frombuffer(availability, dtype="<u1")
+        inventory.strings[:] = np.frombuffer(strings, dtype="<u1")
+
+        # Write logs.
+        messages = [
+            "SHARED INVENTORY CREATED",
+            f"NAME = {region.name}",
+            f"TOTAL ROOMS = {room_count}",
+            f"TOTAL SEATS = {seat_count}",
+            f"SIZE = {size} BYTES",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return inventory
+
+    @staticmethod
+    def start_tracker():
+        """
+        Start the resource tracker of this process. It must be called before the worker
+        processes are started, so they share it instead of starting their own, which
+        would unlink the region when a worker process exits.
+        """
+
+        resource_tracker.ensure_running()
+
+    @staticmethod
+    def attach(name):
+        """
+        Attach to an existing shared memory region by its name, only once per process.
+
+        Args:
+            name (str): The name of the shared memory region.
+
+        Returns:
+            SharedInventory: The attached inventory.
+        """
+
+        if name not in SharedInventory.ATTACHED:
+            # Only the creating process needs to track the region. Before Python 3.13,
+            # the region is tracked by the shared resource tracker from start_tracker().
+            try:
+                region = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                region = shared_memory.SharedMemory(name=name)
+            SharedInventory.ATTACHED[name] = SharedInventory(region, False)
+
+            # Write logs.
+            messages = ["SHARED INVENTORY ATTACHED", f"NAME = {name}"]
+            logs.Logs.write_logs(messages)
+
+        return SharedInventory.ATTACHED[name]
+
+    @property
+    def name(self):
+        """
+        str: The name of the shared memory region.
+        """
+
+        return self.shared_memory.name
+
+    def get_string(self, offset, length, is_int=False):
+        """
+        Read a value from the string table.
+
+        Args:
+            offset (int): The offset of the value in the string table.
+            length (int): The length of the value in bytes.
+            is_int (bool, optional): Whether to read the value as an integer. Defaults to False.
+
+        Returns:
+            str or int: The value.
+        """
+
+        value = self.strings[offset : offset + length].tobytes().decode()
+        return int(value) if is_int else value
+
+    def get_room_count(self):
+        """
+        Get the number of rooms in the inventory.
+
+        Returns:
+            int: The number of rooms.
+        """
+
+        return len(self.rooms)
+
+    def get_room_id(self, idx):
+        """
+        Get the ID of the room at a position of the room table.
+
+        Args:
+            idx (int): The position of the room.
+
+        Returns:
+            str or int: The room ID.
+        """
+
+        record = self.rooms[idx]
+        return self.get_string(
+            int(record["id_offset"]),
+            int(record["id_length"]),
+            bool(record["flags"] & ROOM_ID_INT),
+        )
+
+    def get_room_index(self, room_id):
+        """
+        Find the position of a room in the room table by binary search over the room IDs.
+
+        Args:
+            room_id (str or int): The room ID.
+
+        Returns:
+            int: The position of the room.
+
+        Raises:
+            KeyError: If the room is not in the inventory.
+        """
+
+        sorted_ids = _SortedRoomIds(self)
+        position = bisect.bisect_left(sorted_ids, str(room_id))
+        if position < len(sorted_ids) and sorted_ids[position] == str(room_id):
+            return int(self.sorted_rooms[position])
+        raise KeyError(room_id)
+
+    def get_room_row(self, idx):
+        """
+        Get the ID, name and capacity of the room at a position of the room table.
+
+        Args:
+            idx (int): The position of the room.
+
+        Returns:
+            tuple: The room ID, room name and capacity.
+        """
+
+        record = self.rooms[idx]
+        return (
+            self.get_room_id(idx),
+            self.get_string(
+                int(record["name_offset"]),
+                int(record["name_length"]),
+                bool(record["flags"] & ROOM_NAME_INT),
+            ),
+            int(record["capacity"]),
+        )
+
+    def get_available_amount(self, idx):
+        """
+        Count the available seats of the room at a position of the room table.
+
+        Args:
+            idx (int): The position of the room.
+
+        Returns:
+            int: The number of available seats.
+        """
+
+        start = int(self.rooms[idx]["seat_start"])
+        end = start + int(self.rooms[idx]["seat_count"])
+        return int(self.seat_availability[start:end].sum())
+
+    def get_seat_arrays(self, room_id):
+        """
+        Get the seat arrays of a room, in the same format as Utility.get_seat_arrays(),
+        without reading its seats CSV file.
+
+        Args:
+            room_id (str or int): The room ID.
+
+        Returns:
+            tuple: A tuple containing the list of seat IDs, the list of seat names,
+            and the bytearray of seat availability, sorted by seat ID.
+        """
+
+        record = self.rooms[self.get_room_index(room_id)]
+        start = int(record["seat_start"])
+        end = start + int(record["seat_count"])
+        flags = int(record["flags"])
+
+        SEAT_IDS = [
+            self.get_string(int(offset), int(length), bool(flags & SEAT_IDS_INT))
+            for offset, length in zip(
+                self.seat_id_offsets[start:end], self.seat_id_lengths[start:end]
+            )
+        ]
+        SEAT_NAMES = [
+            self.get_string(int(offset), int(length), bool(flags & SEAT_NAMES_INT))
+            for offset, length in zip(
+                self.seat_name_offsets[start:end], self.seat_name_lengths[start:end]
+            )
+        ]
+        SEAT_AVAILABILITY = bytearray(self.seat_availability[start:end].tobytes())
+        return SEAT_IDS, SEAT_NAMES, SEAT_AVAILABILITY
+
+    def close(self):
+        """
+        Release the views and close the shared memory region,
+        and unlink it if this process created it.
+        """
+
+        # The views must be released before the region can be closed.
+        for attribute in [
+            "rooms",
+            "sorted_rooms",
+            "seat_id_offsets",
+            "seat_id_lengths",
+            "seat_name_offsets",
+            "seat_name_lengths",
+            "seat_availability",
+            "strings",
+        ]:
+            setattr(self, attribute, None)
+        self.shared_memory.close()
+        if self.is_owner:
+            self.shared_memory.unlink()
+        SharedInventory.ATTACHED.pop(self.shared_memory.name, None)
+
+        # Write logs.
+        messages = ["SHARED INVENTORY CLOSED", f"NAME = {self.shared_memory.name}"]
+        logs.Logs.write_logs(messages)
+
+
+class _SortedRoomIds:
+    """
+    Sequence of the room IDs of an inventory in sorted order, decoded on access,
+    so the binary search does not decode every room ID.
+
+    Attributes:
+        inventory (SharedInventory): The inventory of the rooms.
+    """
+
+    def __init__(self, inventory):
+        """
+        Initialize a _SortedRoomIds object.
+
+        Args:
+            inventory (SharedInventory): The inventory of the rooms.
+        """
+
+        self.inventory = inventory
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of rooms.
+        """
+
+        return len(self.inventory.sorted_rooms)
+
+    def __getitem__(self, position):
+        """
+        Args:
+            position (int): The position in the sorted order.
+
+        Returns:
+            str: The room ID at the position, as a string.
+        """
+
+        return str(
+            self.inventory.get_room_id(int(self.inventory.sorted_rooms[position]))
+        )
@@ -6,36 +6,94 @@
 # Date          : 2025-10-13
 # ----------------------------------------------------------------------
 
+import atexit
+import collections
+import contextlib
+import gzip
+import os
+import signal
+import threading
 import time
+import zlib
+from typing import ClassVar
 
 import config
 
+# The "zstandard" package is optional, it is only required for "zstd" compression.
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 class Logs:
     """
     Utility functions for logging in the process of seating arrangement application.
 
     Attributes:
-        None
+        FLIGHT_RECORDER (collections.deque): The most recent log entries kept in memory
+        in flight recorder mode, stored as (timestamp, messages) tuples.
+        LOGS_FILE (LogSegments or None): The opened logs file.
+        REPORT_FILE (LogSegments or None): The opened report file.
+        ENTRIES_WRITTEN (int): The number of log entries written or recorded.
     """
 
+    FLIGHT_RECORDER: ClassVar[collections.deque] = collections.deque(
+        maxlen=config.FLIGHT_RECORDER_SIZE
+    )
+    LOGS_FILE = None
+    REPORT_FILE = None
+    ENTRIES_WRITTEN = 0
+
     @staticmethod
     def init_logs():
         """
         Initialize the logs and report file by creating or clearing it.
         """
 
+        # Fall back to gzip if zstd compression is selected without the zstandard package.
+        if (
+            config.LOGS_COMPRESSION == config.LOGS_COMPRESSION_ZSTD
+            and zstandard is None
+        ):
+            print("The 'zstandard' package is not installed, using gzip instead.")
+            config.LOGS_COMPRESSION = config.LOGS_COMPRESSION_GZIP
+
+        # Close the previously opened files, if any.
+        Logs.close_logs()
+
         # Create or clear the logs file.
-        with open(config.LOGS_PATH, "w", encoding="utf-8") as log_file:
-            log_file.write(f"{'='*34} PROGRAM LOGS FILE {'='*35}\n")
-            log_file.write(f"LOGS INITIALIZED AT {Logs.get_time_str()}\n")
-            log_file.write(f"{'='*88}\n\n")
+        Logs.LOGS_FILE = LogSegments(config.LOGS_PATH, "LOGS")
+        Logs.LOGS_FILE.write(f"{'='*34} PROGRAM LOGS FILE {'='*35}\n")
+        Logs.LOGS_FILE.write(f"LOGS INITIALIZED AT {Logs.get_time_str()}\n")
+        Logs.LOGS_FILE.write(f"{'='*88}\n\n")
 
         # Create or clear the report file.
-        with open(config.REPORT_PATH, "w", encoding="utf-8") as report_file:
-            report_file.write(f"{'='*33} PROGRAM REPORT FILE {'='*34}\n")
-            report_file.write(f"REPORT INITIALIZED AT {Logs.get_time_str()}\n")
-            report_file.write(f"{'='*88}\n\n")
+        Logs.REPORT_FILE = LogSegments(config.REPORT_PATH, "REPORT")
+        Logs.REPORT_FILE.write(f"{'='*33} PROGRAM REPORT FILE {'='*34}\n")
+        Logs.REPORT_FILE.write(f"REPORT INITIALIZED AT {Logs.get_time_str()}\n")
+        Logs.REPORT_FILE.write(f"{'='*88}\n\n")
+
+        # Reset the flight recorder with the configured size.
+        Logs.FLIGHT_RECORDER = collections.deque(maxlen=config.FLIGHT_RECORDER_SIZE)
+
+        # Make sure the compressed streams are completed even if end_logs() is never called.
+        atexit.register(Logs.close_logs)
+
+    @staticmethod
+    def init_worker_logs(flight_recorder_size):
+        """
+        Initialize the logs of a worker process. The worker processes keep their logs
+        in memory only, so they never write to the logs files of the main process.
+
+        Args:
+            flight_recorder_size (int): The number of recent log entries to keep.
+        """
+
+        config.LOGS_MODE = config.LOGS_MODE_FLIGHT
+        Logs.LOGS_FILE = None
+        Logs.REPORT_FILE = None
+        Logs.FLIGHT_RECORDER = collections.deque(maxlen=flight_recorder_size)
 
     @staticmethod
     def end_logs():
@@ -43,15 +101,57 @@ class Logs:
         End the logs file by appending an end message with a timestamp.
         """
 
-        with open(config.LOGS_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(f"\n{'='*37} END OF LOGS {'='*38}\n")
-            log_file.write(f"LOGS ENDED AT {Logs.get_time_str()}\n")
-            log_file.write(f"{'='*88}\n")
+        logs_file = Logs.get_logs_file()
+        logs_file.write(f"\n{'='*37} END OF LOGS {'='*38}\n")
+        logs_file.write(f"LOGS ENDED AT {Logs.get_time_str()}\n")
+        logs_file.write(f"{'='*88}\n")
+
+        report_file = Logs.get_report_file()
+        report_file.write(f"\n{'='*36} END OF REPORT {'='*37}\n")
+        report_file.write(f"REPORT ENDED AT {Logs.get_time_str()}\n")
+        report_file.write(f"{'='*88}\n")
+
+        Logs.close_logs()
+
+    @staticmethod
+    def close_logs():
+        """
+        Close the opened logs and report files, completing their compressed streams.
+        """
+
+        if Logs.LOGS_FILE is not None:
+            Logs.LOGS_FILE.close()
+            Logs.LOGS_FILE = None
 
-        with open(config.REPORT_PATH, "a", encoding="utf-8") as report_file:
-            report_file.write(f"\n{'='*36} END OF REPORT {'='*37}\n")
-            report_file.write(f"REPORT ENDED AT {Logs.get_time_str()}\n")
-            report_file.write(f"{'='*88}\n")
+        if Logs.REPORT_FILE is not None:
+            Logs.REPORT_FILE.close()
+            Logs.REPORT_FILE = None
+
+    @staticmethod
+    def get_logs_file():
+        """
+        Get the opened logs file, or open the existing one for appending.
+
+        Returns:
+            LogSegments: The opened logs file.
+        """
+
+        if Logs.LOGS_FILE is None:
+            Logs.LOGS_FILE = LogSegments(config.LOGS_PATH, "LOGS", append=True)
+        return Logs.LOGS_FILE
+
+    @staticmethod
+    def get_report_file():
+        """
+        Get the opened report file, or open the existing one for appending.
+
+        Returns:
+            LogSegments: The opened report file.
+        """
+
+        if Logs.REPORT_FILE is None:
+            Logs.REPORT_FILE = LogSegments(config.REPORT_PATH, "REPORT", append=True)
+        return Logs.REPORT_FILE
 
     @staticmethod
     def write_logs(messages):
@@ -62,10 +162,83 @@ class Logs:
             messages (list[str]): The logs messages to write.
         """
 
-        with open(config.LOGS_PATH, "a", encoding="utf-8") as log_file:
-            log_file.write(f"TIMESTAMP: [{Logs.get_time_str()}]\n")
-            for message in messages:
-                log_file.write(f"  - {message}\n")
+        Logs.ENTRIES_WRITTEN += 1
+
+        # In flight recorder mode, only keep the entry in memory.
+        if config.LOGS_MODE == config.LOGS_MODE_FLIGHT:
+            Logs.FLIGHT_RECORDER.append((time.time(), messages))
+            return
+
+        # Write the whole entry at once, so entries from different threads never interleave.
+        Logs.get_logs_file().write(
+            f"TIMESTAMP: [{Logs.get_time_str()}]\n"
+            + "".join(f"  - {message}\n" for message in messages)
+        )
+
+    @staticmethod
+    def write_phase_summary(phase, messages):
+        """
+        Write a phase summary to the logs file, regardless of the logging mode.
+
+        Args:
+            phase (str): The name of the completed phase.
+            messages (list[str]): The summary messages of the phase.
+        """
+
+        Logs.get_logs_file().write(
+            f"PHASE: [{phase}] COMPLETED AT [{Logs.get_time_str()}]\n"
+            + "".join(f"  - {message}\n" for message in messages)
+        )
+
+    @staticmethod
+    def dump_flight_recorder(reason, traceback_str=None):
+        """
+        Write the log entries kept in the flight recorder to the logs file,
+        followed by the traceback if given, then clear the flight recorder.
+
+        Args:
+            reason (str): The reason of the dump, such as an exception or a signal.
+            traceback_str (str or None, optional): The formatted traceback. Defaults to None.
+        """
+
+        logs_file = Logs.get_logs_file()
+        logs_file.write(f"\n{'='*36} FLIGHT RECORDER {'='*35}\n")
+        logs_file.write(f"REASON: {reason}\n")
+        logs_file.write(f"DUMPED AT {Logs.get_time_str()}\n")
+        logs_file.write(f"ENTRIES: {len(Logs.FLIGHT_RECORDER)}\n")
+        logs_file.write(f"{'='*88}\n")
+
+        # Write the recorded entries with their original timestamps.
+        for timestamp, messages in Logs.FLIGHT_RECORDER:
+            logs_file.write(
+                f"TIMESTAMP: [{Logs.get_time_str(timestamp)}]\n"
+                + "".join(f"  - {message}\n" for message in messages)
+            )
+
+        # Write the traceback if the dump is caused by an exception.
+        if traceback_str:
+            logs_file.write(f"{'-'*88}\n")
+            logs_file.write(traceback_str)
+
+        logs_file.write(f"{'='*88}\n\n")
+        logs_file.flush()
+
+        Logs.FLIGHT_RECORDER.clear()
+
+    @staticmethod
+    def install_signal_handler():
+        """
+        Dump the flight recorder to the logs file when the program receives SIGUSR1.
+        The signal is not available on Windows, so nothing is installed there.
+        """
+
+        if not hasattr(signal, "SIGUSR1"):
+            return
+
+        def handle_signal(signal_number, _):
+            Logs.dump_flight_recorder(f"SIGNAL {signal.Signals(signal_number).name}")
+
+        signal.signal(signal.SIGUSR1, handle_signal)
 
     @staticmethod
     def write_report(message):
@@ -76,16 +249,311 @@ class Logs:
             message (str): The report message to write.
         """
 
-        with open(config.REPORT_PATH, "a", encoding="utf-8") as report_file:
-            report_file.write(f"{message}\n")
+        Logs.get_report_file().write(f"{message}\n")
 
     @staticmethod
-    def get_time_str():
+    def read_logs(base_path):
         """
-        Get the current time as a formatted string.
+        Read all segments of a logs or report file in order, decompressing them if needed.
+
+        Args:
+            base_path (str): The path of the logs or report file, such as config.LOGS_PATH.
+
+        Yields:
+            str: Each line of the file, including the line break.
+        """
+
+        for segment_path in LogSegments.get_segment_paths(base_path):
+            with LogSegments.open_segment_for_reading(segment_path) as segment_file:
+                yield from segment_file
+
+    @staticmethod
+    def get_time_str(timestamp=None):
+        """
+        Get the current time, or the given time, as a formatted string.
+
+        Args:
+            timestamp (float or None, optional): The time in seconds since the epoch.
+            Defaults to None, which uses the current time.
 
         Returns:
-            str: The current time formatted as "DAY, DD MMM YYYY HH:MM:SS".
+            str: The time formatted as "DAY, DD MMM YYYY HH:MM:SS".
+        """
+
+        return time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime(timestamp))
+
+
+class LogSegments:
+    """
+    A logs or report file written through an optional streaming compressor,
+    which continues in a new numbered segment when it grows over the size limit.
+
+    The first segment is stored at the base path, for example "logs.txt.gz",
+    and the next segments are stored as "logs.001.txt.gz", "logs.002.txt.gz", etc.
+
+    Attributes:
+        base_path (str): The path of the file without the compression extension.
+        name (str): The name of the file written in the segment headers, such as "LOGS".
+        compression (str): The compression of the segments.
+        max_segment_bytes (int): The maximum size of each segment on disk, or 0 for no limit.
+        segment_index (int): The index of the current segment.
+        segment_bytes (int): The size of the current segment on disk when it was
+        last measured.
+        pending_bytes (int): The number of uncompressed bytes written since the size
+        of the current segment was last measured.
+        raw_file (io.BufferedWriter): The current segment file on disk.
+        stream (io.BufferedIOBase): The stream writing to the current segment file.
+        exit_stack (contextlib.ExitStack or None): The exit stack which closes the
+        stream and the current segment file.
+        lock (threading.RLock): The lock for writing from multiple threads.
+    """
+
+    def __init__(self, base_path, name, append=False):
+        """
+        Initialize a LogSegments object and open its first segment.
+
+        Args:
+            base_path (str): The path of the file without the compression extension.
+            name (str): The name of the file written in the segment headers, such as "LOGS".
+            append (bool, optional): Whether to append to the existing first segment
+            instead of clearing all existing segments. Defaults to False.
+        """
+
+        # Initialize attributes.
+        self.base_path = base_path
+        self.name = name
+        self.compression = config.LOGS_COMPRESSION
+        self.max_segment_bytes = config.LOGS_MAX_SEGMENT_BYTES
+        self.segment_index = 0
+        self.segment_bytes = 0
+        self.pending_bytes = 0
+        self.raw_file = None
+        self.stream = None
+        self.exit_stack = None
+        self.lock = threading.RLock()
+
+        # Continue in the last segment when appending,
+        # otherwise remove the segments of the previous run, if any.
+        if append:
+            self.segment_index = LogSegments.get_last_segment_index(base_path)
+        else:
+            for segment_path in LogSegments.get_segment_paths(base_path):
+                os.remove(segment_path)
+
+        self.open_segment("ab" if append else "wb")
+
+    @staticmethod
+    def get_segment_path(base_path, segment_index, compression):
+        """
+        Get the path of a segment.
+
+        Args:
+            base_path (str): The path of the file without the compression extension.
+            segment_index (int): The index of the segment.
+            compression (str): The compression of the segment.
+
+        Returns:
+            str: The path of the segment.
+        """
+
+        if segment_index > 0:
+            root, extension = os.path.splitext(base_path)
+            base_path = f"{root}.{segment_index:03d}{extension}"
+        return base_path + config.LOGS_COMPRESSION_EXTENSIONS[compression]
+
+    @staticmethod
+    def get_segment_paths(base_path):
+        """
+        Get the paths of all existing segments of a file in order, whatever their compression.
+
+        Args:
+            base_path (str): The path of the file without the compression extension.
+
+        Returns:
+            list[str]: The paths of the existing segments.
+        """
+
+        segment_paths = []
+        segment_index = 0
+        while True:
+            # Find the segment with any of the supported compressions.
+            existing_paths = [
+                LogSegments.get_segment_path(base_path, segment_index, compression)
+                for compression in config.LOGS_COMPRESSION_EXTENSIONS
+            ]
+            existing_paths = [path for path in existing_paths if os.path.exists(path)]
+            if not existing_paths:
+                return segment_paths
+
+            segment_paths.extend(existing_paths)
+            segment_index += 1
+
+    @staticmethod
+    def get_last_segment_index(base_path):
+        """
+        Get the index of the last existing segment of a file, whatever its compression.
+
+        Args:
+            base_path (str): The path of the file without the compression extension.
+
+        Returns:
+            int: The index of the last existing segment, or 0 if there is none.
+        """
+
+        segment_index = 0
+        while any(
+            os.path.exists(
+                LogSegments.get_segment_path(base_path, segment_index + 1, compression)
+            )
+            for compression in config.LOGS_COMPRESSION_EXTENSIONS
+        ):
+            segment_index += 1
+        return segment_index
+
+    @staticmethod
+    def open_segment_for_reading(segment_path):
+        """
+        Open a segment as a text file, decompressing it according to its extension.
+
+        Args:
+            segment_path (str): The path of the segment.
+
+        Returns:
+            io.TextIOBase: The opened segment.
+        """
+
+        if segment_path.endswith(
+            config.LOGS_COMPRESSION_EXTENSIONS[config.LOGS_COMPRESSION_GZIP]
+        ):
+            return gzip.open(segment_path, "rt", encoding="utf-8")
+
+        if segment_path.endswith(
+            config.LOGS_COMPRESSION_EXTENSIONS[config.LOGS_COMPRESSION_ZSTD]
+        ):
+            if zstandard is None:
+                raise RuntimeError(
+                    f"The 'zstandard' package is required to read {segment_path}"
+                )
+            return zstandard.open(segment_path, "rt", encoding="utf-8")
+
+        return open(segment_path, "r", encoding="utf-8")
+
+    def open_segment(self, mode):
+        """
+        Open the current segment and its compressor.
+
+        Args:
+            mode (str): The mode to open the segment file, "wb" or "ab".
+        """
+
+        segment_path = LogSegments.get_segment_path(
+            self.base_path, self.segment_index, self.compression
+        )
+
+        # The exit stack closes the compressor before the segment file, and closes
+        # the segment file if the compressor cannot be created.
+        with contextlib.ExitStack() as exit_stack:
+            self.raw_file = exit_stack.enter_context(open(segment_path, mode))
+            if self.compression == config.LOGS_COMPRESSION_GZIP:
+                self.stream = exit_stack.enter_context(
+                    gzip.GzipFile(fileobj=self.raw_file, mode="wb")
+                )
+            elif self.compression == config.LOGS_COMPRESSION_ZSTD:
+                self.stream = exit_stack.enter_context(
+                    zstandard.ZstdCompressor().stream_writer(
+                        self.raw_file, closefd=False
+                    )
+                )
+            else:
+                self.stream = self.raw_file
+            self.exit_stack = exit_stack.pop_all()
+        self.segment_bytes = self.raw_file.tell()
+        self.pending_bytes = 0
+
+    def write(self, text):
+        """
+        Write a text to the current segment, then continue in the next segment
+        if the current one has grown over the size limit.
+
+        The compressors keep the written data in their buffers, so the size on disk is
+        only measured after flushing them. The compressed data is never much larger
+        than the uncompressed data, so they are only flushed once the uncompressed
+        bytes written since the last measurement could fill the rest of the segment.
+
+        Args:
+            text (str): The text to write.
+        """
+
+        with self.lock:
+            data = text.encode("utf-8")
+            self.stream.write(data)
+            self.pending_bytes += len(data)
+
+            # Only rotate after complete lines, so each entry line stays in one segment.
+            if (
+                self.max_segment_bytes > 0
+                and text.endswith("\n")
+                and self.pending_bytes >= self.max_segment_bytes - self.segment_bytes
+            ):
+                self.segment_bytes = self.sync()
+                self.pending_bytes = 0
+                if self.segment_bytes >= self.max_segment_bytes:
+                    self.rotate()
+
+    def sync(self):
+        """
+        Flush the compressor at a sync point, so all written data is on disk
+        and can be decompressed, then measure the size of the current segment.
+
+        Returns:
+            int: The size of the current segment on disk.
+        """
+
+        if self.compression == config.LOGS_COMPRESSION_GZIP:
+            self.stream.flush(zlib.Z_SYNC_FLUSH)
+        elif self.compression == config.LOGS_COMPRESSION_ZSTD:
+            self.stream.flush(zstandard.FLUSH_BLOCK)
+        self.raw_file.flush()
+        return self.raw_file.tell()
+
+    def rotate(self):
+        """
+        Close the current segment with a footer, then open the next segment with a header.
+        """
+
+        next_index = self.segment_index + 1
+        self.stream.write(
+            f"{'-'*88}\n{self.name} CONTINUED IN SEGMENT {next_index} "
+            f"AT {Logs.get_time_str()}\n".encode()
+        )
+        self.close_segment()
+
+        self.segment_index = next_index
+        self.open_segment("wb")
+        self.stream.write(
+            f"{self.name} SEGMENT {self.segment_index} STARTED AT "
+            f"{Logs.get_time_str()}\n{'-'*88}\n".encode()
+        )
+
+    def flush(self):
+        """
+        Flush the written text to the current segment file on disk.
+        """
+
+        self.stream.flush()
+        if self.stream is not self.raw_file:
+            self.raw_file.flush()
+
+    def close_segment(self):
+        """
+        Complete the compressed stream and close the current segment file.
+        """
+
+        self.exit_stack.close()
+
+    def close(self):
+        """
+        Close the file.
         """
 
-        return time.strftime("%a, %d %b %Y %H:%M:%S", time.localtime())
+        self.close_segment()
@@ -5,12 +5,29 @@
 # Date          : 2025-10-13
 # ----------------------------------------------------------------------
 
+import argparse
 import time
+import traceback
 
+import assignment
+import checkpoint
+import config
 import generator
+import interleaver
 import logs
+import metrics
+import permutation
+import pipeline
+import planner
+import profiler
 import randomizer
+import renderer
+import scheduler
+import sharder
+import utilisation
 import utility
+import validator
+import watcher
 
 
 class Main:
@@ -18,34 +35,95 @@ class Main:
     Main class to run the seating arrangement application.
 
     Attributes:
-        None
+        arguments (argparse.Namespace): The parsed command line arguments.
+        randomizer (Randomizer): The randomizer used to assign seats to students.
+        checkpoint (Checkpoint): The checkpoint of the sequential mode.
+        assignment_file (AssignmentFile or None): The assignment file of the previous run,
+        if the outputs are reprinted from it.
+        profiler (MemoryProfiler or None): The memory profiler, if memory profiling is enabled.
     """
 
-    def __init__(self):
+    def __init__(self, arguments):
         """
         Initialize the Main class.
+
+        Args:
+            arguments (argparse.Namespace): The parsed command line arguments.
         """
 
-        # Initialize logs.
+        self.arguments = arguments
+
+        # Apply logging configurations, then initialize logs.
+        config.LOGS_MODE = arguments.log_mode
+        config.FLIGHT_RECORDER_SIZE = arguments.flight_recorder_size
+        config.LOGS_COMPRESSION = arguments.log_compression
+        config.LOGS_MAX_SEGMENT_BYTES = arguments.log_max_segment_bytes
+        config.METRICS_PATH = arguments.metrics_path
+        config.RENDER_HTML = arguments.render_html
+        config.WRITE_ASSIGNMENT_FILE = arguments.assignment_file
+        config.ASSIGNMENT_PERMUTATION = arguments.permutation
+        Main.apply_allocation_arguments(arguments)
         logs.Logs.init_logs()
+        config.OUTPUT_FORMATS = generator.Generator.get_output_formats(
+            arguments.formats
+        )
+        logs.Logs.install_signal_handler()
+
+        # Start tracing the memory allocations, if requested.
+        self.profiler = None
+        if arguments.profile_memory:
+            self.profiler = profiler.MemoryProfiler()
 
         # Display welcome message.
         print(f"{'='*31} SEAT RANDOMIZER PROGRAM {'='*32}")
 
-        # Get user input for random mode.
-        random_choice = (
-            input("Do you want to enable random mode? (y/n): ").strip().lower()
-        )
+        # Load the checkpoint of an interrupted run, if requested.
+        self.checkpoint = checkpoint.Checkpoint()
+        is_resumed = arguments.resume and self.checkpoint.load()
+        if arguments.resume and not is_resumed:
+            print("No usable checkpoint found. Starting a new run.")
+        elif is_resumed:
+            self.checkpoint.restore_configurations()
+
+        # Open the assignment file of the previous run, if reprinting it.
+        self.assignment_file = None
+        if arguments.reprint:
+            self.assignment_file = assignment.AssignmentFile.open()
+
+        # Get user input for random mode, or resume with the mode of the checkpoint
+        # or of the assignment file. A seed given with --seed enables random mode.
         is_random_mode = True
-        if random_choice == "y":
+        if is_resumed:
+            is_random_mode = self.checkpoint.state["is_random_mode"]
+            print(
+                f"Resuming the interrupted run after {self.checkpoint.state['phase']}."
+            )
+        elif self.assignment_file is not None:
+            is_random_mode = self.assignment_file.is_random_mode()
+            print("Reprinting the outputs of the previous run.")
+        elif arguments.seed is not None:
             print("Random mode enabled.")
-        elif random_choice == "n":
-            is_random_mode = False
-            print("Random mode disabled.")
+        else:
+            random_choice = (
+                input("Do you want to enable random mode? (y/n): ").strip().lower()
+            )
+            if random_choice == "y":
+                print("Random mode enabled.")
+            elif random_choice == "n":
+                is_random_mode = False
+                print("Random mode disabled.")
 
-        # Get user input for seed value if random mode is enabled.
+        # Get user input for seed value if random mode is enabled, use the seed
+        # given with --seed, or resume with the seed of the checkpoint or of the
+        # assignment file.
         seed = time.time()
-        if is_random_mode:
+        if is_resumed:
+            seed = self.checkpoint.state["seed"]
+        elif self.assignment_file is not None:
+            seed = self.assignment_file.seed
+        elif arguments.seed is not None:
+            seed = arguments.seed
+        elif is_random_mode:
             seed_choice = (
                 input("Do you want to set a custom seed? (y/n): ").strip().lower()
             )
@@ -60,8 +138,11 @@ class Main:
         print(f"Seed: {seed}")
         print("=" * 88)
 
-        # Initialize randomizer object.
-        self.randomizer = randomizer.Randomizer(is_random_mode, seed)
+        # Initialize randomizer object, with keyed permutations if requested.
+        if config.ASSIGNMENT_PERMUTATION:
+            self.randomizer = permutation.PermutationRandomizer(is_random_mode, seed)
+        else:
+            self.randomizer = randomizer.Randomizer(is_random_mode, seed)
 
         # Write report.
         logs.Logs.write_report(f"{'='*32} CONFIGURATION SUMMARY {'='*33}")
@@ -69,33 +150,353 @@ class Main:
         logs.Logs.write_report(
             f"RANDOM MODE: {'ENABLED' if is_random_mode else 'DISABLED'}"
         )
+        logs.Logs.write_report(f"LOGS MODE: {config.LOGS_MODE.upper()}")
+        logs.Logs.write_report(
+            f"ASSIGNMENT MODE: {'PERMUTATION' if config.ASSIGNMENT_PERMUTATION else 'SHUFFLE'}"
+        )
         logs.Logs.write_report(f"{'='*88}\n")
 
+    @staticmethod
+    def parse_arguments():
+        """
+        Parse the command line arguments.
+
+        Returns:
+            argparse.Namespace: The parsed command line arguments.
+        """
+
+        parser = argparse.ArgumentParser(
+            description="Randomize student seating arrangements for examination rooms."
+        )
+        parser.add_argument(
+            "--log-mode",
+            choices=config.LOGS_MODES,
+            default=config.LOGS_MODE,
+            help="'full' writes every log entry, 'flight' keeps recent entries in memory "
+            "and only writes them on failure or SIGUSR1.",
+        )
+        parser.add_argument(
+            "--flight-recorder-size",
+            type=int,
+            default=config.FLIGHT_RECORDER_SIZE,
+            help="Number of recent log entries kept in flight recorder mode.",
+        )
+        parser.add_argument(
+            "--log-compression",
+            choices=list(config.LOGS_COMPRESSION_EXTENSIONS),
+            default=config.LOGS_COMPRESSION,
+            help="Compression of the logs and report files.",
+        )
+        parser.add_argument(
+            "--log-max-segment-bytes",
+            type=int,
+            default=config.LOGS_MAX_SEGMENT_BYTES,
+            help="Maximum size of each logs and report file segment on disk "
+            "before continuing in the next segment, or 0 for no limit.",
+        )
+        parser.add_argument(
+            "--pipeline",
+            action="store_true",
+            help="Overlap input parsing, seat assignment and output writing. "
+            "The outputs are the same as the sequential mode for the same seed.",
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=config.SHARDS,
+            help="Run the seating arrangement in this number of shards in separate "
+            "processes. The outputs are the same for any number of shards.",
+        )
+        parser.add_argument(
+            "--formats",
+            nargs="+",
+            choices=list(config.OUTPUT_FORMAT_EXTENSIONS),
+            default=config.OUTPUT_FORMATS,
+            help="Also write the output of each room and of all rooms in these formats "
+            "alongside the CSV files. The 'arrow' and 'parquet' formats require the "
+            "'pyarrow' library.",
+        )
+        parser.add_argument(
+            "--allocation",
+            choices=config.ALLOCATION_STRATEGIES,
+            default=config.ALLOCATION_STRATEGY,
+            help="Allocation strategy of the rooms. 'proportional' opens all rooms, and "
+            "'fewest-rooms' only opens the fewest rooms which fit all students.",
+        )
+        parser.add_argument(
+            "--fill-target",
+            type=float,
+            default=config.ROOM_FILL_TARGET,
+            help="Ratio of the available seats of each room to fill with the "
+            "'fewest-rooms' allocation, between 0 and 1.",
+        )
+        parser.add_argument(
+            "--group-by-building",
+            action="store_true",
+            default=config.GROUP_ROOMS_BY_BUILDING,
+            help="Open the rooms of the fewest buildings first with the 'fewest-rooms' "
+            "allocation. The building is the prefix of the room ID before the first "
+            f"'{config.BUILDING_SEPARATOR}'.",
+        )
+        parser.add_argument(
+            "--permutation",
+            action="store_true",
+            help="In random mode, assign the seats with keyed permutations derived from "
+            "the seed, so the seat of any student can be computed with --compute-seat. "
+            "Pinned students are not supported.",
+        )
+        parser.add_argument(
+            "--compute-seat",
+            metavar="STUDENT_ID",
+            help="Compute the room and seat of a student in a --permutation run with "
+            "the seed given by --seed and the current databases, then exit.",
+        )
+        parser.add_argument(
+            "--seed",
+            help="Run in random mode with this seed without asking, or give the seed "
+            "of the --permutation run for --compute-seat.",
+        )
+        parser.add_argument(
+            "--render-html",
+            action="store_true",
+            help="Also render a printable HTML page with the seat map and the door list "
+            "of each room. Rooms whose assignment has not changed since the previous "
+            "run are not rendered again.",
+        )
+        parser.add_argument(
+            "--watch",
+            action="store_true",
+            help="After the run, keep watching the database folder and rebuild "
+            "only the changed outputs whenever a database file changes.",
+        )
+        parser.add_argument(
+            "--schedule",
+            action="store_true",
+            help="Allocate the rooms of all exams in the exams database across their "
+            "time slots, then seat each exam in its allocated rooms.",
+        )
+        parser.add_argument(
+            "--interleave",
+            nargs="+",
+            metavar="EXAM_ID",
+            help="Seat the students of several exams in the exams database together "
+            "in all rooms, alternating the exams seat by seat.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Resume an interrupted sequential run from its checkpoint in the "
+            "generated folder, with the same seed and the same outputs.",
+        )
+        parser.add_argument(
+            "--profile-memory",
+            action="store_true",
+            help="Measure the peak and retained memory and the top allocation sites "
+            "of each phase, and write them to the report and a JSON file.",
+        )
+        parser.add_argument(
+            "--metrics-path",
+            default=config.METRICS_PATH,
+            help="Path of the Prometheus textfile with the metrics of the run, which is "
+            "written at the end of the run and on failure.",
+        )
+        parser.add_argument(
+            "--assignment-file",
+            action="store_true",
+            help="Also write the seating result to a compact binary assignment file, "
+            "which can be searched with --lookup and reprinted with --reprint.",
+        )
+        parser.add_argument(
+            "--reprint",
+            action="store_true",
+            help="Generate the outputs again from the assignment file of a previous "
+            "run, without reading the databases or assigning seats again.",
+        )
+        parser.add_argument(
+            "--lookup",
+            metavar="STUDENT_ID",
+            help="Print the room and seat of a student from the assignment file of a "
+            "previous run, then exit.",
+        )
+        parser.add_argument(
+            "--plan",
+            action="store_true",
+            help="Only print the planned number of students and the seat utilisation "
+            "of each room, and whether all students fit, then exit.",
+        )
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only validate the input CSV databases and print all errors, then exit.",
+        )
+        parser.add_argument(
+            "--read-logs",
+            choices=["logs", "report"],
+            help="Print all segments of the logs or report file of the previous run, then exit.",
+        )
+        arguments = parser.parse_args()
+        if arguments.flight_recorder_size < 0:
+            parser.error("--flight-recorder-size must be at least 0.")
+        if arguments.shards is not None and arguments.shards < 1:
+            parser.error("--shards must be at least 1.")
+        if arguments.shards and arguments.pipeline:
+            parser.error("--pipeline cannot be used with --shards.")
+        if arguments.schedule and arguments.interleave:
+            parser.error("--schedule cannot be used with --interleave.")
+        if arguments.watch and arguments.shards:
+            parser.error("--watch cannot be used with --shards.")
+        if arguments.watch and arguments.schedule:
+            parser.error("--watch cannot be used with --schedule.")
+        if arguments.watch and arguments.interleave:
+            parser.error("--watch cannot be used with --interleave.")
+        if arguments.resume and (
+            arguments.pipeline
+            or arguments.shards
+            or arguments.schedule
+            or arguments.interleave
+        ):
+            parser.error("--resume can only be used in sequential mode.")
+        if arguments.reprint and (
+            arguments.resume
+            or arguments.pipeline
+            or arguments.shards
+            or arguments.schedule
+            or arguments.interleave
+            or arguments.watch
+        ):
+            parser.error(
+                "--reprint can only be used in sequential mode without --watch."
+            )
+        if arguments.assignment_file and (
+            arguments.shards or arguments.schedule or arguments.interleave
+        ):
+            parser.error(
+                "--assignment-file cannot be used with --shards, --schedule or "
+                "--interleave."
+            )
+        if arguments.formats and (
+            arguments.shards or arguments.schedule or arguments.interleave
+        ):
+            parser.error(
+                "--formats cannot be used with --shards, --schedule or --interleave."
+            )
+        if not 0 < arguments.fill_target <= 1:
+            parser.error("--fill-target must be greater than 0 and at most 1.")
+        if arguments.allocation != config.ALLOCATION_PROPORTIONAL and (
+            arguments.schedule or arguments.interleave
+        ):
+            parser.error(
+                f"--allocation {arguments.allocation} cannot be used with --schedule "
+                "or --interleave."
+            )
+        if arguments.permutation and (
+            arguments.shards or arguments.schedule or arguments.interleave
+        ):
+            parser.error(
+                "--permutation cannot be used with --shards, --schedule or "
+                "--interleave."
+            )
+        if arguments.compute_seat is not None and arguments.seed is None:
+            parser.error("--compute-seat requires --seed.")
+        if arguments.seed is not None and (arguments.resume or arguments.reprint):
+            parser.error(
+                "--seed cannot be used with --resume or --reprint, which reuse "
+                "the seed of the previous run."
+            )
+        if arguments.render_html and (
+            arguments.shards or arguments.schedule or arguments.interleave
+        ):
+            parser.error(
+                "--render-html cannot be used with --shards, --schedule or "
+                "--interleave."
+            )
+        return arguments
+
+    @staticmethod
+    def apply_allocation_arguments(arguments):
+        """
+        Apply the room allocation arguments to the configurations.
+
+        Args:
+            arguments (argparse.Namespace): The parsed command line arguments.
+        """
+
+        config.ALLOCATION_STRATEGY = arguments.allocation
+        config.ROOM_FILL_TARGET = arguments.fill_target
+        config.GROUP_ROOMS_BY_BUILDING = arguments.group_by_building
+
+    def finish_phase(self, phase, start_time, messages):
+        """
+        Write the summary of a completed phase to the logs file.
+
+        Args:
+            phase (str): The name of the completed phase.
+            start_time (float): The performance counter value when the phase started.
+            messages (list[str]): The summary messages of the phase.
+        """
+
+        duration = time.perf_counter() - start_time
+        metrics.Metrics.record_phase(phase, duration)
+        logs.Logs.write_phase_summary(
+            phase, messages + [f"DURATION = {duration:.3f} SECONDS"]
+        )
+
+        # Measure the memory of the phase, if memory profiling is enabled.
+        if self.profiler is not None:
+            self.profiler.record_phase(phase)
+
     def main(self):
         """
         Main method to run the seating arrangement application.
         """
 
-        # Load student database from CSV file.
-        print("Get Students Database from CSV file...")
-        utility.Utility.get_students_database()
-        print("Students Database loaded successfully.\n")
+        # Validate the input CSV databases before creating any object. A checkpoint
+        # is only loaded if the input files have not changed since they were validated,
+        # and a reprint does not read them.
+        if self.checkpoint.state is None and self.assignment_file is None:
+            print("Validating input CSV databases...")
+            start_time = time.perf_counter()
+            validator.Validator.check_databases()
+            self.finish_phase("VALIDATE DATABASES", start_time, [])
+            print("Input CSV databases validated successfully.\n")
 
-        # Load room and seat database from CSV file.
-        print("Get Rooms and Seats Database from CSV file...")
-        utility.Utility.get_rooms_database()
-        print("Rooms and Seats Database loaded successfully.\n")
+        # Run the exam scheduler, or the seating arrangement in pipeline mode
+        # or sequential mode.
+        if self.assignment_file is not None:
+            self.run_reprint()
+        elif self.arguments.schedule:
+            self.run_schedule()
+        elif self.arguments.interleave:
+            self.run_interleave()
+        elif self.arguments.shards:
+            self.run_sharded()
+        elif self.arguments.pipeline:
+            self.run_pipeline()
+        else:
+            self.run_sequential()
 
-        # Assign seats to students.
-        print("Assigning seats to students...")
-        self.randomizer.assign_seats_to_students()
-        print("Seats assigned to students successfully.\n")
+        # Write the assignment file, if requested.
+        if config.WRITE_ASSIGNMENT_FILE:
+            self.write_assignment_file()
 
-        # Generate output CSV file with seating arrangement.
-        print("Generating output CSV files...")
-        generator.Generator.generate_output_students_csv()
-        generator.Generator.generate_output_all_rooms_csv()
-        print("Output CSV files generated successfully.\n")
+        # Write the output files in the additional output formats, if requested.
+        if config.OUTPUT_FORMATS:
+            self.generate_output_formats()
+
+        # Render the HTML seat maps and door lists of all rooms, if requested.
+        if config.RENDER_HTML:
+            self.render_html()
+
+        # Write the seat utilisation summary of all rooms.
+        if not (self.arguments.schedule or self.arguments.shards):
+            utilisation.UtilisationIndex(config.ROOMS_DB).write_report()
+
+        # Write the memory profile of all phases, if memory profiling is enabled.
+        if self.profiler is not None:
+            self.profiler.write_outputs()
+
+        # Write the metrics of the run for monitoring.
+        metrics.Metrics.write_textfile(True)
 
         # Display completion message.
         print("=" * 88)
@@ -104,11 +505,389 @@ class Main:
         print("Please check the output CSV files and logs for details.")
         print("=" * 88)
 
+        # Keep rebuilding the outputs when the database files change, if requested.
+        if self.arguments.watch:
+            watcher.Watcher(self.randomizer).watch()
+
         # End the logs.
         logs.Logs.end_logs()
 
+    def write_assignment_file(self):
+        """
+        Write the seating result to the binary assignment file.
+        """
+
+        print("Writing assignment file...")
+        start_time = time.perf_counter()
+        assignment.AssignmentFile.write(self.randomizer)
+        self.finish_phase(
+            "WRITE ASSIGNMENT FILE",
+            start_time,
+            [f"OUTPUT PATH = {config.GENERATED_ASSIGNMENT_PATH}"],
+        )
+        print("Assignment file written successfully.\n")
+
+    def run_reprint(self):
+        """
+        Load the assigned databases from the assignment file of a previous run,
+        then generate the outputs again.
+        """
+
+        # Load the assigned databases from the assignment file.
+        print("Loading assignment file...")
+        start_time = time.perf_counter()
+        self.assignment_file.load_databases()
+        self.assignment_file.close()
+        self.finish_phase(
+            "LOAD ASSIGNMENT FILE",
+            start_time,
+            [
+                f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+                f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+                f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+            ],
+        )
+        print("Assignment file loaded successfully.\n")
+
+        # Generate output CSV file with seating arrangement.
+        print("Generating output CSV files...")
+        start_time = time.perf_counter()
+        generator.Generator.generate_output_students_csv()
+        generator.Generator.generate_output_all_rooms_csv()
+        self.finish_phase(
+            "GENERATE OUTPUTS",
+            start_time,
+            [f"OUTPUT PATH = {config.GENERATED_PATH}"],
+        )
+        print("Output CSV files generated successfully.\n")
+
+    def generate_output_formats(self):
+        """
+        Generate the output files of each room and of all rooms in the additional
+        output formats.
+        """
+
+        print(f"Generating output files in {', '.join(config.OUTPUT_FORMATS)}...")
+        start_time = time.perf_counter()
+        generator.Generator.generate_output_all_rooms_formats()
+        self.finish_phase(
+            "GENERATE OUTPUT FORMATS",
+            start_time,
+            [
+                f"OUTPUT FORMATS = {config.OUTPUT_FORMATS}",
+                f"OUTPUT PATH = {config.GENERATED_PATH}",
+            ],
+        )
+        print("Output files generated successfully.\n")
+
+    def render_html(self):
+        """
+        Render the printable HTML seat maps and door lists of all rooms.
+        """
+
+        print("Rendering HTML seat maps and door lists...")
+        start_time = time.perf_counter()
+        rendered_amount = renderer.Renderer().render_all()
+        self.finish_phase(
+            "RENDER HTML",
+            start_time,
+            [
+                f"RENDERED ROOMS = {rendered_amount}",
+                f"OUTPUT PATH = {config.GENERATED_HTML_PATH}",
+            ],
+        )
+        print("HTML seat maps and door lists rendered successfully.\n")
+
+    def run_sharded(self):
+        """
+        Assign seats and generate the outputs in shards in separate processes.
+        """
+
+        print(f"Running seating arrangement in {self.arguments.shards} shards...")
+        start_time = time.perf_counter()
+        sharder.Sharder(self.randomizer, self.arguments.shards).run()
+        self.finish_phase(
+            "SHARDED RUN",
+            start_time,
+            [
+                f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+                f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+                f"SHARDS = {self.arguments.shards}",
+                f"OUTPUT PATH = {config.GENERATED_PATH}",
+            ],
+        )
+        print("Sharded seating arrangement completed successfully.\n")
+
+    def run_pipeline(self):
+        """
+        Load the databases, assign seats and generate the outputs in pipeline mode.
+        """
+
+        print("Running seating arrangement pipeline...")
+        start_time = time.perf_counter()
+        pipeline.Pipeline(self.randomizer).run()
+        self.finish_phase(
+            "PIPELINE",
+            start_time,
+            [
+                f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+                f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+                f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+                f"OUTPUT PATH = {config.GENERATED_PATH}",
+            ],
+        )
+        print("Seating arrangement pipeline completed successfully.\n")
+
+    def load_rooms(self):
+        """
+        Load the rooms and seats database only, for the modes which read their
+        students from the exams database.
+        """
+
+        # Load room and seat database from CSV file.
+        print("Get Rooms and Seats Database from CSV file...")
+        start_time = time.perf_counter()
+        utility.Utility.get_rooms_database()
+        self.finish_phase(
+            "LOAD ROOMS",
+            start_time,
+            [
+                f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+                f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+            ],
+        )
+        print("Rooms and Seats Database loaded successfully.\n")
+
+    def run_interleave(self):
+        """
+        Load the rooms database, then seat the interleaved exams together in all rooms.
+        """
+
+        self.load_rooms()
+
+        # Seat the interleaved exams.
+        print("Seating interleaved exams...")
+        start_time = time.perf_counter()
+        exam_interleaver = interleaver.Interleaver(
+            self.randomizer, self.arguments.interleave
+        )
+        exam_interleaver.run()
+        self.finish_phase(
+            "INTERLEAVE EXAMS",
+            start_time,
+            [
+                f"EXAM IDS = {exam_interleaver.exam_ids}",
+                f"OUTPUT PATH = {config.GENERATED_INTERLEAVED_PATH}",
+            ],
+        )
+        print("Interleaved exams seated successfully.\n")
+
+    def run_schedule(self):
+        """
+        Load the rooms database, then allocate the rooms of all exams and seat each exam.
+        """
+
+        self.load_rooms()
+
+        # Allocate the rooms of all exams, then seat each exam.
+        print("Scheduling exams...")
+        start_time = time.perf_counter()
+        exam_scheduler = scheduler.Scheduler(self.randomizer)
+        exam_scheduler.run()
+        self.finish_phase(
+            "SCHEDULE EXAMS",
+            start_time,
+            [
+                f"TOTAL EXAMS = {len(exam_scheduler.exams)}",
+                f"SCHEDULED EXAMS = {len(exam_scheduler.allocations)}",
+                f"UNSCHEDULED EXAMS = {len(exam_scheduler.unscheduled)}",
+                f"OUTPUT PATH = {config.GENERATED_SCHEDULE_PATH}",
+            ],
+        )
+        print(
+            f"{len(exam_scheduler.allocations)} exam(s) scheduled, "
+            f"{len(exam_scheduler.unscheduled)} exam(s) unscheduled.\n"
+        )
+
+    def run_sequential(self):
+        """
+        Load the databases, assign seats and generate the outputs one after another.
+        The progress is saved to the checkpoint after each phase, and the phases
+        completed by an interrupted run are skipped when it is resumed.
+        """
+
+        if self.checkpoint.state is not None:
+            # Restore the databases of the interrupted run.
+            print("Restoring databases from the checkpoint...")
+            start_time = time.perf_counter()
+            self.checkpoint.restore()
+            self.finish_phase(
+                "RESTORE CHECKPOINT",
+                start_time,
+                [
+                    f"PHASE = {self.checkpoint.state['phase']}",
+                    f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+                    f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+                ],
+            )
+            print("Databases restored successfully.\n")
+
+        if not self.checkpoint.is_phase_completed(checkpoint.PHASE_LOAD):
+            # Load student database from CSV file.
+            print("Get Students Database from CSV file...")
+            start_time = time.perf_counter()
+            utility.Utility.get_students_database()
+            self.finish_phase(
+                "LOAD STUDENTS",
+                start_time,
+                [f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}"],
+            )
+            print("Students Database loaded successfully.\n")
+
+            # Load room, seat and pin database from CSV file.
+            print("Get Rooms and Seats Database from CSV file...")
+            start_time = time.perf_counter()
+            utility.Utility.get_rooms_database()
+            utility.Utility.get_pins_database()
+            self.finish_phase(
+                "LOAD ROOMS",
+                start_time,
+                [
+                    f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+                    f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+                    f"TOTAL PINS = {len(config.PINS_DB)}",
+                ],
+            )
+            print("Rooms and Seats Database loaded successfully.\n")
+            self.checkpoint.save(checkpoint.PHASE_LOAD, self.randomizer)
+
+        if not self.checkpoint.is_phase_completed(checkpoint.PHASE_ASSIGN):
+            # Assign seats to students.
+            print("Assigning seats to students...")
+            start_time = time.perf_counter()
+            self.randomizer.assign_seats_to_students()
+            self.finish_phase(
+                "ASSIGN SEATS",
+                start_time,
+                [f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}"],
+            )
+            print("Seats assigned to students successfully.\n")
+            self.checkpoint.save(checkpoint.PHASE_ASSIGN, self.randomizer)
+
+        # Generate output CSV file with seating arrangement, skipping the output
+        # files which are already written.
+        print("Generating output CSV files...")
+        start_time = time.perf_counter()
+        if self.checkpoint.is_students_written:
+            logs.Logs.write_report("Output students CSV generated successfully.")
+            logs.Logs.write_report(f"Total Students: {len(config.STUDENTS_DB)}")
+        else:
+            generator.Generator.generate_output_students_csv()
+            self.checkpoint.mark_students_written()
+        generator.Generator.generate_output_all_rooms_csv(
+            written_room_ids=self.checkpoint.written_room_ids,
+            on_room_written=self.checkpoint.mark_room_written,
+        )
+        self.checkpoint.clear()
+        self.finish_phase(
+            "GENERATE OUTPUTS",
+            start_time,
+            [f"OUTPUT PATH = {config.GENERATED_PATH}"],
+        )
+        print("Output CSV files generated successfully.\n")
+
 
 # Call the main function to run the program.
 if __name__ == "__main__":
-    main_app = Main()
-    main_app.main()
+    is_run_started = False
+    try:
+        arguments = Main.parse_arguments()
+
+        # The modes which only print a result and exit keep their log entries in memory,
+        # so the logs and report files of the previous run are not touched.
+        if (
+            arguments.read_logs
+            or arguments.lookup is not None
+            or arguments.compute_seat is not None
+            or arguments.plan
+            or arguments.check
+        ):
+            config.LOGS_MODE = config.LOGS_MODE_FLIGHT
+
+        # Only print the logs or report file of the previous run, if requested.
+        if arguments.read_logs:
+            read_path = config.LOGS_PATH
+            if arguments.read_logs == "report":
+                read_path = config.REPORT_PATH
+            for line in logs.Logs.read_logs(read_path):
+                print(line, end="")
+            raise SystemExit(0)
+
+        # Only print the room and seat of a student from the assignment file, if requested.
+        if arguments.lookup is not None:
+            assignment_file = assignment.AssignmentFile.open()
+            try:
+                result = assignment_file.lookup(arguments.lookup)
+            except KeyError:
+                print(f"Student {arguments.lookup} is not in the assignment file.")
+                raise SystemExit(1) from None
+            finally:
+                assignment_file.close()
+            print(f"Student ID: {result['student_id']}")
+            print(f"Student Name: {result['student_name']}")
+            print(f"Room: {result['room_id']} ({result['room_name']})")
+            print(f"Seat: {result['seat_id']} ({result['seat_name']})")
+            raise SystemExit(0)
+
+        # Only compute the room and seat of a student from the seed, if requested.
+        if arguments.compute_seat is not None:
+            Main.apply_allocation_arguments(arguments)
+            try:
+                result = permutation.PermutationRandomizer.compute_seat(
+                    arguments.compute_seat, arguments.seed
+                )
+            except KeyError:
+                print(
+                    f"Student {arguments.compute_seat} is not in the students database."
+                )
+                raise SystemExit(1) from None
+            print(f"Student ID: {result['student_id']}")
+            print(f"Student Name: {result['student_name']}")
+            print(f"Room: {result['room_id']} ({result['room_name']})")
+            print(f"Seat: {result['seat_id']} ({result['seat_name']})")
+            raise SystemExit(0)
+
+        # Only print the plan of all rooms without assigning any seat, if requested.
+        if arguments.plan:
+            Main.apply_allocation_arguments(arguments)
+            is_fit = planner.Planner().print_plan()
+            raise SystemExit(0 if is_fit else 1)
+
+        # Only validate the input CSV databases, if requested.
+        if arguments.check:
+            errors = validator.Validator.validate_databases()
+            for error in errors:
+                print(f"ERROR: {error}")
+            print(f"Input CSV databases validation: {len(errors)} error(s) found.")
+            raise SystemExit(1 if errors else 0)
+
+        is_run_started = True
+        main_app = Main(arguments)
+        main_app.main()
+    except validator.ValidationError as error:
+        # Report all validation errors without a traceback.
+        for message in error.errors:
+            print(f"ERROR: {message}")
+        print(error)
+        if is_run_started:
+            metrics.Metrics.write_textfile(False)
+            logs.Logs.end_logs()
+        raise SystemExit(1)
+    except (Exception, KeyboardInterrupt):
+        # Keep the recent log entries and the traceback for post-mortem analysis.
+        # In full mode, every log entry is already in the logs file.
+        if is_run_started:
+            if config.LOGS_MODE == config.LOGS_MODE_FLIGHT:
+                logs.Logs.dump_flight_recorder("EXCEPTION", traceback.format_exc())
+            metrics.Metrics.write_textfile(False)
+        raise
@@ -0,0 +1,242 @@
+# ----------------------------------------------------------------------
+# File Name     : metrics.py
+# Author        : Worralop Srichainont
+# Description   : Metrics class for exporting the counters of a run as a
+#                 Prometheus textfile for the node exporter.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+import time
+from typing import ClassVar
+
+import config
+import generator
+import logs
+
+
+class Metrics:
+    """
+    Metrics class for exporting the counters of a run as a Prometheus textfile, which
+    the textfile collector of the node exporter can scrape.
+
+    The values are taken from the counters kept by Logs and Generator during the run
+    and from the global counters, so the report file is never parsed.
+
+    Attributes:
+        PHASE_DURATIONS (dict): A dictionary mapping phase names to their durations
+        in seconds.
+    """
+
+    PHASE_DURATIONS: ClassVar[dict] = {}
+
+    @staticmethod
+    def record_phase(phase, duration):
+        """
+        Record the duration of a completed phase.
+
+        Args:
+            phase (str): The name of the completed phase.
+            duration (float): The duration of the phase in seconds.
+        """
+
+        Metrics.PHASE_DURATIONS[phase] = duration
+
+    @staticmethod
+    def get_label_name(name):
+        """
+        Convert a phase name into a label-friendly name, such as "load_students".
+
+        Args:
+            name (str): The name of the phase.
+
+        Returns:
+            str: The lower case name with underscores.
+        """
+
+        return "_".join(name.lower().split())
+
+    @staticmethod
+    def escape_label_value(value):
+        """
+        Escape a label value for the Prometheus text format.
+
+        Args:
+            value (str): The label value.
+
+        Returns:
+            str: The escaped label value.
+        """
+
+        return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @staticmethod
+    def add_metric(lines, name, metric_type, help_text, samples):
+        """
+        Add a metric with its help text, type and samples to the lines of the textfile.
+
+        Args:
+            lines (list[str]): The lines of the textfile.
+            name (str): The name of the metric without the "seat_randomizer_" prefix.
+            metric_type (str): The Prometheus type of the metric, such as "gauge".
+            help_text (str): The description of the metric.
+            samples (list[tuple]): The (labels, value) of each sample, where the labels
+            are a dictionary mapping label names to their values.
+        """
+
+        lines.append(f"# HELP seat_randomizer_{name} {help_text}")
+        lines.append(f"# TYPE seat_randomizer_{name} {metric_type}")
+        for labels, value in samples:
+            label_str = ",".join(
+                f'{key}="{Metrics.escape_label_value(label)}"'
+                for key, label in labels.items()
+            )
+            if label_str:
+                lines.append(f"seat_randomizer_{name}{{{label_str}}} {value}")
+            else:
+                lines.append(f"seat_randomizer_{name} {value}")
+
+    @staticmethod
+    def get_lines(is_success):
+        """
+        Get the lines of the Prometheus textfile from the counters of the run.
+
+        Args:
+            is_success (bool): Whether the run completed successfully.
+
+        Returns:
+            list[str]: The lines of the textfile.
+        """
+
+        # Count the rooms and seats from the rooms database, or from the room
+        # reports in sharded mode, where the main process keeps no Room object.
+        room_capacities = {
+            room_id: room_obj.capacity for room_id, room_obj in config.ROOMS_DB.items()
+        } or {
+            room_id: room_seats[0]
+            for room_id, room_seats in generator.Generator.ROOM_SEATS.items()
+        }
+
+        LINES = []
+        Metrics.add_metric(
+            LINES,
+            "last_run_success",
+            "gauge",
+            "Whether the last run completed successfully.",
+            [({}, int(is_success))],
+        )
+        Metrics.add_metric(
+            LINES,
+            "last_run_timestamp_seconds",
+            "gauge",
+            "The time when the last run ended.",
+            [({}, f"{time.time():.3f}")],
+        )
+        Metrics.add_metric(
+            LINES,
+            "phase_duration_seconds",
+            "gauge",
+            "The duration of each completed phase.",
+            [
+                ({"phase": Metrics.get_label_name(phase)}, f"{duration:.6f}")
+                for phase, duration in Metrics.PHASE_DURATIONS.items()
+            ],
+        )
+        Metrics.add_metric(
+            LINES,
+            "students_loaded",
+            "gauge",
+            "The number of students loaded.",
+            [({}, config.TOTAL_STUDENTS)],
+        )
+        Metrics.add_metric(
+            LINES,
+            "rooms_loaded",
+            "gauge",
+            "The number of rooms loaded.",
+            [({}, len(room_capacities))],
+        )
+        Metrics.add_metric(
+            LINES,
+            "seats_loaded",
+            "gauge",
+            "The number of seats loaded, including the unavailable seats.",
+            [({}, sum(room_capacities.values()))],
+        )
+        Metrics.add_metric(
+            LINES,
+            "available_seats",
+            "gauge",
+            "The total available seats of all rooms.",
+            [({}, config.TOTAL_AVAILABLE_SEATS)],
+        )
+        Metrics.add_metric(
+            LINES,
+            "room_seats_assigned",
+            "gauge",
+            "The number of assigned seats of each room.",
+            [
+                ({"room_id": room_id}, room_seats[1])
+                for room_id, room_seats in sorted(
+                    generator.Generator.ROOM_SEATS.items()
+                )
+            ],
+        )
+        Metrics.add_metric(
+            LINES,
+            "room_seats_unassigned",
+            "gauge",
+            "The number of available seats without a student of each room.",
+            [
+                ({"room_id": room_id}, room_seats[2])
+                for room_id, room_seats in sorted(
+                    generator.Generator.ROOM_SEATS.items()
+                )
+            ],
+        )
+        Metrics.add_metric(
+            LINES,
+            "output_bytes_written",
+            "gauge",
+            "The total size in bytes of the output CSV files written.",
+            [({}, generator.Generator.OUTPUT_BYTES)],
+        )
+        Metrics.add_metric(
+            LINES,
+            "log_entries_written",
+            "gauge",
+            "The number of log entries written or recorded.",
+            [({}, logs.Logs.ENTRIES_WRITTEN)],
+        )
+
+        return LINES
+
+    @staticmethod
+    def write_textfile(is_success, output_path=None):
+        """
+        Write the metrics of the run to the Prometheus textfile atomically, so the
+        node exporter never reads a partially written file.
+
+        Args:
+            is_success (bool): Whether the run completed successfully.
+            output_path (str or None, optional): The path of the textfile.
+            Defaults to None, which uses config.METRICS_PATH.
+        """
+
+        if output_path is None:
+            output_path = config.METRICS_PATH
+
+        # Write to a temporary file in the same folder, then rename it.
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        temporary_path = f"{output_path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8", newline="\n") as output_file:
+            output_file.write("\n".join(Metrics.get_lines(is_success)) + "\n")
+        os.replace(temporary_path, output_path)
+
+        # Write logs.
+        messages = [
+            "METRICS TEXTFILE WRITTEN",
+            f"PATH = {output_path}",
+            f"SUCCESS = {is_success}",
+        ]
+        logs.Logs.write_logs(messages)
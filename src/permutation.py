@@ -0,0 +1,326 @@
+# ----------------------------------------------------------------------
+# File Name     : permutation.py
+# Author        : Worralop Srichainont
+# Description   : FeistelPermutation and PermutationRandomizer classes for
+#                 computing the seat of each student directly from the seed.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import bisect
+import hashlib
+
+import config
+import logs
+import planner
+import randomizer
+import utility
+import validator
+
+
+class FeistelPermutation:
+    """
+    FeistelPermutation class for a keyed pseudorandom permutation of the indices
+    0 to size - 1, which computes the position of any index without the others.
+
+    It is a balanced Feistel network over the smallest even number of bits which
+    covers the size, with a keyed BLAKE2b round function. The indices which are
+    permuted outside the range are permuted again until they are inside it, which
+    keeps the permutation a bijection of the range.
+
+    Attributes:
+        size (int): The number of indices to permute.
+        key (bytes): The key of the round function.
+        half_bits (int): The number of bits of each half of the Feistel network.
+        half_mask (int): The bit mask of each half.
+        rounds (int): The number of rounds of the Feistel network.
+    """
+
+    def __init__(self, size, key, rounds=None):
+        """
+        Initialize a FeistelPermutation object.
+
+        Args:
+            size (int): The number of indices to permute.
+            key (bytes): The key of the round function, up to 64 bytes.
+            rounds (int or None, optional): The number of rounds of the Feistel network.
+            Defaults to None, which uses config.FEISTEL_ROUNDS.
+        """
+
+        # Initialize attributes.
+        self.size = size
+        self.key = key
+        self.half_bits = max(1, (max(size - 1, 1).bit_length() + 1) // 2)
+        self.half_mask = (1 << self.half_bits) - 1
+        self.rounds = rounds or config.FEISTEL_ROUNDS
+
+    @staticmethod
+    def get_key(seed, label):
+        """
+        Derive the key of a permutation from the seed and the label of the permutation.
+
+        Args:
+            seed (float or int or str): The seed of the seating arrangement.
+            label (str): The label of the permutation, such as "STUDENTS".
+
+        Returns:
+            bytes: The 32-byte key.
+        """
+
+        return hashlib.blake2b(f"{seed}\0{label}".encode(), digest_size=32).digest()
+
+    def permute_once(self, index):
+        """
+        Permute an index with one pass of the Feistel network over all bits.
+
+        Args:
+            index (int): The index to permute.
+
+        Returns:
+            int: The permuted index, which may be outside the range.
+        """
+
+        left = index >> self.half_bits
+        right = index & self.half_mask
+        for round_idx in range(self.rounds):
+            digest = hashlib.blake2b(
+                round_idx.to_bytes(1, "little") + right.to_bytes(8, "little"),
+                key=self.key,
+                digest_size=8,
+            ).digest()
+            left, right = right, left ^ (
+                int.from_bytes(digest, "little") & self.half_mask
+            )
+        return (left << self.half_bits) | right
+
+    def permute(self, index):
+        """
+        Get the position of an index in the permutation.
+
+        Args:
+            index (int): The index to permute, from 0 to size - 1.
+
+        Returns:
+            int: The permuted index, from 0 to size - 1.
+        """
+
+        if not 0 <= index < self.size:
+            raise IndexError(index)
+
+        # Walk the cycle of the index until it is inside the range.
+        index = self.permute_once(index)
+        while index >= self.size:
+            index = self.permute_once(index)
+        return index
+
+
+class PermutationRandomizer(randomizer.Randomizer):
+    """
+    PermutationRandomizer class for randomizing seat assignments with keyed permutations,
+    so the seat of any student can be computed directly from the seed.
+
+    In random mode, the student at index i of the sorted student IDs is placed at the
+    position of i in the students permutation of the partition, and the student at
+    offset k of a room gets the available seat at the position of k in the seats
+    permutation of the room. Both permutations are derived from the seed, so the seat
+    of a student only needs the seed, the sorted student IDs, the partition and the
+    available seats of its room. Pinned students are not supported.
+
+    Attributes:
+        Inherits all attributes from Randomizer.
+    """
+
+    def apply_pins(self):
+        """
+        Check that there is no pinned student, which is not supported with permutations.
+
+        Raises:
+            ValidationError: If there is any pinned student.
+        """
+
+        if self.get_pins():
+            raise validator.ValidationError(
+                ["pins.csv: pinned students are not supported in permutation mode."]
+            )
+        super().apply_pins()
+
+    def shuffle_student_ids(self, student_ids):
+        """
+        Place each sorted student ID at its position in the students permutation
+        if random mode is enabled.
+
+        Args:
+            student_ids (list): The sorted student IDs.
+
+        Returns:
+            list: The student IDs in the order of the partition.
+        """
+
+        if not self.is_random_mode:
+            return student_ids
+
+        students_permutation = FeistelPermutation(
+            len(student_ids), FeistelPermutation.get_key(self.seed, "STUDENTS")
+        )
+        PERMUTED_IDS = [None] * len(student_ids)
+        for idx, student_id in enumerate(student_ids):
+            PERMUTED_IDS[students_permutation.permute(idx)] = student_id
+
+        # Write logs.
+        logs.Logs.write_logs(["ALL STUDENT IDs PERMUTED"])
+
+        return PERMUTED_IDS
+
+    def select_occupied_seats(self, room_id, room_obj):
+        """
+        Select the seat of each student of a room with the seats permutation of the
+        room if random mode is enabled, then order the students of the room by their
+        seat IDs, as the seats are assigned to the students in the order of seat IDs.
+
+        Args:
+            room_id (str): The ID of the room.
+            room_obj (Room): The Room object with its assigned students.
+        """
+
+        if not self.is_random_mode:
+            super().select_occupied_seats(room_id, room_obj)
+            return
+
+        # Get the seat of the student at each offset of the room.
+        seats_permutation = FeistelPermutation(
+            len(room_obj.available_seats_id),
+            FeistelPermutation.get_key(self.seed, f"ROOM {room_id}"),
+        )
+        STUDENT_SEATS = sorted(
+            (room_obj.available_seats_id[seats_permutation.permute(offset)], student_id)
+            for offset, student_id in enumerate(room_obj.students)
+        )
+        room_obj.students = {
+            student_id: room_obj.students[student_id] for _, student_id in STUDENT_SEATS
+        }
+        room_obj.set_occupied_seats([seat_id for seat_id, _ in STUDENT_SEATS])
+
+        # Write logs.
+        messages = [
+            "OCCUPIED SEATS ID SELECTED",
+            f"ROOM ID = {room_id}",
+            f"OCCUPIED SEATS = {len(room_obj.occupied_seats_id)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def get_seat_position(seed, student_idx, total_students, partitioned_amount):
+        """
+        Compute the room of a student and the offset of the student in the room,
+        from the seed and the partition only.
+
+        Args:
+            seed (float or int or str): The seed of the seating arrangement.
+            student_idx (int): The index of the student in the sorted student IDs.
+            total_students (int): The number of students.
+            partitioned_amount (dict): A dictionary mapping room IDs to the number of
+            students assigned, in the order of the rooms database.
+
+        Returns:
+            tuple: The room ID, and the offset of the student in the room, which the
+            seats permutation of the room maps to the position of its seat among the
+            available seats of the room.
+        """
+
+        # Get the student's position in the partition, and the start of each room.
+        position = FeistelPermutation(
+            total_students, FeistelPermutation.get_key(seed, "STUDENTS")
+        ).permute(student_idx)
+        room_ids = list(partitioned_amount)
+        room_starts = []
+        total_amount = 0
+        for room_id in room_ids:
+            room_starts.append(total_amount)
+            total_amount += partitioned_amount[room_id]
+        # The rooms without students start at the same position as the next room,
+        # so the last room which starts at or before the position has the student.
+        room_idx = bisect.bisect_right(room_starts, position) - 1
+        return room_ids[room_idx], position - room_starts[room_idx]
+
+    @staticmethod
+    def compute_seat(student_id, seed):
+        """
+        Compute the room and seat of a student in random permutation mode, only reading
+        the student IDs, the counts of available seats, and the seats of its room.
+
+        Args:
+            student_id (str): The ID of the student.
+            seed (str): The seed of the seating arrangement.
+
+        Returns:
+            dict: The student ID, student name, room ID, room name, seat ID and
+            seat name of the student.
+
+        Raises:
+            KeyError: If the student is not in the students database.
+            ValidationError: If there is any pinned student, or the students do not fit.
+        """
+
+        # Count the students and the available seats of each room.
+        room_planner = planner.Planner()
+        if room_planner.total_pins:
+            raise validator.ValidationError(
+                ["pins.csv: pinned students are not supported in permutation mode."]
+            )
+        available_seats = {
+            room_id: room_available_seats
+            for room_id, _, _, room_available_seats in room_planner.rooms
+        }
+        total_available_seats = sum(available_seats.values())
+        if room_planner.total_students > total_available_seats:
+            message = (
+                f"Total students ({room_planner.total_students}) are more than "
+                f"total available seats ({total_available_seats})."
+            )
+            raise validator.ValidationError([message])
+
+        # Find the index of the student in the sorted student IDs.
+        STUDENT_NAMES = dict(
+            row for chunk in utility.Utility.read_students_chunks() for row in chunk
+        )
+        student_ids = sorted(STUDENT_NAMES)
+        student_idx = bisect.bisect_left(student_ids, student_id)
+        if student_idx == len(student_ids) or student_ids[student_idx] != student_id:
+            raise KeyError(student_id)
+
+        # Partition the students to the rooms as in the seating arrangement.
+        partitioned_amount = randomizer.Randomizer.partition_seat_amount(
+            randomizer.Randomizer.allocate_rooms(available_seats, len(student_ids)),
+            len(student_ids),
+        )
+        room_id, offset = PermutationRandomizer.get_seat_position(
+            seed, student_idx, len(student_ids), partitioned_amount
+        )
+
+        # Read the seats of the room only, then find the seat of the offset.
+        seat_ids, seat_names, seat_availability = utility.Utility.get_seat_arrays(
+            room_id
+        )
+        available_positions = [
+            position
+            for position, is_available in enumerate(seat_availability)
+            if is_available
+        ]
+        seat_position = available_positions[
+            FeistelPermutation(
+                len(available_positions),
+                FeistelPermutation.get_key(seed, f"ROOM {room_id}"),
+            ).permute(offset)
+        ]
+
+        return {
+            "student_id": student_id,
+            "student_name": STUDENT_NAMES[student_id],
+            "room_id": room_id,
+            "room_name": next(
+                room_name
+                for row_id, room_name, _, _ in room_planner.rooms
+                if row_id == room_id
+            ),
+            "seat_id": seat_ids[seat_position],
+            "seat_name": seat_names[seat_position],
+        }
@@ -0,0 +1,166 @@
+# ----------------------------------------------------------------------
+# File Name     : pipeline.py
+# Author        : Worralop Srichainont
+# Description   : Pipeline class for running the seating arrangement with
+#                 overlapping input parsing, seat assignment and output
+#                 writing.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import asyncio
+import concurrent.futures
+
+import config
+import generator
+import logs
+import utility
+
+
+class Pipeline:
+    """
+    Pipeline class for running the seating arrangement with asyncio, overlapping the
+    input parsing, seat assignment and output writing of different rooms.
+
+    The seat files are parsed in worker threads while the students are loaded.
+    Then the rooms are assigned one by one in the order of ROOMS_DB, exactly like
+    the sequential mode, and each room's output CSV file is written in a worker thread
+    as soon as the room is assigned. So the outputs are the same as the sequential mode
+    for the same seed.
+
+    Attributes:
+        randomizer (Randomizer): The randomizer used to assign seats to students.
+        workers (int): The number of worker threads.
+    """
+
+    def __init__(self, randomizer, workers=config.PIPELINE_WORKERS):
+        """
+        Initialize a Pipeline object.
+
+        Args:
+            randomizer (Randomizer): The randomizer used to assign seats to students.
+            workers (int, optional): The number of worker threads.
+            Defaults to config.PIPELINE_WORKERS.
+        """
+
+        # Initialize attributes.
+        self.randomizer = randomizer
+        self.workers = workers
+
+        # Write logs.
+        messages = ["PIPELINE OBJECT CREATED", f"WORKERS = {self.workers}"]
+        logs.Logs.write_logs(messages)
+
+    def run(self):
+        """
+        Run the whole pipeline until all output files are written.
+        """
+
+        asyncio.run(self.run_async())
+
+    async def run_async(self):
+        """
+        Run the whole pipeline in the asyncio event loop.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["run_async() CALLED"])
+
+        loop = asyncio.get_running_loop()
+        with concurrent.futures.ThreadPoolExecutor(self.workers) as executor:
+            # Load the students and parse the seat files at the same time.
+            await self.load_databases(loop, executor)
+
+            # Assign each room and write its output CSV file as soon as it is assigned.
+            room_results = await self.assign_and_write_rooms(loop, executor)
+
+        # The students output needs every room, so it is generated at the end.
+        generator.Generator.generate_output_students_csv()
+
+        # Write the reports of all rooms in the same order as the sequential mode.
+        generator.Generator.write_all_rooms_report_header()
+        for room_id, room_obj in sorted(config.ROOMS_DB.items()):
+            assigned_amount, unassigned_seats = room_results[room_id]
+            generator.Generator.write_room_report(
+                room_obj, assigned_amount, unassigned_seats
+            )
+
+    async def load_databases(self, loop, executor):
+        """
+        Load the students database and the rooms database concurrently,
+        and store them in the global variables.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+            executor (concurrent.futures.Executor): The executor for the worker threads.
+        """
+
+        # Start loading the students database in a worker thread.
+        students_future = loop.run_in_executor(
+            executor, utility.Utility.get_students_database
+        )
+
+        # Parse the seat files of all rooms in worker threads.
+        rooms_frame = utility.Utility.read_rooms_csv()
+        rooms = list(rooms_frame.itertuples())
+        seat_arrays_list = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    executor, utility.Utility.get_seat_arrays, row.room_id
+                )
+                for row in rooms
+            )
+        )
+
+        # Create the Room objects in the same order as the rooms CSV file.
+        for row, seat_arrays in zip(rooms, seat_arrays_list):
+            config.ROOMS_DB[row.room_id] = utility.Utility.create_room(
+                row.room_id, row.room_name, row.capacity, seat_arrays
+            )
+
+        # Read the optional pin database.
+        utility.Utility.get_pins_database()
+
+        # Wait until the students database is loaded.
+        await students_future
+
+        # Write logs.
+        messages = [
+            "DATABASES LOADED IN PIPELINE",
+            f"TOTAL STUDENTS = {config.TOTAL_STUDENTS}",
+            f"TOTAL ROOMS = {len(config.ROOMS_DB)}",
+            f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+            f"TOTAL PINS = {len(config.PINS_DB)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    async def assign_and_write_rooms(self, loop, executor):
+        """
+        Assign seats in each room, and write each room's output CSV file in a worker
+        thread while the next rooms are being assigned.
+
+        Args:
+            loop (asyncio.AbstractEventLoop): The running event loop.
+            executor (concurrent.futures.Executor): The executor for the worker threads.
+
+        Returns:
+            dict: A dictionary mapping room IDs to the results of write_room_csv().
+        """
+
+        # The partition needs the total students and the total available seats.
+        self.randomizer.partition_students()
+
+        # Assign the rooms in the order of ROOMS_DB, so the random draws stay in order.
+        write_futures = {}
+        for room_id, room_obj in config.ROOMS_DB.items():
+            self.randomizer.select_occupied_seats(room_id, room_obj)
+            self.randomizer.assign_room_seats(room_id, room_obj)
+            write_futures[room_id] = loop.run_in_executor(
+                executor, generator.Generator.write_room_csv, room_obj
+            )
+
+            # Let the event loop handle the completed writes.
+            await asyncio.sleep(0)
+
+        # Wait until all output CSV files are written.
+        results = await asyncio.gather(*write_futures.values())
+        return dict(zip(write_futures.keys(), results))
@@ -0,0 +1,261 @@
+# ----------------------------------------------------------------------
+# File Name     : planner.py
+# Author        : Worralop Srichainont
+# Description   : Planner class for planning the partition of students to
+#                 all rooms without assigning any seat.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import csv
+import os
+
+import config
+import logs
+import randomizer
+
+
+class Planner:
+    """
+    Planner class for planning the number of students of each room and the seat
+    utilisation of all rooms, without assigning any seat or writing any output.
+
+    It only reads the columns it needs from the CSV databases with the csv module, and
+    counts the students and the available seats, so no Student, Room or Seat object
+    is created. The log entries are kept in memory only.
+
+    Attributes:
+        rooms (list[tuple]): The (room ID, room name, capacity, available seats) of
+        each room, in the order of the rooms database.
+        total_students (int): The number of students in the students database.
+        pinned_seats (dict): A dictionary mapping room IDs to their number of
+        pinned seats.
+        room_pins (dict): A dictionary mapping room IDs to their number of students
+        pinned to the room without a seat.
+        total_pins (int): The number of pinned students.
+    """
+
+    def __init__(self):
+        """
+        Initialize a Planner object by counting the students, the pins and the
+        available seats of each room.
+        """
+
+        # Keep the log entries in memory, so the logs of the previous run are kept.
+        config.LOGS_MODE = config.LOGS_MODE_FLIGHT
+
+        # Initialize attributes.
+        self.rooms = []
+        self.total_students = Planner.count_students()
+        self.pinned_seats = {}
+        self.room_pins = {}
+        self.total_pins = 0
+        self.count_pins()
+        with open(config.ROOMS_PATH, encoding="utf-8-sig", newline="") as rooms_file:
+            for row in csv.DictReader(rooms_file):
+                self.rooms.append(
+                    (
+                        row["room_id"],
+                        row["room_name"],
+                        int(row["capacity"]),
+                        Planner.count_available_seats(row["room_id"]),
+                    )
+                )
+
+        # Write logs.
+        messages = [
+            "PLANNER OBJECT CREATED",
+            f"TOTAL STUDENTS = {self.total_students}",
+            f"TOTAL ROOMS = {len(self.rooms)}",
+            f"TOTAL PINS = {self.total_pins}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def count_students():
+        """
+        Count the students in the students CSV database file without parsing the rows.
+
+        Returns:
+            int: The number of non-empty rows after the header.
+        """
+
+        with open(config.STUDENTS_PATH, "rb") as students_file:
+            return max(sum(1 for line in students_file if line.strip()) - 1, 0)
+
+    def count_pins(self):
+        """
+        Count the pinned seats and the room-only pins of each room in the optional
+        pin CSV database file.
+        """
+
+        # The pin database is optional.
+        if not os.path.exists(config.PINS_PATH):
+            return
+
+        with open(config.PINS_PATH, encoding="utf-8-sig", newline="") as pins_file:
+            for row in csv.DictReader(pins_file):
+                pins = self.room_pins if not row["seat_id"] else self.pinned_seats
+                pins[row["room_id"]] = pins.get(row["room_id"], 0) + 1
+                self.total_pins += 1
+
+    @staticmethod
+    def count_available_seats(room_id):
+        """
+        Count the available seats in the seats CSV file of a room, reading only
+        the is_available column.
+
+        Args:
+            room_id (str): The unique identifier for the room.
+
+        Returns:
+            int: The number of available seats.
+        """
+
+        seats_path = os.path.join(config.SEATS_PATH, f"{room_id}.csv")
+        with open(seats_path, encoding="utf-8-sig", newline="") as seats_file:
+            reader = csv.reader(seats_file)
+            column = next(reader).index("is_available")
+            return sum(
+                1 for row in reader if row and row[column].strip().lower() == "true"
+            )
+
+    def get_plan(self):
+        """
+        Get the planned number of students of each room with the room allocation and
+        the partition of the seating arrangement.
+
+        Returns:
+            dict: A dictionary mapping room IDs to their (available seats, planned
+            students), including the pinned students. If the students do not fit,
+            every room is planned to be full.
+        """
+
+        # Get the number of available seats of each room, and the number of students,
+        # without the pinned seats and the pinned students, as in the partition
+        # of the seating arrangement.
+        available_seats = {
+            room_id: room_available_seats
+            - self.pinned_seats.get(room_id, 0)
+            - self.room_pins.get(room_id, 0)
+            for room_id, _, _, room_available_seats in self.rooms
+        }
+        total_students = self.total_students - self.total_pins
+        if total_students <= sum(available_seats.values()):
+            pinned_amounts = {
+                room_id: self.pinned_seats.get(room_id, 0)
+                + self.room_pins.get(room_id, 0)
+                for room_id in set(self.pinned_seats) | set(self.room_pins)
+            }
+            partitioned_amount = randomizer.Randomizer.partition_seat_amount(
+                randomizer.Randomizer.allocate_rooms(
+                    available_seats, total_students, pinned_amounts
+                ),
+                total_students,
+            )
+        else:
+            partitioned_amount = available_seats
+
+        return {
+            room_id: (
+                room_available_seats,
+                partitioned_amount[room_id]
+                + self.pinned_seats.get(room_id, 0)
+                + self.room_pins.get(room_id, 0),
+            )
+            for room_id, _, _, room_available_seats in self.rooms
+        }
+
+    def print_plan(self):
+        """
+        Print the plan table of all rooms, with the rooms near their capacity,
+        and whether all students fit.
+
+        Returns:
+            bool: Whether all students fit in the available seats.
+        """
+
+        plan = self.get_plan()
+        total_available_seats = sum(
+            room_available_seats for room_available_seats, _ in plan.values()
+        )
+        is_fit = self.total_students <= total_available_seats
+
+        # Print the table.
+        print("-" * 88)
+        print(
+            f"{'Room ID':<16}{'Room Name':<24}{'Capacity':>10}{'Available':>11}"
+            f"{'Planned':>10}{'Utilisation':>14}"
+        )
+        for room_id, room_name, capacity, _ in self.rooms:
+            room_available_seats, planned_students = plan[room_id]
+            utilisation = Planner.get_utilisation(plan[room_id])
+            near_capacity = "  *" if Planner.is_near_capacity(plan[room_id]) else ""
+            print(
+                f"{room_id:<16}{room_name:<24}{capacity:>10}{room_available_seats:>11}"
+                f"{planned_students:>10}{utilisation:>14.1%}{near_capacity}"
+            )
+        total_utilisation = (
+            min(self.total_students, total_available_seats) / total_available_seats
+            if total_available_seats
+            else 0.0
+        )
+        print(
+            f"{'TOTAL':<40}{sum(room[2] for room in self.rooms):>10}"
+            f"{total_available_seats:>11}"
+            f"{min(self.total_students, total_available_seats):>10}"
+            f"{total_utilisation:>14.1%}"
+        )
+        print("-" * 88)
+
+        # Print the summary.
+        print(f"Total Students: {self.total_students}")
+        print(f"Total Available Seats: {total_available_seats}")
+        print(
+            f"Opened Rooms: "
+            f"{sum(1 for _, planned_students in plan.values() if planned_students)} "
+            f"of {len(plan)}"
+        )
+        print(
+            f"Rooms Near Capacity (*): "
+            f"{sum(1 for room_id in plan if Planner.is_near_capacity(plan[room_id]))}"
+        )
+        if is_fit:
+            print(
+                f"All students fit, with {total_available_seats - self.total_students} seats left."
+            )
+        else:
+            print(
+                f"The students do not fit, {self.total_students - total_available_seats} "
+                "students have no seat."
+            )
+
+        return is_fit
+
+    @staticmethod
+    def is_near_capacity(room_plan):
+        """
+        Check whether a room is planned to be near its capacity.
+
+        Args:
+            room_plan (tuple): The (available seats, planned students) of the room.
+
+        Returns:
+            bool: Whether the utilisation of the room reaches PLAN_NEAR_CAPACITY_RATIO.
+        """
+
+        return Planner.get_utilisation(room_plan) >= config.PLAN_NEAR_CAPACITY_RATIO
+
+    @staticmethod
+    def get_utilisation(room_plan):
+        """
+        Get the ratio of the planned students to the available seats of a room.
+
+        Args:
+            room_plan (tuple): The (available seats, planned students) of the room.
+
+        Returns:
+            float: The utilisation ratio, or 0.0 if the room has no available seat.
+        """
+
+        room_available_seats, planned_students = room_plan
+        return planned_students / room_available_seats if room_available_seats else 0.0
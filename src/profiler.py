@@ -0,0 +1,223 @@
+# ----------------------------------------------------------------------
+# File Name     : profiler.py
+# Author        : Worralop Srichainont
+# Description   : MemoryProfiler class for measuring the memory used by
+#                 each phase of the seating arrangement with tracemalloc.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import json
+import os
+import time
+import tracemalloc
+
+import config
+import logs
+
+
+class MemoryProfiler:
+    """
+    MemoryProfiler class for measuring the memory used by each phase of the seating
+    arrangement with tracemalloc.
+
+    A snapshot is taken at the end of each phase, and only its totals of each source
+    line are kept, so the snapshot itself is not counted in the next phases. The peak
+    memory is the highest traced memory during the phase, the retained memory is the
+    traced memory at its end, and the top allocation sites are the source lines whose
+    retained memory grew the most since the previous phase. Only the memory of the main
+    process is traced.
+
+    Attributes:
+        top_amount (int): The number of top allocation sites kept for each phase.
+        phases (list[dict]): The measurements of each completed phase.
+        statistics (dict): A dictionary mapping the (file name, line number) of each
+        allocation site to its (size, count) at the end of the previous phase.
+    """
+
+    def __init__(self, top_amount=config.MEMORY_PROFILE_TOP_AMOUNT):
+        """
+        Initialize a MemoryProfiler object, and start tracing the memory allocations.
+
+        Args:
+            top_amount (int, optional): The number of top allocation sites kept for
+            each phase. Defaults to config.MEMORY_PROFILE_TOP_AMOUNT.
+        """
+
+        # Initialize attributes.
+        self.top_amount = top_amount
+        self.phases = []
+        self.statistics = {}
+
+        # Start tracing, and take the first statistics before any phase.
+        tracemalloc.start()
+        self.statistics = MemoryProfiler.take_statistics()
+
+        # Write logs.
+        messages = ["MEMORY PROFILER STARTED", f"TOP AMOUNT = {self.top_amount}"]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def take_statistics():
+        """
+        Take a snapshot of the traced memory allocations, without the allocations
+        of tracemalloc itself and of the import system, and keep only the totals
+        of each source line.
+
+        Returns:
+            dict: A dictionary mapping the (file name, line number) of each
+            allocation site to its (size, count).
+        """
+
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+                tracemalloc.Filter(False, "<unknown>"),
+            ]
+        )
+        return {
+            (stat.traceback[0].filename, stat.traceback[0].lineno): (
+                stat.size,
+                stat.count,
+            )
+            for stat in snapshot.statistics("lineno")
+        }
+
+    def record_phase(self, phase):
+        """
+        Record the peak and retained memory and the top allocation sites of a
+        completed phase, then start measuring the next phase.
+
+        Args:
+            phase (str): The name of the completed phase.
+        """
+
+        # Read the peak before the snapshot, and the retained memory after the snapshot
+        # and the previous statistics are released, so neither includes them.
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        statistics = MemoryProfiler.take_statistics()
+
+        # Find the source lines whose retained memory grew the most during the phase,
+        # in the same order as tracemalloc.Snapshot.compare_to().
+        SITE_DIFFS = []
+        for site in statistics.keys() | self.statistics.keys():
+            size, count = statistics.get(site, (0, 0))
+            previous_size, previous_count = self.statistics.get(site, (0, 0))
+            SITE_DIFFS.append(
+                (size - previous_size, size, count - previous_count, count, site)
+            )
+        SITE_DIFFS.sort(
+            key=lambda diff: (abs(diff[0]), diff[1], abs(diff[2]), diff[3], diff[4]),
+            reverse=True,
+        )
+
+        TOP_SITES = []
+        for size_diff, size, count_diff, count, site in SITE_DIFFS[: self.top_amount]:
+            filename, lineno = site
+            if filename.startswith(config.ROOT_PATH):
+                filename = os.path.relpath(filename, config.ROOT_PATH)
+            TOP_SITES.append(
+                {
+                    "site": f"{filename}:{lineno}",
+                    "size_bytes": size,
+                    "size_diff_bytes": size_diff,
+                    "count": count,
+                    "count_diff": count_diff,
+                }
+            )
+        del SITE_DIFFS
+        self.statistics = statistics
+        retained_bytes, _ = tracemalloc.get_traced_memory()
+
+        self.phases.append(
+            {
+                "phase": phase,
+                "peak_bytes": peak_bytes,
+                "retained_bytes": retained_bytes,
+                "top_sites": TOP_SITES,
+            }
+        )
+        tracemalloc.reset_peak()
+
+        # Write logs.
+        messages = [
+            "MEMORY PROFILE RECORDED",
+            f"PHASE = {phase}",
+            f"PEAK BYTES = {peak_bytes}",
+            f"RETAINED BYTES = {retained_bytes}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def format_size(size):
+        """
+        Format a number of bytes as kibibytes.
+
+        Args:
+            size (int): The number of bytes.
+
+        Returns:
+            str: The formatted size.
+        """
+
+        return f"{size / 1024:,.1f} KiB"
+
+    def write_outputs(self, output_path=None):
+        """
+        Stop tracing, then write the memory profile of all phases to the report file
+        and to a JSON file.
+
+        Args:
+            output_path (str or None, optional): The path of the JSON file.
+            Defaults to None, which uses config.MEMORY_PROFILE_PATH.
+        """
+
+        tracemalloc.stop()
+        if output_path is None:
+            output_path = config.MEMORY_PROFILE_PATH
+
+        # Write the JSON file, so the profiles of different cohort sizes can be compared.
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "w", encoding="utf-8") as output_file:
+            json.dump(
+                {
+                    "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+                    "total_students": config.TOTAL_STUDENTS,
+                    "total_rooms": len(config.ROOMS_DB),
+                    "total_available_seats": config.TOTAL_AVAILABLE_SEATS,
+                    "phases": self.phases,
+                },
+                output_file,
+                indent=2,
+            )
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Memory profile of each phase.")
+        logs.Logs.write_report(f"{'Phase':<40}{'Peak':>24}{'Retained':>24}")
+        for phase in self.phases:
+            logs.Logs.write_report(
+                f"{phase['phase']:<40}"
+                f"{MemoryProfiler.format_size(phase['peak_bytes']):>24}"
+                f"{MemoryProfiler.format_size(phase['retained_bytes']):>24}"
+            )
+        for phase in self.phases:
+            logs.Logs.write_report(f"Top allocation sites of {phase['phase']}:")
+            for site in phase["top_sites"]:
+                logs.Logs.write_report(
+                    f"  {site['site']}: "
+                    f"{MemoryProfiler.format_size(site['size_diff_bytes'])} "
+                    f"in {site['count_diff']} blocks"
+                )
+        logs.Logs.write_report(f"Memory profile saved to {output_path}")
+        logs.Logs.write_report("-" * 88)
+
+        # Write logs.
+        messages = [
+            "MEMORY PROFILE WRITTEN",
+            f"PATH = {output_path}",
+            f"TOTAL PHASES = {len(self.phases)}",
+        ]
+        logs.Logs.write_logs(messages)
@@ -6,6 +6,7 @@
 # Date          : 2025-10-13
 # ----------------------------------------------------------------------
 
+import math
 import random
 import time
 
@@ -20,20 +21,45 @@ class Randomizer:
     Attributes:
         is_random_mode_enable (bool): Flag to enable or disable random mode.
         seed (float or int or str): Seed value for random number generation.
+        random (random.Random): The random number generator of this randomizer.
+        rooms_db (dict or None): The rooms to assign, or None to use the global ROOMS_DB.
+        students_db (dict or None): The students to assign, or None to use the global STUDENTS_DB.
+        pins (dict or None): The pinned students, or None to use the global PINS_DB.
+        pinned_seats (dict): A dictionary mapping room IDs to their pinned seats,
+        each mapping a seat ID to its pinned student ID.
+        room_pins (dict): A dictionary mapping room IDs to the IDs of the students
+        pinned to the room without a specific seat.
     """
 
-    def __init__(self, is_random_mode=True, seed=time.time()):
+    def __init__(
+        self,
+        is_random_mode=True,
+        seed=time.time(),
+        rooms_db=None,
+        students_db=None,
+        pins=None,
+    ):
         """
         Initialize Randomizer object with random mode flag and seed value.
 
         Args:
             is_random_mode_enable (bool, optional): Flag to enable or disable random mode. Defaults to True.
             seed (float or int or str, optional): Seed value for random number generation. Defaults to time.time().
+            rooms_db (dict or None, optional): The rooms to assign. Defaults to None, which uses the global ROOMS_DB.
+            students_db (dict or None, optional): The students to assign. Defaults to None, which uses the global STUDENTS_DB.
+            pins (dict or None, optional): A dictionary mapping student IDs to their pinned (room ID, seat ID or None).
+            Defaults to None, which uses the global PINS_DB.
         """
 
         # Initialize attributes.
         self.is_random_mode = is_random_mode
         self.seed = seed
+        self.random = random.Random()
+        self.rooms_db = rooms_db
+        self.students_db = students_db
+        self.pins = pins
+        self.pinned_seats = {}
+        self.room_pins = {}
 
         # Write logs.
         messages = [
@@ -44,11 +70,81 @@ class Randomizer:
         logs.Logs.write_logs(messages)
 
         # Set the random seed for reproducibility.
-        random.seed(self.seed)
+        self.reset_seed()
+
+    def reset_seed(self):
+        """
+        Set the random seed again, so the next assignment gives the same result
+        as the first assignment for the same databases.
+        """
+
+        self.random.seed(self.seed)
 
         # Write logs.
         logs.Logs.write_logs(["RANDOM SEED SET"])
 
+    def get_rooms_db(self):
+        """
+        Get the rooms to assign.
+
+        Returns:
+            dict: The rooms of this randomizer, or the global ROOMS_DB.
+        """
+
+        return config.ROOMS_DB if self.rooms_db is None else self.rooms_db
+
+    def get_students_db(self):
+        """
+        Get the students to assign.
+
+        Returns:
+            dict: The students of this randomizer, or the global STUDENTS_DB.
+        """
+
+        return config.STUDENTS_DB if self.students_db is None else self.students_db
+
+    def get_pins(self):
+        """
+        Get the pinned students.
+
+        Returns:
+            dict: The pins of this randomizer, or the global PINS_DB.
+        """
+
+        return config.PINS_DB if self.pins is None else self.pins
+
+    def apply_pins(self):
+        """
+        Place the pinned students first, in their pinned rooms, and index the pinned
+        seats and the room-only pins of each room.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["apply_pins() CALLED"])
+
+        rooms_db = self.get_rooms_db()
+        students_db = self.get_students_db()
+        self.pinned_seats = {}
+        self.room_pins = {}
+        for student_id, (room_id, seat_id) in sorted(self.get_pins().items()):
+            # Set the Student object's room attribute to the pinned Room object.
+            students_db[student_id].room = rooms_db[room_id]
+
+            # Keep the pinned seat, or the room-only pin.
+            if seat_id is None:
+                self.room_pins.setdefault(room_id, []).append(student_id)
+            else:
+                self.pinned_seats.setdefault(room_id, {})[seat_id] = student_id
+
+            # Write logs.
+            messages = [
+                "PINNED STUDENT ASSIGNED TO ROOM",
+                f"STUDENT ID = {student_id}",
+                f"ROOM ID = {room_id}",
+                f"SEAT ID = {seat_id if seat_id is not None else 'ANY'}",
+            ]
+            logs.Logs.write_logs(messages)
+
     def assign_seats_to_students(self):
         """
         Assign seats to students based on the randomized seating arrangement.
@@ -60,39 +156,70 @@ class Randomizer:
         self.get_occupied_seats_id()
 
         # Then, for each room, assign the selected seat IDs to the assigned students.
-        for room_id, room_obj in config.ROOMS_DB.items():
-            # Get the occupied seat IDs in sorted order.
-            occupied_seats_id = sorted(room_obj.occupied_seats_id)
+        for room_id, room_obj in self.get_rooms_db().items():
+            self.assign_room_seats(room_id, room_obj)
 
-            # Get the students assigned to the current room.
-            students = list(room_obj.students.values())
+    def assign_room_seats(self, room_id, room_obj):
+        """
+        Assign the occupied seat IDs of a room to the students assigned to the room.
+
+        Args:
+            room_id (str): The ID of the room.
+            room_obj (Room): The Room object with its students and occupied seat IDs.
+        """
+
+        # Get the occupied seat IDs in sorted order, without the pinned seats.
+        pinned_seats = self.pinned_seats.get(room_id, {})
+        occupied_seats_id = [
+            seat_id
+            for seat_id in sorted(room_obj.occupied_seats_id)
+            if seat_id not in pinned_seats
+        ]
+
+        # Get the students assigned to the current room, without the students of the pinned seats.
+        pinned_student_ids = set(pinned_seats.values())
+        students = [
+            student_obj
+            for student_id, student_obj in room_obj.students.items()
+            if student_id not in pinned_student_ids
+        ]
+
+        # Place the students of the pinned seats first.
+        students_db = self.get_students_db()
+        for seat_id, student_id in sorted(pinned_seats.items()):
+            current_seat = room_obj.get_seat(seat_id)
+            current_seat.student = students_db[student_id]
+            students_db[student_id].seat = current_seat
+
+        # Write logs.
+        messages = [
+            "SEATS ASSIGNED TO STUDENTS IN ROOM",
+            f"ROOM ID = {room_id}",
+            f"ASSIGNED STUDENTS = {len(students)}",
+            f"OCCUPIED SEATS = {len(occupied_seats_id)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        # Assign each occupied seat ID to the corresponding student in the room.
+        for idx, seat_id in enumerate(occupied_seats_id):
+            # Get the Seat object, which is only created for the occupied seats.
+            current_seat = room_obj.get_seat(seat_id)
+
+            # Set the Seat object's student attribute to the Student object.
+            current_seat.student = students[idx]
+
+            # Set the Student object's seat attribute to the Seat object.
+            students[idx].seat = current_seat
 
             # Write logs.
             messages = [
-                "SEATS ASSIGNED TO STUDENTS IN ROOM",
+                "SEAT ASSIGNED TO STUDENT",
+                f"STUDENT ID = {students[idx].student_id}",
                 f"ROOM ID = {room_id}",
-                f"ASSIGNED STUDENTS = {len(students)}",
-                f"OCCUPIED SEATS = {len(occupied_seats_id)}",
+                f"SEAT ID = {seat_id}",
             ]
             logs.Logs.write_logs(messages)
 
-            # Assign each occupied seat ID to the corresponding student in the room.
-            for idx, seat_id in enumerate(occupied_seats_id):
-                # Set the Seat object's student attribute to the Student object.
-                config.ROOMS_DB[room_id].seats_db[seat_id].student = students[idx]
-
-                # Set the Student object's seat attribute to the Seat object.
-                students[idx].seat = config.ROOMS_DB[room_id].seats_db[seat_id]
-
-                # Write logs.
-                messages = [
-                    "SEAT ASSIGNED TO STUDENT",
-                    f"STUDENT ID = {students[idx].student_id}",
-                    f"ROOM ID = {room_id}",
-                    f"SEAT ID = {seat_id}",
-                ]
-                logs.Logs.write_logs(messages)
-
     def get_occupied_seats_id(self):
         """
         Get the occupied seat IDs for each exam room after partitioning students.
@@ -104,28 +231,50 @@ class Randomizer:
         self.partition_students()
 
         # Then, for each room, randomly select seat IDs for the assigned students.
-        for room_id, room_obj in config.ROOMS_DB.items():
-            # Get the number of students assigned to the current room.
-            seat_amount = len(room_obj.students)
-
-            # If random mode is enabled, randomly select seat IDs from the available seats in the room.
-            # Assign the selected seat IDs to the room's occupied_seats_id attribute.
-            if self.is_random_mode:
-                config.ROOMS_DB[room_id].occupied_seats_id = list(
-                    sorted(random.sample(room_obj.available_seats_id, seat_amount))
-                )
+        for room_id, room_obj in self.get_rooms_db().items():
+            self.select_occupied_seats(room_id, room_obj)
 
-            # If random mode is disabled, select the first 'seat_amount' seat IDs.
-            else:
-                room_obj.occupied_seats_id = room_obj.available_seats_id[:seat_amount]
+    def select_occupied_seats(self, room_id, room_obj):
+        """
+        Select the occupied seat IDs of a room for the students assigned to the room.
+        In random mode, the rooms must be selected in the order of ROOMS_DB,
+        so the same seed always gives the same seats.
 
-            # Write logs.
-            messages = [
-                "OCCUPIED SEATS ID SELECTED",
-                f"ROOM ID = {room_id}",
-                f"OCCUPIED SEATS = {len(config.ROOMS_DB[room_id].occupied_seats_id)}",
+        Args:
+            room_id (str): The ID of the room.
+            room_obj (Room): The Room object with its assigned students.
+        """
+
+        # Get the number of students assigned to the current room without a pinned seat.
+        pinned_seats = self.pinned_seats.get(room_id, {})
+        seat_amount = len(room_obj.students) - len(pinned_seats)
+
+        # Exclude the pinned seats from the draw in a single pass.
+        available_seats_id = room_obj.available_seats_id
+        if pinned_seats:
+            available_seats_id = [
+                seat_id for seat_id in available_seats_id if seat_id not in pinned_seats
             ]
-            logs.Logs.write_logs(messages)
+
+        # If random mode is enabled, randomly select seat IDs from the available seats in the room.
+        # Assign the selected seat IDs to the room's occupied_seats_id attribute.
+        if self.is_random_mode:
+            occupied_seats_id = self.random.sample(available_seats_id, seat_amount)
+
+        # If random mode is disabled, select the first 'seat_amount' seat IDs.
+        else:
+            occupied_seats_id = available_seats_id[:seat_amount]
+
+        # The pinned seats are occupied as well.
+        room_obj.set_occupied_seats(sorted(occupied_seats_id + list(pinned_seats)))
+
+        # Write logs.
+        messages = [
+            "OCCUPIED SEATS ID SELECTED",
+            f"ROOM ID = {room_id}",
+            f"OCCUPIED SEATS = {len(room_obj.occupied_seats_id)}",
+        ]
+        logs.Logs.write_logs(messages)
 
     def partition_students(self):
         """
@@ -135,23 +284,45 @@ class Randomizer:
         # Write logs.
         logs.Logs.write_logs(["partition_students() CALLED"])
 
+        # Place the pinned students first.
+        self.apply_pins()
+
         # Get the partitioned seat amount dictionary.
         partitioned_amount = self.get_partitioned_seat_amount()
 
-        # Get all student IDs.
-        all_student_ids = sorted(config.STUDENTS_DB.keys())
+        # Get the rooms, students and pins to assign.
+        rooms_db = self.get_rooms_db()
+        students_db = self.get_students_db()
+        pins = self.get_pins()
+
+        # Get all student IDs without the pinned students.
+        all_student_ids = [
+            student_id
+            for student_id in sorted(students_db.keys())
+            if student_id not in pins
+        ]
         logs.Logs.write_logs(["ALL STUDENT IDs RETRIEVED"])
 
         # Shuffle the student IDs if random mode is enabled.
-        if self.is_random_mode:
-            random.shuffle(all_student_ids)
-            logs.Logs.write_logs(["ALL STUDENT IDs SHUFFLED"])
+        all_student_ids = self.shuffle_student_ids(all_student_ids)
 
         # Assign students to each room based on the partitioned seat amount.
         idx = 0
         for room_id, seat_amount in partitioned_amount.items():
-            # Get the student IDs for the current room.
+            # Get the student IDs for the current room, with the pinned students of the room.
             student_ids = all_student_ids[idx : idx + seat_amount]
+            room_pins = self.room_pins.get(room_id, [])
+            if room_pins:
+                student_ids = room_pins + student_ids
+
+                # Mix the room-only pinned students with the other students of the room.
+                if self.is_random_mode:
+                    self.random.shuffle(student_ids)
+                else:
+                    student_ids.sort()
+            student_ids = (
+                sorted(self.pinned_seats.get(room_id, {}).values()) + student_ids
+            )
             messages = [
                 "STUDENTS PARTITIONED AND ASSIGNED TO ROOM",
                 f"ROOM ID = {room_id}",
@@ -163,10 +334,10 @@ class Randomizer:
             ROOM_STUDENTS = {}
             for student_id in student_ids:
                 # Set each Student object's room attribute to the current Room object.
-                config.STUDENTS_DB[student_id].room = config.ROOMS_DB[room_id]
+                students_db[student_id].room = rooms_db[room_id]
 
                 # Add the Student object to the ROOM_STUDENTS dictionary.
-                ROOM_STUDENTS[student_id] = config.STUDENTS_DB[student_id]
+                ROOM_STUDENTS[student_id] = students_db[student_id]
 
                 # Write logs.
                 messages = [
@@ -177,19 +348,35 @@ class Randomizer:
                 logs.Logs.write_logs(messages)
 
             # Assign the dictionary of Student objects to the room.
-            config.ROOMS_DB[room_id].students = ROOM_STUDENTS
+            rooms_db[room_id].students = ROOM_STUDENTS
 
             # Write logs.
             messages = [
                 "ROOM STUDENTS ASSIGNED",
                 f"ROOM ID = {room_id}",
-                f"TOTAL STUDENTS = {len(config.ROOMS_DB[room_id].students)}",
+                f"TOTAL STUDENTS = {len(rooms_db[room_id].students)}",
             ]
             logs.Logs.write_logs(messages)
 
             # Increment the index for the next partition.
             idx += seat_amount
 
+    def shuffle_student_ids(self, student_ids):
+        """
+        Shuffle the sorted student IDs to partition if random mode is enabled.
+
+        Args:
+            student_ids (list): The sorted student IDs without the pinned students.
+
+        Returns:
+            list: The student IDs in the order of the partition.
+        """
+
+        if self.is_random_mode:
+            self.random.shuffle(student_ids)
+            logs.Logs.write_logs(["ALL STUDENT IDs SHUFFLED"])
+        return student_ids
+
     def get_partitioned_seat_amount(self):
         """
         Get a dictionary contains number of students assigned on each exam room.
@@ -201,21 +388,360 @@ class Randomizer:
         # Write logs.
         logs.Logs.write_logs(["get_partitioned_seat_amount() CALLED"])
 
+        # Get the number of available seats of each room, and the number of students,
+        # without the pinned seats and the pinned students.
+        available_seats = {
+            room_id: len(room_obj.available_seats_id)
+            - len(self.pinned_seats.get(room_id, {}))
+            - len(self.room_pins.get(room_id, []))
+            for room_id, room_obj in self.get_rooms_db().items()
+        }
+        total_students = len(self.get_students_db()) - len(self.get_pins())
+
+        # Only seat the students in the allocated rooms, which always include
+        # the rooms with pinned students.
+        pinned_amounts = {
+            room_id: len(self.pinned_seats.get(room_id, {}))
+            + len(self.room_pins.get(room_id, []))
+            for room_id in set(self.pinned_seats) | set(self.room_pins)
+        }
+        allocated_seats = Randomizer.allocate_rooms(
+            available_seats, total_students, pinned_amounts
+        )
+        partitioned_amount = Randomizer.partition_seat_amount(
+            allocated_seats, total_students
+        )
+        if config.ALLOCATION_STRATEGY == config.ALLOCATION_FEWEST_ROOMS:
+            Randomizer.write_allocation_report(
+                available_seats, partitioned_amount, pinned_amounts
+            )
+        return partitioned_amount
+
+    @staticmethod
+    def get_building(room_id):
+        """
+        Get the building of a room, which is the prefix of its room ID before
+        the first BUILDING_SEPARATOR.
+
+        Args:
+            room_id (str): The unique identifier for the room.
+
+        Returns:
+            str: The building of the room.
+        """
+
+        return str(room_id).split(config.BUILDING_SEPARATOR, 1)[0]
+
+    @staticmethod
+    def allocate_rooms(available_seats, total_students, pinned_amounts=None):
+        """
+        Allocate the rooms to open for the students with the allocation strategy.
+
+        With the "proportional" strategy, all rooms are opened with all their available
+        seats. With the "fewest-rooms" strategy, each room is only filled up to
+        ROOM_FILL_TARGET of its available seats, and the fewest rooms which fit all
+        students are opened, together with the rooms with pinned students.
+        If GROUP_ROOMS_BY_BUILDING is enabled, the rooms are taken from the fewest
+        buildings first. If the students do not fit in the fill targets, all rooms
+        are opened with all their available seats.
+
+        Args:
+            available_seats (dict): A dictionary mapping room IDs to their number of available seats.
+            total_students (int): The number of students to partition.
+            pinned_amounts (dict or None, optional): A dictionary mapping the room IDs
+            with pinned students to their number of pinned students. Defaults to None.
+
+        Returns:
+            dict: A dictionary mapping room IDs to their number of seats to fill,
+            which is 0 for the rooms which are not opened, in the same order.
+        """
+
+        if config.ALLOCATION_STRATEGY != config.ALLOCATION_FEWEST_ROOMS:
+            return available_seats
+        pinned_amounts = pinned_amounts or {}
+
+        CAPACITIES = Randomizer.get_fill_target_seats(available_seats)
+
+        # The rooms with pinned students are always opened, then select the other
+        # rooms for the remaining students.
+        remaining_students = total_students - sum(
+            CAPACITIES[room_id] for room_id in pinned_amounts
+        )
+        candidates = {
+            room_id: capacity
+            for room_id, capacity in CAPACITIES.items()
+            if room_id not in pinned_amounts and capacity > 0
+        }
+        selected_rooms = []
+        if remaining_students > 0 and config.GROUP_ROOMS_BY_BUILDING:
+            selected_rooms = Randomizer.select_rooms_by_building(
+                candidates,
+                remaining_students,
+                {Randomizer.get_building(room_id) for room_id in pinned_amounts},
+            )
+        elif remaining_students > 0:
+            selected_rooms = Randomizer.select_fewest_rooms(
+                candidates, remaining_students
+            )
+
+        # Open all rooms if the students do not fit in the fill targets.
+        if selected_rooms is None:
+            messages = [
+                "ROOMS NOT ALLOCATED",
+                f"TOTAL STUDENTS = {total_students}",
+                f"TOTAL SEATS UP TO FILL TARGET = {sum(CAPACITIES.values())}",
+            ]
+            logs.Logs.write_logs(messages)
+            return available_seats
+
+        opened_rooms = set(pinned_amounts) | set(selected_rooms)
+        ALLOCATED_SEATS = {
+            room_id: CAPACITIES[room_id] if room_id in opened_rooms else 0
+            for room_id in available_seats
+        }
+
+        # Write logs.
+        messages = [
+            "ROOMS ALLOCATED",
+            f"TOTAL STUDENTS = {total_students}",
+            f"OPENED ROOMS = {len(opened_rooms)}",
+            f"TOTAL ROOMS = {len(available_seats)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return ALLOCATED_SEATS
+
+    @staticmethod
+    def select_fewest_rooms(capacities, total_students):
+        """
+        Select the fewest rooms which fit the students by taking the largest rooms first,
+        then replacing the last room with the smallest room which still fits the rest
+        of the students.
+
+        Args:
+            capacities (dict): A dictionary mapping room IDs to their number of seats.
+            total_students (int): The number of students to fit.
+
+        Returns:
+            list or None: The selected room IDs, or None if the students do not fit
+            in all rooms.
+        """
+
+        order = sorted(
+            capacities, key=lambda room_id: (-capacities[room_id], str(room_id))
+        )
+        SELECTED_ROOMS = []
+        total_seats = 0
+        for room_id in order:
+            if total_seats >= total_students:
+                break
+            SELECTED_ROOMS.append(room_id)
+            total_seats += capacities[room_id]
+        if total_seats < total_students:
+            return None
+
+        # The rooms after the last selected room are not larger than it, so the first
+        # room which fits from the smallest room is the smallest room which fits.
+        if SELECTED_ROOMS:
+            last_students = total_students - (
+                total_seats - capacities[SELECTED_ROOMS[-1]]
+            )
+            for room_id in reversed(order[len(SELECTED_ROOMS) :]):
+                if capacities[room_id] >= last_students:
+                    SELECTED_ROOMS[-1] = room_id
+                    break
+
+        return SELECTED_ROOMS
+
+    @staticmethod
+    def select_rooms_by_building(capacities, total_students, opened_buildings):
+        """
+        Select the rooms which fit the students from the fewest buildings. The buildings
+        which are already opened come first, then the largest buildings. Whole buildings
+        are taken until the rest of the students fit in one building, where the fewest
+        rooms are selected.
+
+        Args:
+            capacities (dict): A dictionary mapping room IDs to their number of seats.
+            total_students (int): The number of students to fit.
+            opened_buildings (set): The buildings which already have an opened room.
+
+        Returns:
+            list or None: The selected room IDs, or None if the students do not fit
+            in all rooms.
+        """
+
+        # Group the rooms by building.
+        BUILDINGS = {}
+        for room_id, capacity in capacities.items():
+            BUILDINGS.setdefault(Randomizer.get_building(room_id), {})[
+                room_id
+            ] = capacity
+        building_seats = {
+            building: sum(rooms.values()) for building, rooms in BUILDINGS.items()
+        }
+        remaining_buildings = sorted(
+            BUILDINGS,
+            key=lambda building: (
+                building not in opened_buildings,
+                -building_seats[building],
+                building,
+            ),
+        )
+
+        SELECTED_ROOMS = []
+        remaining_students = total_students
+        while remaining_students > 0 and remaining_buildings:
+            # Select the fewest rooms of the building which fits the rest of the students
+            # with the fewest rooms, if any.
+            fitting_rooms = {
+                building: Randomizer.select_fewest_rooms(
+                    BUILDINGS[building], remaining_students
+                )
+                for building in remaining_buildings
+                if building_seats[building] >= remaining_students
+            }
+            if fitting_rooms:
+                building = min(
+                    fitting_rooms,
+                    key=lambda building: (
+                        building not in opened_buildings,
+                        len(fitting_rooms[building]),
+                        sum(
+                            BUILDINGS[building][room_id]
+                            for room_id in fitting_rooms[building]
+                        ),
+                        building,
+                    ),
+                )
+                SELECTED_ROOMS.extend(fitting_rooms[building])
+                return SELECTED_ROOMS
+
+            # Otherwise, take all rooms of the next building.
+            building = remaining_buildings.pop(0)
+            SELECTED_ROOMS.extend(BUILDINGS[building])
+            remaining_students -= building_seats[building]
+
+        return SELECTED_ROOMS if remaining_students <= 0 else None
+
+    @staticmethod
+    def get_fill_target_seats(available_seats):
+        """
+        Get the number of seats of each room up to its fill target, with a small
+        tolerance for the floating point error of the product.
+
+        Args:
+            available_seats (dict): A dictionary mapping room IDs to their number of available seats.
+
+        Returns:
+            dict: A dictionary mapping room IDs to their number of seats up to ROOM_FILL_TARGET.
+        """
+
+        return {
+            room_id: math.floor(
+                current_available_seats * config.ROOM_FILL_TARGET + 1e-9
+            )
+            for room_id, current_available_seats in available_seats.items()
+        }
+
+    @staticmethod
+    def write_allocation_report(available_seats, partitioned_amount, pinned_amounts):
+        """
+        Write the opened rooms and their fill to the report file. If the students do
+        not fit in the fill targets, all rooms are opened over their fill targets,
+        which is also written to the report file and printed.
+
+        Args:
+            available_seats (dict): A dictionary mapping room IDs to their number of
+            available seats without the pinned students.
+            partitioned_amount (dict): A dictionary mapping room IDs to the number of
+            students assigned without the pinned students.
+            pinned_amounts (dict): A dictionary mapping the room IDs with pinned students
+            to their number of pinned students.
+        """
+
+        opened_rooms = [
+            room_id
+            for room_id in available_seats
+            if partitioned_amount.get(room_id, 0) or room_id in pinned_amounts
+        ]
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Fewest rooms allocation summary.")
+        logs.Logs.write_report(f"Fill Target: {config.ROOM_FILL_TARGET:.1%}")
+        total_students = sum(partitioned_amount.values())
+        target_seats = sum(Randomizer.get_fill_target_seats(available_seats).values())
+        if total_students > target_seats:
+            message = (
+                f"Fill Target Exceeded: {total_students} students do not fit in "
+                f"{target_seats} seats up to the fill target, "
+                "so all rooms are opened with all their available seats."
+            )
+            logs.Logs.write_report(message)
+            print(message)
+        logs.Logs.write_report(
+            f"Group by Building: {'Enabled' if config.GROUP_ROOMS_BY_BUILDING else 'Disabled'}"
+        )
+        logs.Logs.write_report(
+            f"Opened Rooms: {len(opened_rooms)} of {len(available_seats)}"
+        )
+        logs.Logs.write_report(
+            f"{'Room ID':<20}{'Building':<20}{'Available':>12}{'Assigned':>12}{'Fill':>12}"
+        )
+        for room_id in opened_rooms:
+            room_available_seats = available_seats[room_id] + pinned_amounts.get(
+                room_id, 0
+            )
+            assigned_students = partitioned_amount.get(room_id, 0) + pinned_amounts.get(
+                room_id, 0
+            )
+            fill = (
+                assigned_students / room_available_seats
+                if room_available_seats
+                else 0.0
+            )
+            logs.Logs.write_report(
+                f"{room_id!s:<20}{Randomizer.get_building(room_id):<20}"
+                f"{room_available_seats:>12}{assigned_students:>12}{fill:>12.1%}"
+            )
+        logs.Logs.write_report("-" * 88)
+
+    @staticmethod
+    def partition_seat_amount(available_seats, total_students):
+        """
+        Partition the students to each exam room by the ratio of its available seats
+        to the total available seats.
+
+        Args:
+            available_seats (dict): A dictionary mapping room IDs to their number of available seats.
+            total_students (int): The number of students to partition.
+
+        Returns:
+            dict: A dictionary mapping room IDs to the number of students assigned.
+        """
+
         # Initialize remaining students counter and partitioned seat amount dictionary.
-        remaining_students = config.TOTAL_STUDENTS
+        total_available_seats = sum(available_seats.values())
+        remaining_students = total_students
         PARTITIONED_AMOUNT = {}
 
         # Iterate through each room and calculate the number of students to assign.
-        for idx, [room_id, room_obj] in enumerate(config.ROOMS_DB.items()):
+        for idx, [room_id, current_available_seats] in enumerate(
+            available_seats.items()
+        ):
             # Calculate the ratio of available seats in the room to the total available seats.
-            current_available_seats = len(room_obj.available_seats_id)
-            ratio = current_available_seats / config.TOTAL_AVAILABLE_SEATS
+            ratio = (
+                current_available_seats / total_available_seats
+                if total_available_seats
+                else 0
+            )
 
             # Calculate the number of students to assign to the room based on the ratio.
-            current_seat_amount = round(ratio * config.TOTAL_STUDENTS)
+            current_seat_amount = round(ratio * total_students)
 
             # If it's the last room, assign all remaining students to it.
-            if idx == len(config.ROOMS_DB) - 1:
+            if idx == len(available_seats) - 1:
                 current_seat_amount = remaining_students
 
             # Store the calculated number of students in the PARTITIONED_AMOUNT dictionary.
@@ -233,5 +759,66 @@ class Randomizer:
             ]
             logs.Logs.write_logs(messages)
 
+        # The rounding errors may give the last room more students than its available seats,
+        # then use the capped largest remainder partition instead.
+        if any(
+            not 0 <= PARTITIONED_AMOUNT[room_id] <= available_seats[room_id]
+            for room_id in PARTITIONED_AMOUNT
+        ):
+            PARTITIONED_AMOUNT = Randomizer.partition_largest_remainder(
+                available_seats, total_students
+            )
+
         # Return the partitioned seat amount dictionary.
         return PARTITIONED_AMOUNT
+
+    @staticmethod
+    def partition_largest_remainder(available_seats, total_students):
+        """
+        Partition the students to each exam room by the ratio of its available seats,
+        rounding down first, then giving the remaining students to the rooms with the
+        largest remainders, without exceeding the available seats of any room.
+
+        Args:
+            available_seats (dict): A dictionary mapping room IDs to their number of available seats.
+            total_students (int): The number of students to partition.
+
+        Returns:
+            dict: A dictionary mapping room IDs to the number of students assigned.
+        """
+
+        total_available_seats = sum(available_seats.values())
+        if total_students > total_available_seats:
+            raise ValueError(
+                f"Total students ({total_students}) are more than "
+                f"total available seats ({total_available_seats})."
+            )
+
+        # Round down each room's share, and keep its remainder.
+        PARTITIONED_AMOUNT = {}
+        remainders = {}
+        for room_id, current_available_seats in available_seats.items():
+            share = current_available_seats * total_students / total_available_seats
+            PARTITIONED_AMOUNT[room_id] = min(int(share), current_available_seats)
+            remainders[room_id] = share - PARTITIONED_AMOUNT[room_id]
+
+        # Give the remaining students one by one to the rooms with the largest remainders.
+        remaining_students = total_students - sum(PARTITIONED_AMOUNT.values())
+        order = sorted(available_seats, key=lambda room_id: -remainders[room_id])
+        while remaining_students > 0:
+            for room_id in order:
+                if remaining_students == 0:
+                    break
+                if PARTITIONED_AMOUNT[room_id] < available_seats[room_id]:
+                    PARTITIONED_AMOUNT[room_id] += 1
+                    remaining_students -= 1
+
+        # Write logs.
+        messages = [
+            "PARTITIONED SEAT AMOUNT RECALCULATED BY LARGEST REMAINDER",
+            f"TOTAL STUDENTS = {total_students}",
+            f"TOTAL AVAILABLE SEATS = {total_available_seats}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return PARTITIONED_AMOUNT
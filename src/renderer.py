@@ -0,0 +1,376 @@
+# ----------------------------------------------------------------------
+# File Name     : renderer.py
+# Author        : Worralop Srichainont
+# Description   : Renderer class for rendering printable HTML seat maps
+#                 and door lists of all rooms.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import concurrent.futures
+import hashlib
+import html
+import json
+import os
+import string
+
+import config
+import logs
+
+# The style of the HTML pages. The seat map and the door list of a room are printed
+# on separate pages.
+PAGE_STYLE = """
+body { font-family: sans-serif; margin: 16px; }
+h1 { font-size: 20px; margin: 0 0 4px 0; }
+p { margin: 0 0 12px 0; }
+section { page-break-after: always; break-after: page; }
+.seats { display: grid; grid-template-columns: repeat($columns, 1fr); gap: 6px; }
+.seat { border: 1px solid #333; border-radius: 4px; padding: 6px; min-height: 40px; }
+.seat .name { display: block; font-weight: bold; }
+.seat .student { display: block; font-size: 12px; }
+.seat.empty { border-style: dashed; color: #777; }
+.seat.unavailable { background: #ddd; color: #777; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border: 1px solid #333; padding: 4px 8px; text-align: left; }
+@media print { body { margin: 0; } a { display: none; } }
+""".strip()
+
+# The templates of the HTML pages, compiled once when the module is imported.
+ROOM_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>$room_name</title>
+<style>
+$style
+</style>
+</head>
+<body>
+<section class="seat-map">
+<h1>$room_name ($room_id)</h1>
+<p>Capacity: $capacity / Assigned Seats: $assigned_amount</p>
+<div class="seats">
+$seat_cells
+</div>
+</section>
+<section class="door-list">
+<h1>$room_name ($room_id)</h1>
+<p>Total Students: $assigned_amount</p>
+<table>
+<thead><tr><th>$student_id_col</th><th>$student_name_col</th><th>$seat_col</th></tr></thead>
+<tbody>
+$door_rows
+</tbody>
+</table>
+</section>
+</body>
+</html>
+""")
+SEAT_TEMPLATE = string.Template(
+    '<div class="seat $state"><span class="name">$seat_name</span>'
+    '<span class="student">$student_id</span></div>'
+)
+DOOR_ROW_TEMPLATE = string.Template(
+    "<tr><td>$student_id</td><td>$student_name</td><td>$seat_name</td></tr>"
+)
+INDEX_TEMPLATE = string.Template("""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Seat Maps and Door Lists</title>
+</head>
+<body>
+<h1>Seat Maps and Door Lists</h1>
+<ul>
+$room_links
+</ul>
+</body>
+</html>
+""")
+
+# The hash of the templates, so every room is rendered again when they change.
+TEMPLATES_HASH = hashlib.sha256(
+    f"{PAGE_STYLE}\0{ROOM_TEMPLATE.template}\0{SEAT_TEMPLATE.template}"
+    f"\0{DOOR_ROW_TEMPLATE.template}".encode()
+).hexdigest()
+
+
+class Renderer:
+    """
+    Renderer class for rendering a printable HTML page with the seat map and the door
+    list of each room from the in-memory assignment.
+
+    The data of each room is taken from its Room object as plain tuples and hashed.
+    The rooms whose hash is the same as in the manifest of the previous run, and whose
+    page still exists, are not rendered again. The other rooms are rendered in worker
+    processes with the templates compiled once in each process.
+
+    Attributes:
+        output_dir (str): The folder of the HTML pages.
+        workers (int): The number of worker processes.
+        columns (int): The number of seats in each row of the seat map.
+        manifest (dict): A dictionary mapping room IDs to the hashes of their rendered data.
+    """
+
+    def __init__(self, output_dir=None, workers=None, columns=None):
+        """
+        Initialize a Renderer object, and read the manifest of the previous run.
+
+        Args:
+            output_dir (str or None, optional): The folder of the HTML pages.
+            Defaults to None, which uses config.GENERATED_HTML_PATH.
+            workers (int or None, optional): The number of worker processes.
+            Defaults to None, which uses config.RENDER_WORKERS.
+            columns (int or None, optional): The number of seats in each row of the
+            seat map. Defaults to None, which uses config.SEAT_MAP_COLUMNS.
+        """
+
+        # Initialize attributes.
+        self.output_dir = output_dir or config.GENERATED_HTML_PATH
+        self.workers = workers or config.RENDER_WORKERS or os.cpu_count() or 1
+        self.columns = columns or config.SEAT_MAP_COLUMNS
+        self.manifest = {}
+
+        # Read the manifest of the previous run, if any.
+        manifest_path = self.get_manifest_path()
+        if os.path.exists(manifest_path):
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                self.manifest = json.load(manifest_file)
+
+        # Write logs.
+        messages = [
+            "RENDERER OBJECT CREATED",
+            f"OUTPUT PATH = {self.output_dir}",
+            f"WORKERS = {self.workers}",
+            f"PREVIOUS ROOMS = {len(self.manifest)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def get_manifest_path(self):
+        """
+        Get the path of the manifest file.
+
+        Returns:
+            str: The path of the manifest file.
+        """
+
+        return os.path.join(self.output_dir, "manifest.json")
+
+    @staticmethod
+    def get_room_data(room_obj):
+        """
+        Get the data of a room for rendering, as plain values which can be sent
+        to the worker processes.
+
+        Args:
+            room_obj (Room): The Room object with its assignment.
+
+        Returns:
+            tuple: The room ID, room name, capacity, and the (seat name, availability,
+            student ID, student name) of each seat in the order of the seats database,
+            where the student ID and name are None if the seat has no student.
+        """
+
+        SEATS = []
+        for seat_id, seat_name, is_available in zip(
+            room_obj.seat_ids, room_obj.seat_names, room_obj.seat_availability
+        ):
+            seat_obj = room_obj.seats_db.get(seat_id)
+            student_obj = seat_obj.student if seat_obj is not None else None
+            SEATS.append(
+                (
+                    str(seat_name),
+                    bool(is_available),
+                    str(student_obj.student_id) if student_obj else None,
+                    str(student_obj.student_name) if student_obj else None,
+                )
+            )
+        return (
+            str(room_obj.room_id),
+            str(room_obj.room_name),
+            int(room_obj.capacity),
+            SEATS,
+        )
+
+    def get_room_hash(self, room_data):
+        """
+        Get the hash of the data of a room together with the templates and the layout.
+
+        Args:
+            room_data (tuple): The data of the room from get_room_data().
+
+        Returns:
+            str: The hexadecimal SHA-256 hash.
+        """
+
+        return hashlib.sha256(
+            json.dumps(
+                [TEMPLATES_HASH, self.columns, room_data], ensure_ascii=False
+            ).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def render_room(room_data, output_dir, style):
+        """
+        Render the HTML page of a room, with its seat map and its door list sorted
+        by student ID. It runs in a worker process.
+
+        Args:
+            room_data (tuple): The data of the room from get_room_data().
+            output_dir (str): The folder of the HTML pages.
+            style (str): The style of the page with the number of seats in each row
+            of the seat map.
+
+        Returns:
+            str: The path of the HTML page.
+        """
+
+        room_id, room_name, capacity, seats = room_data
+        escape = html.escape
+
+        # Render the seat map in the order of the seats database.
+        seat_cells = []
+        door_students = []
+        for seat_name, is_available, student_id, student_name in seats:
+            state = "occupied"
+            if student_id is None:
+                state = "empty" if is_available else "unavailable"
+            else:
+                door_students.append((student_id, student_name, seat_name))
+            seat_cells.append(
+                SEAT_TEMPLATE.substitute(
+                    state=state,
+                    seat_name=escape(seat_name),
+                    student_id=escape(student_id or ""),
+                )
+            )
+
+        # Render the door list sorted by student ID, numerically if possible.
+        door_students.sort(
+            key=lambda row: (0, int(row[0]), "") if row[0].isdigit() else (1, 0, row[0])
+        )
+        door_rows = [
+            DOOR_ROW_TEMPLATE.substitute(
+                student_id=escape(student_id),
+                student_name=escape(student_name),
+                seat_name=escape(seat_name),
+            )
+            for student_id, student_name, seat_name in door_students
+        ]
+
+        page = ROOM_TEMPLATE.substitute(
+            room_id=escape(room_id),
+            room_name=escape(room_name),
+            capacity=capacity,
+            assigned_amount=len(door_students),
+            style=style,
+            seat_cells="\n".join(seat_cells),
+            door_rows="\n".join(door_rows),
+            student_id_col=escape(config.STUDENT_ID_COL),
+            student_name_col=escape(config.STUDENT_NAME_COL),
+            seat_col=escape(config.SEAT_COL),
+        )
+
+        # Write the page.
+        page_path = os.path.join(output_dir, f"{room_id}.html")
+        with open(page_path, "w", encoding="utf-8") as page_file:
+            page_file.write(page)
+
+        # Write logs.
+        messages = [
+            "ROOM HTML RENDERED",
+            f"PATH = {page_path}",
+            f"ASSIGNED SEATS = {len(door_students)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return page_path
+
+    def render_all(self, rooms_db=None):
+        """
+        Render the HTML pages of all rooms whose data has changed since the previous
+        run, and the index page which links to all rooms.
+
+        Args:
+            rooms_db (dict or None, optional): The rooms to render.
+            Defaults to None, which uses the global ROOMS_DB.
+
+        Returns:
+            int: The number of rendered rooms.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["render_all() CALLED"])
+
+        if rooms_db is None:
+            rooms_db = config.ROOMS_DB
+        os.makedirs(self.output_dir, exist_ok=True)
+
+        style = string.Template(PAGE_STYLE).substitute(columns=self.columns)
+
+        # Find the rooms whose data has changed, or whose page is missing.
+        MANIFEST = {}
+        changed_rooms = []
+        for room_id in sorted(rooms_db):
+            room_data = Renderer.get_room_data(rooms_db[room_id])
+            room_hash = self.get_room_hash(room_data)
+            MANIFEST[room_data[0]] = room_hash
+            page_path = os.path.join(self.output_dir, f"{room_data[0]}.html")
+            if self.manifest.get(room_data[0]) != room_hash or not os.path.exists(
+                page_path
+            ):
+                changed_rooms.append(room_data)
+
+        # Render the changed rooms in the worker processes, or in this process
+        # if there is only one room or one worker.
+        if len(changed_rooms) > 1 and self.workers > 1:
+            with concurrent.futures.ProcessPoolExecutor(
+                min(self.workers, len(changed_rooms)),
+                initializer=logs.Logs.init_worker_logs,
+                initargs=(config.FLIGHT_RECORDER_SIZE,),
+            ) as executor:
+                chunk_size = max(1, len(changed_rooms) // (self.workers * 4))
+                list(
+                    executor.map(
+                        Renderer.render_room,
+                        changed_rooms,
+                        [self.output_dir] * len(changed_rooms),
+                        [style] * len(changed_rooms),
+                        chunksize=chunk_size,
+                    )
+                )
+        else:
+            for room_data in changed_rooms:
+                Renderer.render_room(room_data, self.output_dir, style)
+
+        # Remove the pages of the rooms which no longer exist.
+        for room_id in self.manifest.keys() - MANIFEST.keys():
+            page_path = os.path.join(self.output_dir, f"{room_id}.html")
+            if os.path.exists(page_path):
+                os.remove(page_path)
+
+        # Write the index page and the manifest.
+        room_links = [
+            f'<li><a href="{html.escape(room_id)}.html">{html.escape(room_id)}</a></li>'
+            for room_id in MANIFEST
+        ]
+        with open(
+            os.path.join(self.output_dir, "index.html"), "w", encoding="utf-8"
+        ) as index_file:
+            index_file.write(
+                INDEX_TEMPLATE.substitute(room_links="\n".join(room_links))
+            )
+        temporary_path = f"{self.get_manifest_path()}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as manifest_file:
+            json.dump(MANIFEST, manifest_file, indent=2, ensure_ascii=False)
+        os.replace(temporary_path, self.get_manifest_path())
+        self.manifest = MANIFEST
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("HTML seat maps and door lists rendered successfully.")
+        logs.Logs.write_report(f"Rendered Rooms: {len(changed_rooms)}")
+        logs.Logs.write_report(f"Unchanged Rooms: {len(MANIFEST) - len(changed_rooms)}")
+        logs.Logs.write_report(f"Output Path: {self.output_dir}")
+        logs.Logs.write_report("-" * 88)
+
+        return len(changed_rooms)
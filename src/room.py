@@ -5,25 +5,40 @@
 # Date          : 2025-10-13
 # ----------------------------------------------------------------------
 
-import config
 import logs
+import seat
 
 
 class Room:
     """
     Room class for representing an exam room.
 
+    The seats of the room are stored as compact arrays sorted by seat ID, and a Seat object
+    is only created when a seat gets a student or is explicitly requested by get_seat().
+    The availability and occupancy of the seats are also kept as bitmaps, where bit i
+    is the seat at position i in seat_ids, so the seat counts are taken without
+    rescanning the seats.
+
     Attributes:
         room_id (str): The unique identifier for the room.
         room_name (str): The name of the room.
         capacity (int): The maximum number of students that can be seated in the room.
-        seats_db (dict): A dictionary containing seat objects indexed by seat ID.
+        seat_ids (list): The IDs of all seats in the room, sorted by seat ID.
+        seat_names (list): The names of all seats in the room, in the same order as seat_ids.
+        seat_availability (bytearray): Whether each seat is available (1) or not (0),
+        in the same order as seat_ids.
+        seat_positions (dict): A dictionary mapping seat IDs to their positions in seat_ids.
+        availability_bits (int): The bitmap of the available seats.
+        occupancy_bits (int): The bitmap of the occupied seats.
+        seats_db (dict): A dictionary containing the created seat objects indexed by seat ID.
         available_seats_id (list): A list of seat IDs that are currently available.
         students (dict or None): A dictionary of students assigned to the room.
         occupied_seats_id (list or None): A list of seat IDs that are currently occupied.
     """
 
-    def __init__(self, room_id, room_name, capacity, seats_db, available_seats_id):
+    def __init__(
+        self, room_id, room_name, capacity, seat_ids, seat_names, seat_availability
+    ):
         """
         Initialize a Room object.
 
@@ -31,16 +46,28 @@ class Room:
             room_id (str): The unique identifier for the room.
             room_name (str): The name of the room.
             capacity (int): The maximum number of students that can be seated in the room.
-            seats_db (dict): A dictionary containing seat objects indexed by seat ID.
-            available_seats_id (list): A list of seat IDs that are currently available.
+            seat_ids (list): The IDs of all seats in the room, sorted by seat ID.
+            seat_names (list): The names of all seats in the room, in the same order as seat_ids.
+            seat_availability (bytearray): Whether each seat is available (1) or not (0),
+            in the same order as seat_ids.
         """
 
         # Initialize attributes.
         self.room_id = room_id
         self.room_name = room_name
         self.capacity = capacity
-        self.seats_db = seats_db
-        self.available_seats_id = available_seats_id
+        self.seat_ids = seat_ids
+        self.seat_names = seat_names
+        self.seat_availability = seat_availability
+        self.seat_positions = {seat_id: idx for idx, seat_id in enumerate(seat_ids)}
+        self.availability_bits = Room.to_bits(seat_availability)
+        self.occupancy_bits = 0
+        self.seats_db = {}
+        self.available_seats_id = [
+            seat_id
+            for seat_id, is_available in zip(seat_ids, seat_availability)
+            if is_available
+        ]
 
         # Attributes to be assigned later.
         self.students = None
@@ -52,7 +79,7 @@ class Room:
             f"ID = {self.room_id}",
             f"NAME = {self.room_name}",
             f"CAPACITY = {self.capacity}",
-            f"TOTAL SEATS = {len(self.seats_db)}",
+            f"TOTAL SEATS = {len(self.seat_ids)}",
             f"AVAILABLE SEATS = {len(self.available_seats_id)}",
             f"STUDENTS = {len(self.students) if self.students else 0}",
             f"OCCUPIED SEATS = {len(self.occupied_seats_id) if self.occupied_seats_id else 0}",
@@ -72,6 +99,155 @@ class Room:
 
         return self.room_id < other.room_id
 
+    def reset_assignment(self):
+        """
+        Remove the assigned students and occupied seats of the room,
+        so the seats can be assigned again.
+        """
+
+        self.students = None
+        self.occupied_seats_id = None
+        self.occupancy_bits = 0
+        self.seats_db = {}
+
+        # Write logs.
+        messages = ["ROOM ASSIGNMENT RESET", f"ID = {self.room_id}"]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def to_bits(flags):
+        """
+        Convert a sequence of flags to a bitmap, where bit i is set if flag i is true.
+
+        Args:
+            flags (Iterable): The flags, in the order of the seat positions.
+
+        Returns:
+            int: The bitmap of the flags.
+        """
+
+        # Pack the flags into little-endian bytes, then read them as one integer.
+        packed = bytearray()
+        for idx, flag in enumerate(flags):
+            if idx % 8 == 0:
+                packed.append(0)
+            if flag:
+                packed[-1] |= 1 << (idx % 8)
+        return int.from_bytes(packed, "little")
+
+    @staticmethod
+    def get_positions(bits):
+        """
+        Get the positions of the set bits of a bitmap.
+
+        Args:
+            bits (int): The bitmap.
+
+        Returns:
+            list[int]: The positions of the set bits in ascending order.
+        """
+
+        # Read the bitmap as little-endian bytes, and skip the bytes without set bits.
+        POSITIONS = []
+        packed = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+        for byte_idx, byte in enumerate(packed):
+            while byte:
+                low_bit = byte & -byte
+                POSITIONS.append(byte_idx * 8 + low_bit.bit_length() - 1)
+                byte ^= low_bit
+        return POSITIONS
+
+    @staticmethod
+    def count_bits(bits):
+        """
+        Count the set bits of a bitmap.
+
+        Args:
+            bits (int): The bitmap.
+
+        Returns:
+            int: The number of set bits.
+        """
+
+        return bits.bit_count()
+
+    def set_occupied_seats(self, occupied_seats_id):
+        """
+        Set the occupied seat IDs of the room, and update its occupancy bitmap
+        in place, clearing the bits of the previous occupied seats and setting
+        the bits of the new ones.
+
+        Args:
+            occupied_seats_id (list): The IDs of the occupied seats, sorted by seat ID.
+        """
+
+        for seat_id in self.occupied_seats_id or []:
+            self.occupancy_bits &= ~(1 << self.seat_positions[seat_id])
+        for seat_id in occupied_seats_id:
+            self.occupancy_bits |= 1 << self.seat_positions[seat_id]
+        self.occupied_seats_id = occupied_seats_id
+
+    def get_remaining_bits(self):
+        """
+        Get the bitmap of the available seats without a student.
+
+        Returns:
+            int: The bitmap of the remaining seats.
+        """
+
+        return self.availability_bits & ~self.occupancy_bits
+
+    def get_remaining_amount(self):
+        """
+        Get the number of available seats without a student.
+
+        Returns:
+            int: The number of remaining seats.
+        """
+
+        return Room.count_bits(self.get_remaining_bits())
+
+    def get_seat(self, seat_id):
+        """
+        Get the Seat object of a seat in the room, creating it on the first request.
+
+        Args:
+            seat_id (str): The ID of the seat.
+
+        Returns:
+            Seat: The Seat object of the seat.
+        """
+
+        # Return the existing Seat object if it has already been created.
+        if seat_id in self.seats_db:
+            return self.seats_db[seat_id]
+
+        # Create the Seat object from the seat arrays.
+        position = self.seat_positions[seat_id]
+        current_seat = seat.Seat(
+            seat_id,
+            self.seat_names[position],
+            bool(self.seat_availability[position]),
+            self.room_id,
+        )
+        self.seats_db[seat_id] = current_seat
+        return current_seat
+
+    def get_unassigned_seat_names(self):
+        """
+        Get the names of all seats without a student, including unavailable seats,
+        directly from the seat arrays.
+
+        Returns:
+            list: The names of the unassigned seats, in the order of seat ID.
+        """
+
+        all_bits = (1 << len(self.seat_ids)) - 1
+        return [
+            self.seat_names[idx]
+            for idx in Room.get_positions(all_bits & ~self.occupancy_bits)
+        ]
+
     def get_room_info(self):
         """
         Get the information of the room.
@@ -81,12 +257,10 @@ class Room:
             number of occupied seats, number of remaining seats, and a list of remaining seat names.
         """
 
-        # Get the names of the remaining available seats.
-        remaining_seat_names = (
-            config.ROOMS_DB[self.room_id][seat_id].seat_name
-            for seat_id in sorted(
-                set(self.available_seats_id) - set(self.occupied_seats_id)
-            )
+        # Get the names of the remaining available seats from the bitmaps.
+        remaining_seat_names = sorted(
+            self.seat_names[idx]
+            for idx in Room.get_positions(self.get_remaining_bits())
         )
 
         # Write logs.
@@ -95,11 +269,11 @@ class Room:
             f"ID = {self.room_id}",
             f"NAME = {self.room_name}",
             f"CAPACITY = {self.capacity}",
-            f"TOTAL SEATS = {len(self.seats_db)}",
+            f"TOTAL SEATS = {len(self.seat_ids)}",
             f"AVAILABLE SEATS = {len(self.available_seats_id)}",
             f"OCCUPIED SEATS = {len(self.occupied_seats_id) if self.occupied_seats_id else 0}",
             f"REMAINING SEATS = {len(remaining_seat_names)}",
-            f"REMAINING SEAT NAMES = {sorted(remaining_seat_names)}",
+            f"REMAINING SEAT NAMES = {remaining_seat_names}",
         ]
         logs.Logs.write_logs(messages)
 
@@ -110,5 +284,5 @@ class Room:
             len(self.available_seats_id),
             len(self.occupied_seats_id) if self.occupied_seats_id is not None else 0,
             len(remaining_seat_names),
-            sorted(remaining_seat_names),
+            remaining_seat_names,
         )
@@ -0,0 +1,405 @@
+# ----------------------------------------------------------------------
+# File Name     : scheduler.py
+# Author        : Worralop Srichainont
+# Description   : Scheduler class for allocating the rooms of many exams
+#                 across time slots, then seating each exam with the
+#                 Randomizer class.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import bisect
+import os
+import shutil
+
+import pandas as pd
+
+import config
+import generator
+import logs
+import randomizer
+import room
+import student
+import validator
+
+
+class SlotInventory:
+    """
+    SlotInventory class for keeping the free rooms of one time slot.
+
+    The free rooms are kept in a list sorted by (available seats, room ID), so the
+    smallest room that fits the remaining students is found by binary search,
+    and the largest free room is always the last one.
+
+    Attributes:
+        slot (str): The name of the time slot.
+        free_rooms (list[tuple]): The (available seats, room ID) of the free rooms, sorted.
+        free_seats (int): The total available seats of the free rooms.
+        busy_students (set): The IDs of the students who already have an exam in the slot.
+    """
+
+    def __init__(self, slot, free_rooms, free_seats):
+        """
+        Initialize a SlotInventory object.
+
+        Args:
+            slot (str): The name of the time slot.
+            free_rooms (list[tuple]): The (available seats, room ID) of all rooms, sorted.
+            free_seats (int): The total available seats of all rooms.
+        """
+
+        # Initialize attributes.
+        self.slot = slot
+        self.free_rooms = list(free_rooms)
+        self.free_seats = free_seats
+        self.busy_students = set()
+
+    def can_fit(self, student_ids):
+        """
+        Check whether an exam fits in the free rooms of the slot,
+        without any student having another exam in the slot.
+
+        Args:
+            student_ids (set): The IDs of the students of the exam.
+
+        Returns:
+            bool: True if the exam fits in the slot, False otherwise.
+        """
+
+        return len(student_ids) <= self.free_seats and self.busy_students.isdisjoint(
+            student_ids
+        )
+
+    def allocate(self, student_ids):
+        """
+        Allocate free rooms to an exam, then mark the rooms and students as busy.
+        The largest free rooms are taken until the smallest room that fits
+        the remaining students is found, so the exam opens as few rooms as possible.
+
+        Args:
+            student_ids (set): The IDs of the students of the exam.
+
+        Returns:
+            list[str]: The IDs of the allocated rooms.
+        """
+
+        room_ids = []
+        remaining_students = len(student_ids)
+        while remaining_students > 0:
+            # Find the smallest free room which fits all remaining students,
+            # or take the largest free room if none fits.
+            idx = bisect.bisect_left(self.free_rooms, (remaining_students, ""))
+            if idx == len(self.free_rooms):
+                idx -= 1
+            available_seats, room_id = self.free_rooms.pop(idx)
+
+            room_ids.append(room_id)
+            remaining_students -= available_seats
+            self.free_seats -= available_seats
+
+        self.busy_students.update(student_ids)
+        return room_ids
+
+
+class Scheduler:
+    """
+    Scheduler class for allocating the rooms of many exams across time slots,
+    then seating each exam with the Randomizer class.
+
+    The exams are allocated from the largest to the smallest, each one to the first
+    of its candidate slots which has enough free seats and no student conflict.
+    Each slot keeps its own sorted inventory of free rooms, so an allocation never
+    scans ROOMS_DB again.
+
+    Attributes:
+        randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+        exams (list[dict]): The exams, each with its ID, name, candidate slots and students.
+        room_inventory (list[tuple]): The (available seats, room ID) of all rooms, sorted.
+        slots (dict): A dictionary mapping slot names to their SlotInventory objects.
+        allocations (dict): A dictionary mapping exam IDs to their (slot, room IDs).
+        unscheduled (dict): A dictionary mapping unscheduled exam IDs to the reasons.
+    """
+
+    def __init__(self, randomizer):
+        """
+        Initialize a Scheduler object from the global ROOMS_DB.
+
+        Args:
+            randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+        """
+
+        # Initialize attributes.
+        self.randomizer = randomizer
+        self.exams = []
+        self.room_inventory = sorted(
+            (len(room_obj.available_seats_id), room_id)
+            for room_id, room_obj in config.ROOMS_DB.items()
+            if room_obj.available_seats_id
+        )
+        self.slots = {}
+        self.allocations = {}
+        self.unscheduled = {}
+
+        # Write logs.
+        messages = [
+            "SCHEDULER OBJECT CREATED",
+            f"TOTAL ROOMS = {len(self.room_inventory)}",
+            f"TOTAL AVAILABLE SEATS = {config.TOTAL_AVAILABLE_SEATS}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def run(self):
+        """
+        Read the exams, allocate their rooms, seat each exam and generate the outputs.
+        """
+
+        self.exams = Scheduler.get_exams()
+        self.allocate_rooms()
+        self.seat_exams()
+        self.generate_output_schedule_csv()
+
+    @staticmethod
+    def get_exams():
+        """
+        Validate and read the exams CSV database file and the student list of each exam.
+
+        Returns:
+            list[dict]: The exams, each with its ID, name, candidate slots and students.
+
+        Raises:
+            ValidationError: If any error is found in the exams CSV databases.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["get_exams() CALLED"])
+
+        errors = []
+        exams_frame = validator.Validator.read_csv(
+            config.EXAMS_PATH, ["exam_id", "exam_name", "slots"], errors
+        )
+        if exams_frame is None:
+            raise validator.ValidationError(errors)
+
+        # Check for empty and duplicate exam IDs.
+        empty_rows = validator.Validator.get_row_numbers(
+            exams_frame["exam_id"].str.strip() == ""
+        )
+        if empty_rows:
+            errors.append(f"exams.csv: empty exam_id at rows {empty_rows}.")
+        duplicate_ids = validator.Validator.get_duplicate_values(exams_frame["exam_id"])
+        if duplicate_ids:
+            errors.append(f"exams.csv: duplicate exam_id {duplicate_ids}.")
+
+        EXAMS = []
+        for row in exams_frame.itertuples():
+            # Split the candidate slots in order of preference.
+            slots = [
+                slot.strip()
+                for slot in row.slots.split(config.EXAM_SLOTS_SEPARATOR)
+                if slot.strip()
+            ]
+            if not slots:
+                errors.append(f"exams.csv: exam {row.exam_id} has no slots.")
+
+            # Read the student list of the exam.
+            students_frame = validator.Validator.read_csv(
+                os.path.join(config.EXAM_STUDENTS_PATH, f"{row.exam_id}.csv"),
+                ["student_id", "student_name"],
+                errors,
+            )
+            if students_frame is None:
+                continue
+            duplicate_ids = validator.Validator.get_duplicate_values(
+                students_frame["student_id"]
+            )
+            if duplicate_ids:
+                errors.append(
+                    f"exams/students/{row.exam_id}.csv: duplicate student_id {duplicate_ids}."
+                )
+
+            EXAMS.append(
+                {
+                    "exam_id": row.exam_id,
+                    "exam_name": row.exam_name,
+                    "slots": slots,
+                    "students": dict(
+                        zip(
+                            students_frame["student_id"], students_frame["student_name"]
+                        )
+                    ),
+                }
+            )
+
+        if errors:
+            raise validator.ValidationError(errors)
+
+        # Write logs.
+        messages = ["EXAMS READ FROM CSV", f"TOTAL EXAMS = {len(EXAMS)}"]
+        logs.Logs.write_logs(messages)
+
+        return EXAMS
+
+    def get_slot(self, slot):
+        """
+        Get the inventory of a time slot, creating it with all rooms free on the first request.
+
+        Args:
+            slot (str): The name of the time slot.
+
+        Returns:
+            SlotInventory: The inventory of the time slot.
+        """
+
+        if slot not in self.slots:
+            self.slots[slot] = SlotInventory(
+                slot, self.room_inventory, config.TOTAL_AVAILABLE_SEATS
+            )
+        return self.slots[slot]
+
+    def allocate_rooms(self):
+        """
+        Allocate rooms to each exam, from the largest exam to the smallest,
+        in the first candidate slot which fits it.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["allocate_rooms() CALLED"])
+
+        for exam in sorted(
+            self.exams, key=lambda exam: (-len(exam["students"]), exam["exam_id"])
+        ):
+            student_ids = set(exam["students"])
+            for slot in exam["slots"]:
+                slot_inventory = self.get_slot(slot)
+                if slot_inventory.can_fit(student_ids):
+                    room_ids = slot_inventory.allocate(student_ids)
+                    self.allocations[exam["exam_id"]] = (slot, room_ids)
+                    break
+            else:
+                self.unscheduled[exam["exam_id"]] = (
+                    "No candidate slot has enough free seats without a student conflict."
+                )
+
+            # Write logs.
+            slot, room_ids = self.allocations.get(exam["exam_id"], (None, []))
+            messages = [
+                "EXAM ROOMS ALLOCATED" if slot else "EXAM UNSCHEDULED",
+                f"EXAM ID = {exam['exam_id']}",
+                f"TOTAL STUDENTS = {len(student_ids)}",
+                f"SLOT = {slot}",
+                f"ROOMS = {room_ids}",
+            ]
+            logs.Logs.write_logs(messages)
+
+    def seat_exams(self):
+        """
+        Seat the students of each scheduled exam in its allocated rooms with the Randomizer
+        class, and write the output CSV files of the exam.
+        Each exam has its own seed derived from the seed of the run.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["seat_exams() CALLED"])
+
+        # Remove the output files of the previous run, so the exams which are no longer
+        # scheduled in the same slot do not leave stale output directories.
+        shutil.rmtree(config.GENERATED_SCHEDULE_PATH, ignore_errors=True)
+
+        for exam in self.exams:
+            if exam["exam_id"] not in self.allocations:
+                continue
+            slot, room_ids = self.allocations[exam["exam_id"]]
+
+            # Create new Room objects for the exam, sharing the seat arrays of ROOMS_DB.
+            ROOMS_DB = {}
+            for room_id in sorted(room_ids):
+                room_obj = config.ROOMS_DB[room_id]
+                ROOMS_DB[room_id] = room.Room(
+                    room_id,
+                    room_obj.room_name,
+                    room_obj.capacity,
+                    room_obj.seat_ids,
+                    room_obj.seat_names,
+                    room_obj.seat_availability,
+                )
+
+            # Create new Student objects, since a student may take several exams.
+            STUDENTS_DB = {
+                student_id: student.Student(student_id, student_name)
+                for student_id, student_name in exam["students"].items()
+            }
+
+            # Assign seats to the students of the exam.
+            randomizer.Randomizer(
+                self.randomizer.is_random_mode,
+                f"{self.randomizer.seed}:{exam['exam_id']}",
+                ROOMS_DB,
+                STUDENTS_DB,
+                {},
+            ).assign_seats_to_students()
+
+            # Write the output CSV files of the exam.
+            exam_path = os.path.join(
+                config.GENERATED_SCHEDULE_PATH, slot, exam["exam_id"]
+            )
+            rooms_path = os.path.join(exam_path, "rooms")
+            os.makedirs(rooms_path, exist_ok=True)
+            generator.Generator.write_students_data_frame(
+                generator.Generator.get_students_data_frame(STUDENTS_DB),
+                os.path.join(exam_path, "output_students.csv"),
+            )
+            for room_obj in ROOMS_DB.values():
+                generator.Generator.write_room_csv(room_obj, rooms_path)
+
+    def generate_output_schedule_csv(self):
+        """
+        Generate the output schedule CSV file with the slot and rooms of each exam,
+        and write the schedule to the report file.
+        """
+
+        # Get the rows of the scheduled exams, sorted by slot and exam ID.
+        exams = {exam["exam_id"]: exam for exam in self.exams}
+        rows = []
+        for exam_id, (slot, room_ids) in sorted(
+            self.allocations.items(), key=lambda item: (item[1][0], item[0])
+        ):
+            for room_id in sorted(room_ids):
+                rows.append(
+                    [
+                        exam_id,
+                        exams[exam_id]["exam_name"],
+                        slot,
+                        room_id,
+                        config.ROOMS_DB[room_id].room_name,
+                        len(exams[exam_id]["students"]),
+                    ]
+                )
+
+        # Write the DataFrame to a CSV file.
+        os.makedirs(config.GENERATED_SCHEDULE_PATH, exist_ok=True)
+        GENERATED_SCHEDULE_CSV_PATH = os.path.join(
+            config.GENERATED_SCHEDULE_PATH, "schedule.csv"
+        )
+        pd.DataFrame(rows, columns=config.OUTPUT_SCHEDULE_CSV_HEADER).to_csv(
+            GENERATED_SCHEDULE_CSV_PATH, index=False, encoding="utf-8-sig"
+        )
+
+        # Write logs.
+        messages = [
+            "OUTPUT SCHEDULE CSV GENERATED",
+            f"PATH = {GENERATED_SCHEDULE_CSV_PATH}",
+            f"SCHEDULED EXAMS = {len(self.allocations)}",
+            f"UNSCHEDULED EXAMS = {len(self.unscheduled)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Exam schedule generated successfully.")
+        logs.Logs.write_report(f"Total Exams: {len(self.exams)}")
+        logs.Logs.write_report(f"Total Slots Used: {len(self.slots)}")
+        for exam_id, (slot, room_ids) in sorted(self.allocations.items()):
+            logs.Logs.write_report(f"  {exam_id}: {slot} {sorted(room_ids)}")
+        logs.Logs.write_report(f"Unscheduled Exams: {len(self.unscheduled)}")
+        for exam_id, reason in sorted(self.unscheduled.items()):
+            logs.Logs.write_report(f"  {exam_id}: {reason}")
+        logs.Logs.write_report("-" * 88)
@@ -0,0 +1,366 @@
+# ----------------------------------------------------------------------
+# File Name     : sharder.py
+# Author        : Worralop Srichainont
+# Description   : Sharder class for running the seating arrangement of
+#                 very large cohorts in several processes, and merging the
+#                 outputs deterministically.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import concurrent.futures
+import contextlib
+import csv
+import heapq
+import os
+import random
+import types
+
+import config
+import generator
+import inventory
+import logs
+import randomizer
+import room
+import student
+import utility
+import validator
+
+
+class Sharder:
+    """
+    Sharder class for running the seating arrangement of very large cohorts in
+    several processes, without creating every Student and Seat object in one process.
+
+    The main process only keeps the student IDs and names. It shuffles them with the
+    seed, partitions them to the rooms, and splits the rooms into contiguous shards
+    with about the same number of students. Each shard creates the objects of its own
+    rooms only, assigns each room with its own seed derived from the room ID, and writes
+    the output room CSV files and a sorted shard of the output students CSV file.
+    Then the shards are merged with a k-way merge. Since every random draw depends only
+    on the seed and the room, the outputs are the same for any number of shards.
+
+    Attributes:
+        randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+        shards (int): The number of shards.
+        workers (int): The number of worker processes.
+    """
+
+    def __init__(self, randomizer, shards, workers=None):
+        """
+        Initialize a Sharder object.
+
+        Args:
+            randomizer (Randomizer): The randomizer of the run, for its mode and seed.
+            shards (int): The number of shards.
+            workers (int or None, optional): The number of worker processes.
+            Defaults to None, which uses the number of shards up to the number of CPUs.
+        """
+
+        # Initialize attributes.
+        self.randomizer = randomizer
+        self.shards = shards
+        self.workers = workers or min(self.shards, os.cpu_count() or 1)
+
+        # Write logs.
+        messages = [
+            "SHARDER OBJECT CREATED",
+            f"SHARDS = {self.shards}",
+            f"WORKERS = {self.workers}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def run(self):
+        """
+        Run the sharded seating arrangement until all output files are written.
+
+        Raises:
+            ValidationError: If a pins database exists, since pins are not supported.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["run() CALLED"])
+
+        if os.path.exists(config.PINS_PATH):
+            raise validator.ValidationError(
+                ["pins.csv: pinned seats are not supported in sharded mode."]
+            )
+
+        # Read only the student IDs and names, and the rows of the rooms.
+        student_names = {
+            student_id: student_name
+            for chunk in utility.Utility.read_students_chunks()
+            for student_id, student_name in chunk
+        }
+        config.TOTAL_STUDENTS = len(student_names)
+        rooms = list(utility.Utility.read_rooms_csv().itertuples(index=False))
+
+        os.makedirs(config.GENERATED_SHARDS_PATH, exist_ok=True)
+        inventory.SharedInventory.start_tracker()
+        with concurrent.futures.ProcessPoolExecutor(
+            self.workers,
+            initializer=logs.Logs.init_worker_logs,
+            initargs=(config.FLIGHT_RECORDER_SIZE,),
+        ) as executor:
+            # Parse the seats CSV files once in the worker processes, and share them
+            # with all worker processes in a shared memory region.
+            room_ids = [row.room_id for row in rooms]
+            shared_inventory = inventory.SharedInventory.create(
+                {
+                    row.room_id: (row.room_name, row.capacity, seat_arrays)
+                    for row, seat_arrays in zip(
+                        rooms, executor.map(utility.Utility.get_seat_arrays, room_ids)
+                    )
+                }
+            )
+            try:
+                shard_results = self.run_shards(
+                    executor, shared_inventory, rooms, student_names
+                )
+            finally:
+                shared_inventory.close()
+
+        # Merge the sorted shards of the output students CSV file.
+        shard_paths = [shard_path for shard_path, _, _ in shard_results]
+        total_students = Sharder.merge_students_csv(shard_paths)
+        for shard_path in shard_paths:
+            os.remove(shard_path)
+        os.rmdir(config.GENERATED_SHARDS_PATH)
+        generator.Generator.count_output_bytes(config.GENERATED_STUDENT_PATH)
+        generator.Generator.OUTPUT_BYTES += sum(
+            output_bytes for _, _, output_bytes in shard_results
+        )
+
+        # Write report.
+        logs.Logs.write_report("Output students CSV generated successfully.")
+        logs.Logs.write_report(f"Total Students: {total_students}")
+        generator.Generator.write_all_rooms_report_header()
+        room_results = sorted(
+            room_result
+            for _, room_results, _ in shard_results
+            for room_result in room_results
+        )
+        for room_id, room_name, capacity, assigned_amount, unassigned in room_results:
+            generator.Generator.write_room_report(
+                types.SimpleNamespace(
+                    room_id=room_id, room_name=room_name, capacity=capacity
+                ),
+                assigned_amount,
+                unassigned,
+            )
+
+        # Write logs.
+        messages = [
+            "SHARDED RUN COMPLETED",
+            f"TOTAL STUDENTS = {total_students}",
+            f"TOTAL ROOMS = {len(room_results)}",
+            f"SHARDS = {len(shard_results)}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    def run_shards(self, executor, shared_inventory, rooms, student_names):
+        """
+        Shuffle and partition the students, split the rooms into shards, and run each
+        shard in a worker process.
+
+        Args:
+            executor (concurrent.futures.Executor): The executor for the worker processes.
+            shared_inventory (SharedInventory): The shared room and seat inventory.
+            rooms (list): The rows of the rooms CSV file.
+            student_names (dict): A dictionary mapping student IDs to their names.
+
+        Returns:
+            list[tuple]: The results of run_shard() of each shard.
+        """
+
+        # Count the available seats of each room from the shared inventory.
+        available_seats = {
+            row.room_id: shared_inventory.get_available_amount(idx)
+            for idx, row in enumerate(rooms)
+        }
+        config.TOTAL_AVAILABLE_SEATS = sum(available_seats.values())
+
+        # Shuffle the students, and partition them to the rooms.
+        all_student_ids = sorted(student_names)
+        if self.randomizer.is_random_mode:
+            random.Random(self.randomizer.seed).shuffle(all_student_ids)
+        partitioned_amount = randomizer.Randomizer.partition_seat_amount(
+            randomizer.Randomizer.allocate_rooms(available_seats, len(all_student_ids)),
+            len(all_student_ids),
+        )
+        if config.ALLOCATION_STRATEGY == config.ALLOCATION_FEWEST_ROOMS:
+            randomizer.Randomizer.write_allocation_report(
+                available_seats, partitioned_amount, {}
+            )
+
+        # Split the rooms and their students into the shards, then run them.
+        shard_tasks = Sharder.get_shard_tasks(
+            rooms, partitioned_amount, all_student_ids, student_names, self.shards
+        )
+        del all_student_ids
+        futures = [
+            executor.submit(
+                Sharder.run_shard,
+                shard_idx,
+                shard_rooms,
+                self.randomizer.is_random_mode,
+                self.randomizer.seed,
+                shared_inventory.name,
+            )
+            for shard_idx, shard_rooms in enumerate(shard_tasks)
+        ]
+        del shard_tasks
+        return [future.result() for future in futures]
+
+    @staticmethod
+    def get_shard_tasks(
+        rooms, partitioned_amount, all_student_ids, student_names, shards
+    ):
+        """
+        Split the rooms into contiguous shards with about the same number of students,
+        together with the students of each room.
+
+        Args:
+            rooms (list): The rows of the rooms CSV file.
+            partitioned_amount (dict): A dictionary mapping room IDs to their number of students.
+            all_student_ids (list): The shuffled student IDs.
+            student_names (dict): A dictionary mapping student IDs to their names.
+            shards (int): The number of shards.
+
+        Returns:
+            list[list[tuple]]: The (room ID, room name, capacity, students) of the rooms
+            of each shard, where the students are (student ID, student name) tuples.
+        """
+
+        total_students = sum(partitioned_amount.values())
+        SHARD_TASKS = [[]]
+        idx = 0
+        for row in rooms:
+            # Start the next shard when the current shard has its share of the students.
+            seat_amount = partitioned_amount[row.room_id]
+            if (
+                SHARD_TASKS[-1]
+                and len(SHARD_TASKS) < shards
+                and idx >= len(SHARD_TASKS) * total_students / shards
+            ):
+                SHARD_TASKS.append([])
+
+            students = [
+                (student_id, student_names[student_id])
+                for student_id in all_student_ids[idx : idx + seat_amount]
+            ]
+            SHARD_TASKS[-1].append((row.room_id, row.room_name, row.capacity, students))
+            idx += seat_amount
+
+        return SHARD_TASKS
+
+    @staticmethod
+    def run_shard(shard_idx, shard_rooms, is_random_mode, seed, inventory_name):
+        """
+        Assign the seats of the rooms of a shard, and write their output room CSV files
+        and the sorted shard of the output students CSV file. It runs in a worker process.
+
+        Args:
+            shard_idx (int): The index of the shard.
+            shard_rooms (list[tuple]): The rooms of the shard from get_shard_tasks().
+            is_random_mode (bool): Flag to enable or disable random mode.
+            seed (float or int or str): The seed of the run.
+            inventory_name (str): The name of the shared room and seat inventory.
+
+        Returns:
+            tuple: The path of the shard of the output students CSV file, the
+            (room ID, room name, capacity, assigned amount, unassigned seats) of each room,
+            and the total size in bytes of the output room CSV files.
+        """
+
+        # Attach to the shared inventory instead of reading the seats CSV files again.
+        shared_inventory = inventory.SharedInventory.attach(inventory_name)
+
+        # A worker process may run several shards, so its counter starts at each shard.
+        generator.Generator.OUTPUT_BYTES = 0
+
+        STUDENTS_DB = {}
+        ROOM_RESULTS = []
+        for room_id, room_name, capacity, students in shard_rooms:
+            # Create the objects of the room and its students only.
+            room_obj = room.Room(
+                room_id, room_name, capacity, *shared_inventory.get_seat_arrays(room_id)
+            )
+            room_students = {
+                student_id: student.Student(student_id, student_name)
+                for student_id, student_name in students
+            }
+
+            # Assign the room with its own seed, so it does not depend on the other rooms.
+            randomizer.Randomizer(
+                is_random_mode,
+                f"{seed}:{room_id}",
+                {room_id: room_obj},
+                room_students,
+                {},
+            ).assign_seats_to_students()
+
+            # Write the output room CSV file.
+            assigned_amount, unassigned = generator.Generator.write_room_csv(room_obj)
+            ROOM_RESULTS.append(
+                (room_id, room_name, capacity, assigned_amount, unassigned)
+            )
+            STUDENTS_DB.update(room_students)
+
+        # Write the shard of the output students CSV file, sorted by student ID.
+        shard_path = os.path.join(
+            config.GENERATED_SHARDS_PATH, f"students.{shard_idx:03d}.csv"
+        )
+        generator.Generator.get_students_data_frame(STUDENTS_DB).to_csv(
+            shard_path, index=False, header=False
+        )
+
+        return shard_path, ROOM_RESULTS, generator.Generator.OUTPUT_BYTES
+
+    @staticmethod
+    def merge_students_csv(shard_paths):
+        """
+        Merge the sorted shards of the output students CSV file into the output students
+        CSV file with a k-way merge, reading each shard as a stream. The student IDs
+        are strings, so they are merged in string order.
+
+        Args:
+            shard_paths (list[str]): The paths of the shards.
+
+        Returns:
+            int: The number of students written.
+        """
+
+        # The exit stack closes all opened shards, even if a later one cannot be opened.
+        total_students = 0
+        with contextlib.ExitStack() as exit_stack:
+            shard_files = [
+                exit_stack.enter_context(open(shard_path, newline="", encoding="utf-8"))
+                for shard_path in shard_paths
+            ]
+            output_file = exit_stack.enter_context(
+                open(
+                    config.GENERATED_STUDENT_PATH,
+                    "w",
+                    newline="",
+                    encoding="utf-8-sig",
+                )
+            )
+            writer = csv.writer(output_file, lineterminator=os.linesep)
+            writer.writerow(config.OUTPUT_STUDENTS_CSV_HEADER)
+            for row in heapq.merge(
+                *(csv.reader(shard_file) for shard_file in shard_files),
+                key=lambda row: row[0],
+            ):
+                writer.writerow(row)
+                total_students += 1
+
+        # Write logs.
+        messages = [
+            "OUTPUT STUDENTS CSV MERGED",
+            f"PATH = {config.GENERATED_STUDENT_PATH}",
+            f"SHARDS = {len(shard_paths)}",
+            f"TOTAL STUDENTS = {total_students}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        return total_students
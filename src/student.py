@@ -19,6 +19,10 @@ class Student:
         seat (Seat or None): The seat assigned to the student, if any.
     """
 
+    # Keep the attributes in fixed slots without a dictionary, as there is one
+    # Student object for each row of the students database.
+    __slots__ = ("room", "seat", "student_id", "student_name")
+
     def __init__(self, student_id, student_name):
         """Initialize a Student object.
 
@@ -0,0 +1,205 @@
+# ----------------------------------------------------------------------
+# File Name     : utilisation.py
+# Author        : Worralop Srichainont
+# Description   : UtilisationIndex class for querying the seat utilisation
+#                 of all rooms from their occupancy bitmaps.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import bisect
+
+import logs
+
+
+class UtilisationIndex:
+    """
+    UtilisationIndex class for querying the seat utilisation of all rooms.
+
+    The seat counts of each room are taken from its availability and occupancy bitmaps,
+    and the rooms are kept sorted by utilisation, so the queries do not rescan any seat.
+
+    Attributes:
+        room_counts (dict): A dictionary mapping room IDs to their
+        (available seats, occupied seats, remaining seats).
+        ranking (list[tuple]): The (utilisation, room ID) of all rooms,
+        sorted from the emptiest room to the fullest room.
+        total_available_seats (int): The total available seats of all rooms.
+        total_free_seats (int): The total remaining seats of all rooms.
+    """
+
+    def __init__(self, rooms_db):
+        """
+        Initialize a UtilisationIndex object from the rooms.
+
+        Args:
+            rooms_db (dict): A dictionary mapping room IDs to their Room objects.
+        """
+
+        # Initialize attributes.
+        self.room_counts = {}
+        self.ranking = []
+        self.total_available_seats = 0
+        self.total_free_seats = 0
+        for room_obj in rooms_db.values():
+            self.update_room(room_obj)
+
+        # Write logs.
+        messages = [
+            "UTILISATION INDEX CREATED",
+            f"TOTAL ROOMS = {len(self.room_counts)}",
+            f"TOTAL FREE SEATS = {self.total_free_seats}",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def get_utilisation(available_seats, occupied_seats):
+        """
+        Get the ratio of the occupied seats to the available seats of a room.
+
+        Args:
+            available_seats (int): The number of available seats.
+            occupied_seats (int): The number of occupied seats.
+
+        Returns:
+            float: The utilisation ratio, or 0.0 if the room has no available seat.
+        """
+
+        return occupied_seats / available_seats if available_seats else 0.0
+
+    def update_room(self, room_obj):
+        """
+        Add a room to the index, or update it after its assignment has changed.
+
+        Args:
+            room_obj (Room): The Room object with its availability and occupancy bitmaps.
+        """
+
+        # Remove the previous counts of the room.
+        room_id = room_obj.room_id
+        if room_id in self.room_counts:
+            available_seats, occupied_seats, remaining_seats = self.room_counts[room_id]
+            self.ranking.remove(
+                (
+                    UtilisationIndex.get_utilisation(available_seats, occupied_seats),
+                    room_id,
+                )
+            )
+            self.total_available_seats -= available_seats
+            self.total_free_seats -= remaining_seats
+
+        # Count the seats from the bitmaps.
+        available_seats = room_obj.count_bits(room_obj.availability_bits)
+        occupied_seats = room_obj.count_bits(room_obj.occupancy_bits)
+        remaining_seats = room_obj.get_remaining_amount()
+
+        # Add the new counts of the room.
+        self.room_counts[room_id] = (available_seats, occupied_seats, remaining_seats)
+        bisect.insort(
+            self.ranking,
+            (
+                UtilisationIndex.get_utilisation(available_seats, occupied_seats),
+                room_id,
+            ),
+        )
+        self.total_available_seats += available_seats
+        self.total_free_seats += remaining_seats
+
+    def get_remaining_seats(self, room_id):
+        """
+        Get the number of remaining seats of a room.
+
+        Args:
+            room_id (str): The unique identifier for the room.
+
+        Returns:
+            int: The number of available seats without a student.
+        """
+
+        return self.room_counts[room_id][2]
+
+    def get_fullest_rooms(self, amount=1):
+        """
+        Get the rooms with the highest utilisation.
+
+        Args:
+            amount (int, optional): The number of rooms to get. Defaults to 1.
+
+        Returns:
+            list[tuple]: The (utilisation, room ID) of the rooms, fullest first.
+        """
+
+        return self.ranking[-amount:][::-1] if amount > 0 else []
+
+    def get_emptiest_rooms(self, amount=1):
+        """
+        Get the rooms with the lowest utilisation.
+
+        Args:
+            amount (int, optional): The number of rooms to get. Defaults to 1.
+
+        Returns:
+            list[tuple]: The (utilisation, room ID) of the rooms, emptiest first.
+        """
+
+        return self.ranking[:amount]
+
+    def get_total_free_seats(self):
+        """
+        Get the total remaining seats of all rooms.
+
+        Returns:
+            int: The total available seats without a student.
+        """
+
+        return self.total_free_seats
+
+    def write_report(self, amount=3):
+        """
+        Write the utilisation summary table of all rooms to the report file.
+
+        Args:
+            amount (int, optional): The number of fullest and emptiest rooms to list.
+            Defaults to 3.
+        """
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report("Seat utilisation summary.")
+        logs.Logs.write_report(
+            f"{'Room ID':<20}{'Available':>12}{'Occupied':>12}"
+            f"{'Remaining':>12}{'Utilisation':>14}"
+        )
+        for room_id, (available_seats, occupied_seats, remaining_seats) in sorted(
+            self.room_counts.items()
+        ):
+            utilisation = UtilisationIndex.get_utilisation(
+                available_seats, occupied_seats
+            )
+            logs.Logs.write_report(
+                f"{room_id:<20}{available_seats:>12}{occupied_seats:>12}"
+                f"{remaining_seats:>12}{utilisation:>14.1%}"
+            )
+        total_occupied_seats = self.total_available_seats - self.total_free_seats
+        total_utilisation = UtilisationIndex.get_utilisation(
+            self.total_available_seats, total_occupied_seats
+        )
+        logs.Logs.write_report(
+            f"{'TOTAL':<20}{self.total_available_seats:>12}{total_occupied_seats:>12}"
+            f"{self.total_free_seats:>12}{total_utilisation:>14.1%}"
+        )
+        logs.Logs.write_report(
+            "Fullest Rooms: "
+            + ", ".join(
+                f"{room_id} ({utilisation:.1%})"
+                for utilisation, room_id in self.get_fullest_rooms(amount)
+            )
+        )
+        logs.Logs.write_report(
+            "Emptiest Rooms: "
+            + ", ".join(
+                f"{room_id} ({utilisation:.1%})"
+                for utilisation, room_id in self.get_emptiest_rooms(amount)
+            )
+        )
+        logs.Logs.write_report(f"Total Free Seats: {self.total_free_seats}")
+        logs.Logs.write_report("-" * 88)
@@ -13,7 +13,6 @@ import pandas as pd
 import config
 import logs
 import room
-import seat
 import student
 
 
@@ -28,7 +27,7 @@ class Utility:
     @staticmethod
     def get_students_database():
         """
-        Read the student CSV database file, then initialize Student object,
+        Read the student CSV database file in chunks, then initialize Student object,
         and store them on the global variable STUDENTS_DB.
         """
 
@@ -36,32 +35,105 @@ class Utility:
         messages = ["get_students_database() CALLED"]
         logs.Logs.write_logs(messages)
 
-        # Read the CSV file into a DataFrame.
-        data_frame = pd.read_csv(config.STUDENTS_PATH)
-        messages = [f"TOTAL STUDENTS READ FROM CSV = {len(data_frame)}"]
-        logs.Logs.write_logs(messages)
+        # Create the Student objects of each chunk, then store them in the global
+        # STUDENTS_DB dictionary, so only one chunk of rows is kept at a time.
+        total_students = 0
+        for chunk in Utility.read_students_chunks():
+            for student_id, student_name in chunk:
+                config.STUDENTS_DB[student_id] = student.Student(
+                    student_id, student_name
+                )
+            total_students += len(chunk)
+
+            # Write logs.
+            messages = [
+                "STUDENT OBJECTS STORED IN STUDENTS_DB",
+                f"CHUNK STUDENTS = {len(chunk)}",
+                f"TOTAL STUDENTS = {total_students}",
+            ]
+            logs.Logs.write_logs(messages)
 
         # Update the total number of students to the global variable.
-        config.TOTAL_STUDENTS = len(data_frame)
+        config.TOTAL_STUDENTS = total_students
         messages = [
             f"TOTAL STUDENTS UPDATED TO GLOBAL VARIABLE = {config.TOTAL_STUDENTS}"
         ]
         logs.Logs.write_logs(messages)
 
-        # Iterate through each row in the DataFrame and create Student objects,
-        # then store them in the global STUDENTS_DB dictionary.
-        for row in data_frame.itertuples():
-            # Create Student object.
-            current_student = student.Student(row.student_id, row.student_name)
+    @staticmethod
+    def read_students_chunks(chunk_size=None):
+        """
+        Read the student CSV database file in chunks of rows. The student IDs are read
+        as strings, so the leading zeros are kept. Only the rows of one chunk are
+        parsed at a time, so the memory used for reading is bounded by the chunk size.
 
-            # Store the Student object in the global STUDENTS_DB dictionary.
-            config.STUDENTS_DB[row.student_id] = current_student
+        Args:
+            chunk_size (int or None, optional): The number of rows of each chunk.
+            Defaults to None, which uses config.STUDENTS_CHUNK_SIZE.
+
+        Yields:
+            list[tuple]: The (student ID, student name) of each row of the chunk.
+        """
+
+        if chunk_size is None:
+            chunk_size = config.STUDENTS_CHUNK_SIZE
+
+        # Read only the student_id and student_name columns as strings.
+        with pd.read_csv(
+            config.STUDENTS_PATH,
+            usecols=["student_id", "student_name"],
+            dtype=str,
+            keep_default_na=False,
+            chunksize=chunk_size,
+        ) as reader:
+            for data_frame in reader:
+                CHUNK = list(
+                    zip(
+                        data_frame["student_id"].tolist(),
+                        data_frame["student_name"].tolist(),
+                    )
+                )
+                del data_frame
+
+                # Write logs.
+                messages = [f"TOTAL STUDENTS READ FROM CSV CHUNK = {len(CHUNK)}"]
+                logs.Logs.write_logs(messages)
+
+                yield CHUNK
+
+    @staticmethod
+    def get_pins_database():
+        """
+        Read the optional pin CSV database file, and store the pinned room and seat
+        of each pinned student on the global variable PINS_DB.
+        A pin with an empty seat_id only pins the student to the room.
+        """
+
+        # Write logs.
+        messages = ["get_pins_database() CALLED"]
+        logs.Logs.write_logs(messages)
+
+        # The pin database is optional.
+        if not os.path.exists(config.PINS_PATH):
+            logs.Logs.write_logs(["PIN DATABASE NOT FOUND"])
+            return
+
+        # Read the CSV file into a DataFrame.
+        data_frame = pd.read_csv(config.PINS_PATH, dtype={"student_id": str})
+        messages = [f"TOTAL PINS READ FROM CSV = {len(data_frame)}"]
+        logs.Logs.write_logs(messages)
+
+        # Store the pinned room and seat of each student in the global PINS_DB dictionary.
+        for row in data_frame.itertuples():
+            seat_id = None if pd.isna(row.seat_id) else row.seat_id
+            config.PINS_DB[row.student_id] = (row.room_id, seat_id)
 
             # Write logs.
             messages = [
-                "STUDENT OBJECT STORED IN STUDENTS_DB",
-                f"ID = {current_student.student_id}",
-                f"NAME = {current_student.student_name}",
+                "PIN STORED IN PINS_DB",
+                f"STUDENT ID = {row.student_id}",
+                f"ROOM ID = {row.room_id}",
+                f"SEAT ID = {seat_id if seat_id is not None else 'ANY'}",
             ]
             logs.Logs.write_logs(messages)
 
@@ -77,9 +149,7 @@ class Utility:
         logs.Logs.write_logs(messages)
 
         # Read the CSV file into a DataFrame.
-        data_frame = pd.read_csv(config.ROOMS_PATH)
-        messages = [f"TOTAL ROOMS READ FROM CSV = {len(data_frame)}"]
-        logs.Logs.write_logs(messages)
+        data_frame = Utility.read_rooms_csv()
 
         # Iterate through each row in the DataFrame and create Room objects,
         # then store them in the global ROOMS_DB dictionary.
@@ -98,11 +168,27 @@ class Utility:
                 f"ID = {current_room.room_id}",
                 f"NAME = {current_room.room_name}",
                 f"CAPACITY = {current_room.capacity}",
-                f"TOTAL SEATS = {len(current_room.seats_db)}",
+                f"TOTAL SEATS = {len(current_room.seat_ids)}",
                 f"AVAILABLE SEATS = {len(current_room.available_seats_id)}",
             ]
             logs.Logs.write_logs(messages)
 
+    @staticmethod
+    def read_rooms_csv():
+        """
+        Read the room CSV database file.
+
+        Returns:
+            pandas.DataFrame: The room database with room_id, room_name and capacity columns.
+        """
+
+        # Read the CSV file into a DataFrame.
+        data_frame = pd.read_csv(config.ROOMS_PATH)
+        messages = [f"TOTAL ROOMS READ FROM CSV = {len(data_frame)}"]
+        logs.Logs.write_logs(messages)
+
+        return data_frame
+
     @staticmethod
     def get_room_object(room_id, room_name, capacity):
         """
@@ -114,13 +200,31 @@ class Utility:
             capacity (int): The total capacity of the room.
 
         Returns:
-            Room: An instance of the Room class containing seat objects and available seat IDs.
+            Room: An instance of the Room class containing seat arrays and available seat IDs.
         """
 
         # Write logs.
         messages = ["get_room_object() CALLED", f"ROOM ID = {room_id}"]
         logs.Logs.write_logs(messages)
 
+        # Read the seat arrays, then create the Room object.
+        seat_arrays = Utility.get_seat_arrays(room_id)
+        return Utility.create_room(room_id, room_name, capacity, seat_arrays)
+
+    @staticmethod
+    def get_seat_arrays(room_id):
+        """
+        Read the seats CSV file of a room into compact arrays sorted by seat ID.
+        It does not change any global variable, so it can be called from any thread.
+
+        Args:
+            room_id (str): The unique identifier for the room.
+
+        Returns:
+            tuple: A tuple containing the list of seat IDs, the list of seat names,
+            and the bytearray of seat availability.
+        """
+
         # Construct the file path for the room's seats CSV file.
         FILENAME = f"{room_id}.csv"
         SEATS_DB_PATH = os.path.join(config.SEATS_PATH, FILENAME)
@@ -130,45 +234,49 @@ class Utility:
         messages = [f"TOTAL SEATS READ FROM CSV = {len(data_frame)}"]
         logs.Logs.write_logs(messages)
 
-        # Initialize seat objects dictionary and available seat IDs list.
-        SEATS_DB = {}
-        AVAILABLE_SEATS_IDS = []
+        # Sort the seat rows by seat ID, and keep them as compact arrays.
+        # Seat objects are only created later for the seats that are requested.
+        seat_ids = data_frame["seat_id"].tolist()
+        seat_names = data_frame["seat_name"].tolist()
+        seat_availability = data_frame["is_available"].tolist()
+        order = sorted(range(len(seat_ids)), key=seat_ids.__getitem__)
+        SEAT_IDS = [seat_ids[idx] for idx in order]
+        SEAT_NAMES = [seat_names[idx] for idx in order]
+        SEAT_AVAILABILITY = bytearray(
+            str(seat_availability[idx]).lower() == "true" for idx in order
+        )
 
-        # Iterate through each row in the DataFrame and create Seat objects,
-        for row in data_frame.itertuples():
-            # Create Seat object.
-            current_seat = seat.Seat(
-                row.seat_id, row.seat_name, row.is_available, room_id
-            )
+        # Write logs.
+        messages = [
+            "SEAT ARRAYS CREATED",
+            f"ROOM ID = {room_id}",
+            f"TOTAL SEATS = {len(SEAT_IDS)}",
+            f"AVAILABLE SEATS = {sum(SEAT_AVAILABILITY)}",
+        ]
+        logs.Logs.write_logs(messages)
 
-            # If the seat is available, add its ID to the AVAILABLE_SEATS_IDS list.
-            if row.is_available:
-                AVAILABLE_SEATS_IDS.append(row.seat_id)
+        return SEAT_IDS, SEAT_NAMES, SEAT_AVAILABILITY
 
-                # Write logs.
-                messages = [
-                    "SEAT AVAILABLE - ADDED TO AVAILABLE_SEATS_IDS",
-                    f"SEAT ID = {row.seat_id}",
-                    f"SEAT NAME = {row.seat_name}",
-                    f"ROOM ID = {room_id}",
-                ]
-                logs.Logs.write_logs(messages)
+    @staticmethod
+    def create_room(room_id, room_name, capacity, seat_arrays):
+        """
+        Create the Room object from its seat arrays, and update the global counter
+        variable TOTAL_AVAILABLE_SEATS.
 
-            # Store the Seat object in the SEATS_DB dictionary.
-            SEATS_DB[row.seat_id] = current_seat
+        Args:
+            room_id (str): The unique identifier for the room.
+            room_name (str): The name of the room.
+            capacity (int): The total capacity of the room.
+            seat_arrays (tuple): The seat arrays returned by get_seat_arrays().
 
-            # Write logs.
-            messages = [
-                "SEAT OBJECT STORED IN SEATS_DB",
-                f"ID = {current_seat.seat_id}",
-                f"NAME = {current_seat.seat_name}",
-                f"IS AVAILABLE = {current_seat.is_available}",
-                f"ROOM ID = {current_seat.room_id}",
-            ]
-            logs.Logs.write_logs(messages)
+        Returns:
+            Room: An instance of the Room class containing seat arrays and available seat IDs.
+        """
+
+        SEAT_IDS, SEAT_NAMES, SEAT_AVAILABILITY = seat_arrays
 
         # Update the total number of available seats to the global counter variable TOTAL_AVAILABLE_SEATS.
-        config.TOTAL_AVAILABLE_SEATS += len(AVAILABLE_SEATS_IDS)
+        config.TOTAL_AVAILABLE_SEATS += sum(SEAT_AVAILABILITY)
 
         # Write logs.
         messages = [
@@ -178,6 +286,7 @@ class Utility:
         logs.Logs.write_logs(messages)
 
         # Create and return the Room object.
-        AVAILABLE_SEATS_IDS.sort()
-        ROOM = room.Room(room_id, room_name, capacity, SEATS_DB, AVAILABLE_SEATS_IDS)
+        ROOM = room.Room(
+            room_id, room_name, capacity, SEAT_IDS, SEAT_NAMES, SEAT_AVAILABILITY
+        )
         return ROOM
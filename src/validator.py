@@ -0,0 +1,400 @@
+# ----------------------------------------------------------------------
+# File Name     : validator.py
+# Author        : Worralop Srichainont
+# Description   : Validator class for checking the input CSV databases
+#                 before any object is created in the seating arrangement
+#                 application.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+
+import pandas as pd
+
+import config
+import logs
+
+
+class ValidationError(Exception):
+    """
+    Exception raised when the input CSV databases are invalid.
+
+    Attributes:
+        errors (list[str]): All errors found in the input CSV databases.
+    """
+
+    def __init__(self, errors):
+        """
+        Initialize a ValidationError object.
+
+        Args:
+            errors (list[str]): All errors found in the input CSV databases.
+        """
+
+        super().__init__(f"{len(errors)} error(s) found in the input CSV databases.")
+        self.errors = errors
+
+
+class Validator:
+    """
+    Validator class for checking the input CSV databases in bulk column operations,
+    before any Student, Seat or Room object is created.
+
+    Attributes:
+        None
+    """
+
+    @staticmethod
+    def check_databases():
+        """
+        Validate the input CSV databases, and write the result to the report file.
+
+        Raises:
+            ValidationError: If any error is found in the input CSV databases.
+        """
+
+        # Write logs.
+        logs.Logs.write_logs(["check_databases() CALLED"])
+
+        # Validate all input CSV databases.
+        errors = Validator.validate_databases()
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        if errors:
+            logs.Logs.write_report(f"Input databases validation failed: {len(errors)}")
+            for error in errors:
+                logs.Logs.write_report(f"  - {error}")
+            logs.Logs.write_report("-" * 88)
+            raise ValidationError(errors)
+
+        logs.Logs.write_report("Input databases validated successfully.")
+        logs.Logs.write_report("-" * 88)
+
+    @staticmethod
+    def validate_databases():
+        """
+        Validate the students, rooms and seats CSV databases, and collect all errors.
+
+        Returns:
+            list[str]: All errors found in the input CSV databases, or an empty list.
+        """
+
+        errors = []
+
+        # Read and validate the students database.
+        students = Validator.read_csv(
+            config.STUDENTS_PATH, ["student_id", "student_name"], errors
+        )
+        if students is not None:
+            Validator.validate_students(students, errors)
+
+        # Read and validate the rooms database.
+        rooms = Validator.read_csv(
+            config.ROOMS_PATH, ["room_id", "room_name", "capacity"], errors
+        )
+        if rooms is None:
+            return errors
+        Validator.validate_rooms(rooms, errors)
+
+        # Read all seats databases, then validate them together with the rooms database.
+        seats = Validator.read_seats(rooms, errors)
+        Validator.validate_seats(rooms, seats, errors)
+
+        # Read and validate the optional pins database.
+        if os.path.exists(config.PINS_PATH):
+            pins = Validator.read_csv(
+                config.PINS_PATH, ["student_id", "room_id", "seat_id"], errors
+            )
+            if pins is not None:
+                Validator.validate_pins(students, rooms, seats, pins, errors)
+
+        # Check whether the total available seats can fit all students.
+        if students is not None:
+            total_students = len(students)
+            total_available_seats = int(
+                seats["is_available"].str.lower().eq("true").sum()
+            )
+            if total_available_seats < total_students:
+                errors.append(
+                    f"Total available seats ({total_available_seats}) are less than "
+                    f"total students ({total_students})."
+                )
+
+        # Write logs.
+        messages = ["INPUT DATABASES VALIDATED", f"TOTAL ERRORS = {len(errors)}"]
+        logs.Logs.write_logs(messages)
+
+        return errors
+
+    @staticmethod
+    def read_csv(path, columns, errors):
+        """
+        Read a CSV database file with all values as strings, and check its columns.
+
+        Args:
+            path (str): The path of the CSV database file.
+            columns (list[str]): The required columns of the CSV database file.
+            errors (list[str]): The list to append the errors to.
+
+        Returns:
+            pandas.DataFrame or None: The CSV database, or None if it cannot be used.
+        """
+
+        filename = os.path.relpath(path, config.DB_PATH)
+
+        # Check whether the file exists.
+        if not os.path.isfile(path):
+            errors.append(f"{filename}: file not found.")
+            return None
+
+        # Read all values as strings, so the values are checked as written in the file.
+        data_frame = pd.read_csv(path, dtype=str, keep_default_na=False)
+
+        # Check whether all required columns exist.
+        missing_columns = [col for col in columns if col not in data_frame.columns]
+        if missing_columns:
+            errors.append(f"{filename}: missing columns {missing_columns}.")
+            return None
+
+        return data_frame
+
+    @staticmethod
+    def validate_students(students, errors):
+        """
+        Validate the students database.
+
+        Args:
+            students (pandas.DataFrame): The students database.
+            errors (list[str]): The list to append the errors to.
+        """
+
+        # Check for empty student IDs.
+        empty_rows = Validator.get_row_numbers(students["student_id"].str.strip() == "")
+        if empty_rows:
+            errors.append(f"students.csv: empty student_id at rows {empty_rows}.")
+
+        # Check for duplicate student IDs.
+        duplicate_ids = Validator.get_duplicate_values(students["student_id"])
+        if duplicate_ids:
+            errors.append(f"students.csv: duplicate student_id {duplicate_ids}.")
+
+    @staticmethod
+    def validate_rooms(rooms, errors):
+        """
+        Validate the rooms database.
+
+        Args:
+            rooms (pandas.DataFrame): The rooms database.
+            errors (list[str]): The list to append the errors to.
+        """
+
+        # Check for empty room IDs.
+        empty_rows = Validator.get_row_numbers(rooms["room_id"].str.strip() == "")
+        if empty_rows:
+            errors.append(f"rooms.csv: empty room_id at rows {empty_rows}.")
+
+        # Check for duplicate room IDs.
+        duplicate_ids = Validator.get_duplicate_values(rooms["room_id"])
+        if duplicate_ids:
+            errors.append(f"rooms.csv: duplicate room_id {duplicate_ids}.")
+
+        # Check whether all capacities are non-negative integers.
+        invalid_rows = Validator.get_row_numbers(~rooms["capacity"].str.isdigit())
+        if invalid_rows:
+            errors.append(
+                f"rooms.csv: capacity is not a non-negative integer at rows {invalid_rows}."
+            )
+
+    @staticmethod
+    def read_seats(rooms, errors):
+        """
+        Read the seats databases of all rooms into one DataFrame, and check whether
+        the rooms database and the seats database files refer to each other.
+
+        Args:
+            rooms (pandas.DataFrame): The rooms database.
+            errors (list[str]): The list to append the errors to.
+
+        Returns:
+            pandas.DataFrame: The seats databases of all rooms, with a room_id column.
+        """
+
+        # Compare the room IDs with the seats database files.
+        room_ids = set(rooms["room_id"])
+        seat_file_ids = set()
+        if os.path.isdir(config.SEATS_PATH):
+            seat_file_ids = {
+                os.path.splitext(filename)[0]
+                for filename in os.listdir(config.SEATS_PATH)
+                if filename.endswith(".csv")
+            }
+        missing_ids = sorted(room_ids - seat_file_ids)
+        if missing_ids:
+            errors.append(
+                f"rooms.csv: rooms without seats database file {missing_ids}."
+            )
+        unknown_ids = sorted(seat_file_ids - room_ids)
+        if unknown_ids:
+            errors.append(
+                f"seats: seats database files of unknown rooms {unknown_ids}."
+            )
+
+        # Read the seats database files of all known rooms.
+        data_frames = []
+        for room_id in sorted(room_ids & seat_file_ids):
+            data_frame = Validator.read_csv(
+                os.path.join(config.SEATS_PATH, f"{room_id}.csv"),
+                ["seat_id", "seat_name", "is_available"],
+                errors,
+            )
+            if data_frame is not None:
+                data_frames.append(data_frame.assign(room_id=room_id))
+
+        # Combine all seats databases, so they can be validated in bulk.
+        if not data_frames:
+            return pd.DataFrame(
+                columns=["seat_id", "seat_name", "is_available", "room_id"], dtype=str
+            )
+        return pd.concat(data_frames, ignore_index=True)
+
+    @staticmethod
+    def validate_seats(rooms, seats, errors):
+        """
+        Validate the seats databases of all rooms.
+
+        Args:
+            rooms (pandas.DataFrame): The rooms database.
+            seats (pandas.DataFrame): The seats databases of all rooms, with a room_id column.
+            errors (list[str]): The list to append the errors to.
+        """
+
+        # Check for empty seat IDs.
+        empty_seats = seats[seats["seat_id"].str.strip() == ""]
+        for room_id in sorted(empty_seats["room_id"].unique()):
+            errors.append(f"seats/{room_id}.csv: empty seat_id.")
+
+        # Check for duplicate seat IDs inside each room.
+        duplicate_seats = seats[seats.duplicated(["room_id", "seat_id"], keep=False)]
+        for room_id, seat_ids in duplicate_seats.groupby("room_id")["seat_id"]:
+            errors.append(
+                f"seats/{room_id}.csv: duplicate seat_id {sorted(seat_ids.unique())}."
+            )
+
+        # Check whether all availabilities are boolean values.
+        invalid_seats = seats[
+            ~seats["is_available"].str.lower().isin(["true", "false"])
+        ]
+        for room_id, values in invalid_seats.groupby("room_id")["is_available"]:
+            errors.append(
+                f"seats/{room_id}.csv: is_available is not True or False "
+                f"{sorted(values.unique())}."
+            )
+
+        # Check whether the seat amount of each room matches its capacity.
+        valid_rooms = rooms[rooms["capacity"].str.isdigit()]
+        capacities = valid_rooms.set_index("room_id")["capacity"].astype(int)
+        seat_amounts = seats.groupby("room_id").size()
+        mismatched = capacities[
+            capacities.index.isin(seat_amounts.index)
+            & (capacities != seat_amounts.reindex(capacities.index))
+        ]
+        for room_id, capacity in mismatched.items():
+            errors.append(
+                f"seats/{room_id}.csv: {seat_amounts[room_id]} seats, "
+                f"but the room capacity is {capacity}."
+            )
+
+    @staticmethod
+    def validate_pins(students, rooms, seats, pins, errors):
+        """
+        Validate the pins database against the students, rooms and seats databases.
+
+        Args:
+            students (pandas.DataFrame or None): The students database, or None if it cannot be used.
+            rooms (pandas.DataFrame): The rooms database.
+            seats (pandas.DataFrame): The seats databases of all rooms, with a room_id column.
+            pins (pandas.DataFrame): The pins database.
+            errors (list[str]): The list to append the errors to.
+        """
+
+        # Check for duplicate pinned students.
+        duplicate_ids = Validator.get_duplicate_values(pins["student_id"])
+        if duplicate_ids:
+            errors.append(f"pins.csv: duplicate student_id {duplicate_ids}.")
+
+        # Check for unknown students and rooms.
+        if students is not None:
+            unknown_rows = Validator.get_row_numbers(
+                ~pins["student_id"].isin(students["student_id"])
+            )
+            if unknown_rows:
+                errors.append(f"pins.csv: unknown student_id at rows {unknown_rows}.")
+        unknown_rows = Validator.get_row_numbers(
+            ~pins["room_id"].isin(rooms["room_id"])
+        )
+        if unknown_rows:
+            errors.append(f"pins.csv: unknown room_id at rows {unknown_rows}.")
+
+        # Check whether each pinned seat exists and is available in its room.
+        is_seat_pin = pins["seat_id"].str.strip() != ""
+        available_seats = seats[seats["is_available"].str.lower() == "true"]
+        is_available = pd.MultiIndex.from_frame(pins[["room_id", "seat_id"]]).isin(
+            pd.MultiIndex.from_frame(available_seats[["room_id", "seat_id"]])
+        )
+        invalid_rows = Validator.get_row_numbers(is_seat_pin & ~is_available)
+        if invalid_rows:
+            errors.append(
+                f"pins.csv: seat_id is not an available seat of room_id at rows {invalid_rows}."
+            )
+
+        # Check for seats pinned to more than one student.
+        seat_pins = pins[is_seat_pin]
+        duplicate_seats = seat_pins[
+            seat_pins.duplicated(["room_id", "seat_id"], keep=False)
+        ]
+        for room_id, seat_ids in duplicate_seats.groupby("room_id")["seat_id"]:
+            errors.append(
+                f"pins.csv: seats of room {room_id} pinned more than once "
+                f"{sorted(seat_ids.unique())}."
+            )
+
+        # Check whether the pinned students of each room fit in its available seats.
+        pin_amounts = (
+            pins[pins["room_id"].isin(rooms["room_id"])].groupby("room_id").size()
+        )
+        seat_amounts = available_seats.groupby("room_id").size()
+        seat_amounts = seat_amounts.reindex(pin_amounts.index, fill_value=0)
+        for room_id in pin_amounts.index[pin_amounts > seat_amounts]:
+            errors.append(
+                f"pins.csv: {pin_amounts[room_id]} students pinned to room {room_id}, "
+                f"but it has {seat_amounts[room_id]} available seats."
+            )
+
+    @staticmethod
+    def get_duplicate_values(column):
+        """
+        Get the values which appear more than once in a column.
+
+        Args:
+            column (pandas.Series): The column to check.
+
+        Returns:
+            list[str]: The duplicate values in sorted order.
+        """
+
+        return sorted(column[column.duplicated()].unique())
+
+    @staticmethod
+    def get_row_numbers(mask):
+        """
+        Get the row numbers in the CSV file of the rows matching a mask.
+
+        Args:
+            mask (pandas.Series): The boolean mask of the rows.
+
+        Returns:
+            list[int]: The row numbers, counting the header as row 1.
+        """
+
+        return [idx + 2 for idx in mask[mask].index]
@@ -0,0 +1,391 @@
+# ----------------------------------------------------------------------
+# File Name     : watcher.py
+# Author        : Worralop Srichainont
+# Description   : Watcher class for rebuilding the seating arrangement
+#                 incrementally when the database files are changed.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+import time
+
+import assignment
+import config
+import generator
+import logs
+import renderer
+import room
+import utility
+import validator
+
+
+class Watcher:
+    """
+    Watcher class for rebuilding the seating arrangement incrementally
+    when the database files are changed.
+
+    On each change, only the changed database files are parsed again. The assignment is
+    computed again in memory for all rooms, because all rooms share one seeded random
+    sequence, so a change to any input can move students between any rooms. Only the
+    output files whose content has changed are written again.
+
+    Attributes:
+        randomizer (Randomizer): The randomizer used to assign seats to students.
+        signatures (dict): A dictionary mapping database file paths to their
+        (modified time, size) signatures.
+        room_frames (dict): A dictionary mapping room IDs to their last written output data.
+        student_rows (dict): The rows of the last written output students CSV file,
+        indexed by student ID.
+        rebuild_count (int): The number of rebuilds done.
+        pending_paths (set): The paths of the changed database files of the failed rebuild,
+        which are rebuilt again with the next change.
+    """
+
+    def __init__(self, randomizer):
+        """
+        Initialize a Watcher object from the databases and outputs of the completed run.
+
+        Args:
+            randomizer (Randomizer): The randomizer used to assign seats to students.
+        """
+
+        # Initialize attributes.
+        self.randomizer = randomizer
+        self.signatures = Watcher.get_signatures()
+        self.room_frames = {
+            room_id: generator.Generator.get_room_data_frame(room_obj)[0]
+            for room_id, room_obj in config.ROOMS_DB.items()
+        }
+        self.student_rows = Watcher.get_rows(
+            generator.Generator.get_students_data_frame()
+        )
+        self.rebuild_count = 0
+        self.pending_paths = set()
+
+        # Write logs.
+        messages = [
+            "WATCHER OBJECT CREATED",
+            f"WATCHED FILES = {len(self.signatures)}",
+            f"INTERVAL = {config.WATCH_INTERVAL} SECONDS",
+        ]
+        logs.Logs.write_logs(messages)
+
+    @staticmethod
+    def get_signatures():
+        """
+        Get the signatures of the students, rooms, pins and seats database files.
+
+        Returns:
+            dict: A dictionary mapping database file paths to their
+            (modified time, size) signatures.
+        """
+
+        paths = [config.STUDENTS_PATH, config.ROOMS_PATH, config.PINS_PATH]
+        if os.path.isdir(config.SEATS_PATH):
+            paths.extend(
+                entry.path
+                for entry in os.scandir(config.SEATS_PATH)
+                if entry.name.endswith(".csv")
+            )
+
+        SIGNATURES = {}
+        for path in paths:
+            if os.path.exists(path):
+                stat = os.stat(path)
+                SIGNATURES[path] = (stat.st_mtime_ns, stat.st_size)
+        return SIGNATURES
+
+    @staticmethod
+    def get_rows(data_frame):
+        """
+        Get the rows of an output data as tuples, indexed by their first column.
+
+        Args:
+            data_frame (pandas.DataFrame): The output data.
+
+        Returns:
+            dict: A dictionary mapping the first column value to each row.
+        """
+
+        return {row[0]: row for row in data_frame.itertuples(index=False, name=None)}
+
+    @staticmethod
+    def get_databases():
+        """
+        Get a copy of the databases which a rebuild reloads.
+
+        Returns:
+            tuple: The copies of STUDENTS_DB, PINS_DB and ROOMS_DB, with
+            TOTAL_STUDENTS and TOTAL_AVAILABLE_SEATS.
+        """
+
+        return (
+            dict(config.STUDENTS_DB),
+            dict(config.PINS_DB),
+            dict(config.ROOMS_DB),
+            config.TOTAL_STUDENTS,
+            config.TOTAL_AVAILABLE_SEATS,
+        )
+
+    @staticmethod
+    def restore_databases(databases):
+        """
+        Restore the databases copied before a failed rebuild, keeping the same
+        dictionary objects, since other modules refer to them.
+
+        Args:
+            databases (tuple): The databases returned by get_databases().
+        """
+
+        students_db, pins_db, rooms_db, total_students, total_available_seats = (
+            databases
+        )
+        for database, previous_database in (
+            (config.STUDENTS_DB, students_db),
+            (config.PINS_DB, pins_db),
+            (config.ROOMS_DB, rooms_db),
+        ):
+            database.clear()
+            database.update(previous_database)
+        config.TOTAL_STUDENTS = total_students
+        config.TOTAL_AVAILABLE_SEATS = total_available_seats
+
+    def watch(self):
+        """
+        Check the database files for changes and rebuild the outputs,
+        until the user stops the program with Ctrl+C.
+        """
+
+        print(f"Watching {config.DB_PATH} for changes. Press Ctrl+C to stop.")
+        try:
+            while True:
+                time.sleep(config.WATCH_INTERVAL)
+
+                # Find the changed, added and removed database files.
+                signatures = Watcher.get_signatures()
+                changed_paths = {
+                    path
+                    for path in set(signatures) | set(self.signatures)
+                    if signatures.get(path) != self.signatures.get(path)
+                }
+                self.signatures = signatures
+                if not changed_paths:
+                    continue
+
+                # Keep watching even if the changed files cannot be used yet,
+                # and include them again in the next rebuild. A failed rebuild keeps
+                # the previous outputs and restores the previous databases, so the next
+                # rebuild does not start from partly reloaded ones. ValidationError is
+                # raised by invalid databases, ValueError also covers the parser errors
+                # of pandas, and KeyError a missing column.
+                changed_paths |= self.pending_paths
+                databases = Watcher.get_databases()
+                try:
+                    self.rebuild(changed_paths)
+                    self.pending_paths = set()
+                except (
+                    validator.ValidationError,
+                    OSError,
+                    ValueError,
+                    KeyError,
+                ) as error:
+                    Watcher.restore_databases(databases)
+                    self.pending_paths = changed_paths
+                    print(f"Rebuild failed, waiting for the next change: {error}")
+                    if isinstance(error, validator.ValidationError):
+                        for message in error.errors:
+                            print(f"ERROR: {message}")
+                    logs.Logs.write_logs(["WATCH REBUILD FAILED", f"ERROR = {error}"])
+        except KeyboardInterrupt:
+            print("Watch mode stopped.\n")
+
+    def rebuild(self, changed_paths):
+        """
+        Parse the changed database files, assign seats again,
+        and write the output files whose content has changed.
+
+        Args:
+            changed_paths (set): The paths of the changed database files.
+        """
+
+        self.rebuild_count += 1
+        changed_inputs = sorted(
+            os.path.relpath(path, config.DB_PATH) for path in changed_paths
+        )
+        print(f"Rebuild #{self.rebuild_count}: changed {changed_inputs}")
+
+        # Write logs.
+        messages = [
+            "WATCH REBUILD STARTED",
+            f"REBUILD = {self.rebuild_count}",
+            f"CHANGED INPUTS = {changed_inputs}",
+        ]
+        logs.Logs.write_logs(messages)
+
+        # Validate all input databases before any of them is parsed again, since the
+        # changed files are checked against the unchanged ones. The errors are written
+        # to the report file, and the previous outputs are kept.
+        validator.Validator.check_databases()
+
+        # Parse the changed database files only.
+        if config.STUDENTS_PATH in changed_paths:
+            config.STUDENTS_DB.clear()
+            utility.Utility.get_students_database()
+        if config.PINS_PATH in changed_paths:
+            config.PINS_DB.clear()
+            utility.Utility.get_pins_database()
+        changed_room_ids = {
+            os.path.splitext(os.path.basename(path))[0]
+            for path in changed_paths
+            if os.path.dirname(path) == config.SEATS_PATH
+        }
+        self.reload_rooms(config.ROOMS_PATH in changed_paths, changed_room_ids)
+
+        # Remove the previous assignment, then assign seats again with the same seed.
+        for student_obj in config.STUDENTS_DB.values():
+            student_obj.room = None
+            student_obj.seat = None
+        config.TOTAL_AVAILABLE_SEATS = sum(
+            len(room_obj.available_seats_id) for room_obj in config.ROOMS_DB.values()
+        )
+        self.randomizer.reset_seed()
+        self.randomizer.assign_seats_to_students()
+
+        # Write the output files whose content has changed.
+        rewritten_rooms = self.write_changed_rooms()
+        changed_student_rows = self.write_changed_students()
+
+        # The combined output files of all rooms cannot be updated in place, so the
+        # additional output formats are written again if any room has changed.
+        if config.OUTPUT_FORMATS and rewritten_rooms:
+            generator.Generator.generate_output_all_rooms_formats()
+
+        # The assignment file has the records of all rooms, so it is written again
+        # if any output has changed.
+        if config.WRITE_ASSIGNMENT_FILE and (rewritten_rooms or changed_student_rows):
+            assignment.AssignmentFile.write(self.randomizer)
+
+        # Render the HTML pages again. Only the changed rooms are rendered.
+        if config.RENDER_HTML and rewritten_rooms:
+            renderer.Renderer().render_all()
+
+        # Write report.
+        logs.Logs.write_report("-" * 88)
+        logs.Logs.write_report(
+            f"Watch rebuild #{self.rebuild_count} at {logs.Logs.get_time_str()}"
+        )
+        logs.Logs.write_report(f"Changed Inputs: {changed_inputs}")
+        logs.Logs.write_report(f"Rewritten Room CSVs: {rewritten_rooms}")
+        logs.Logs.write_report(f"Changed Student Rows: {changed_student_rows}")
+        logs.Logs.write_report("-" * 88)
+
+        print(
+            f"Rebuild #{self.rebuild_count}: rewrote {len(rewritten_rooms)} room CSV(s), "
+            f"{changed_student_rows} student row(s) changed."
+        )
+
+    def reload_rooms(self, is_rooms_changed, changed_room_ids):
+        """
+        Update the rooms database, parsing only the changed seat files
+        and the seat files of new rooms.
+
+        Args:
+            is_rooms_changed (bool): Whether the rooms CSV database file has changed.
+            changed_room_ids (set): The IDs of the rooms whose seat files have changed.
+        """
+
+        # Get the rooms from the rooms CSV file only if it has changed.
+        if is_rooms_changed:
+            rows = [
+                (row.room_id, row.room_name, row.capacity)
+                for row in utility.Utility.read_rooms_csv().itertuples()
+            ]
+        else:
+            rows = [
+                (room_obj.room_id, room_obj.room_name, room_obj.capacity)
+                for room_obj in config.ROOMS_DB.values()
+            ]
+
+        ROOMS_DB = {}
+        for room_id, room_name, capacity in rows:
+            previous_room = config.ROOMS_DB.get(room_id)
+
+            # Reuse the unchanged rooms, only removing their previous assignment.
+            if (
+                previous_room is not None
+                and room_id not in changed_room_ids
+                and (previous_room.room_name, previous_room.capacity)
+                == (room_name, capacity)
+            ):
+                previous_room.reset_assignment()
+                ROOMS_DB[room_id] = previous_room
+                continue
+
+            # Parse the seat file only if it has changed or the room is new.
+            if previous_room is not None and room_id not in changed_room_ids:
+                seat_arrays = (
+                    previous_room.seat_ids,
+                    previous_room.seat_names,
+                    previous_room.seat_availability,
+                )
+            else:
+                seat_arrays = utility.Utility.get_seat_arrays(room_id)
+            ROOMS_DB[room_id] = room.Room(room_id, room_name, capacity, *seat_arrays)
+
+        # Remove the output files of the removed rooms.
+        for room_id in set(config.ROOMS_DB) - set(ROOMS_DB):
+            room_path = os.path.join(config.GENERATED_ROOMS_PATH, f"{room_id}.csv")
+            if os.path.exists(room_path):
+                os.remove(room_path)
+            self.room_frames.pop(room_id, None)
+
+        # Keep the same dictionary object, since other modules refer to it.
+        config.ROOMS_DB.clear()
+        config.ROOMS_DB.update(ROOMS_DB)
+
+    def write_changed_rooms(self):
+        """
+        Write the output room CSV files whose content has changed.
+
+        Returns:
+            list[str]: The IDs of the rooms whose output CSV files are written.
+        """
+
+        rewritten_rooms = []
+        for room_id, room_obj in sorted(config.ROOMS_DB.items()):
+            report_data_frame, unassigned_seats = (
+                generator.Generator.get_room_data_frame(room_obj)
+            )
+            previous_frame = self.room_frames.get(room_id)
+            if previous_frame is not None and previous_frame.equals(report_data_frame):
+                continue
+
+            generator.Generator.write_room_data_frame(
+                room_obj, report_data_frame, unassigned_seats
+            )
+            self.room_frames[room_id] = report_data_frame
+            rewritten_rooms.append(room_id)
+
+        return rewritten_rooms
+
+    def write_changed_students(self):
+        """
+        Write the output students CSV file if any of its rows has changed.
+
+        Returns:
+            int: The number of changed, added or removed rows.
+        """
+
+        report_data_frame = generator.Generator.get_students_data_frame()
+        student_rows = Watcher.get_rows(report_data_frame)
+        changed_rows = sum(
+            student_rows.get(student_id) != self.student_rows.get(student_id)
+            for student_id in student_rows.keys() | self.student_rows.keys()
+        )
+
+        # A CSV file cannot be updated in place, so write it again only if a row has changed.
+        if changed_rows:
+            generator.Generator.write_students_data_frame(report_data_frame)
+            self.student_rows = student_rows
+
+        return changed_rows
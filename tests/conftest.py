@@ -0,0 +1,83 @@
+# ----------------------------------------------------------------------
+# File Name     : conftest.py
+# Author        : Worralop Srichainont
+# Description   : Shared fixtures for running the seat randomizer on a copy
+#                 of the sample databases.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+import config
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    """
+    Copy the source code and the sample databases to a temporary directory,
+    so each run writes its own generated folder.
+    """
+
+    shutil.copytree(
+        os.path.join(config.ROOT_PATH, "src"),
+        tmp_path / "src",
+        ignore=shutil.ignore_patterns("__pycache__"),
+    )
+    shutil.copytree(config.DB_PATH, tmp_path / "database")
+    os.makedirs(tmp_path / "generated" / "rooms")
+    os.makedirs(tmp_path / "generated" / "logs")
+    return tmp_path
+
+
+@pytest.fixture
+def run_main(workspace):
+    """
+    Run the application of the workspace with the command line arguments,
+    and return its output after checking that it succeeded, unless check is False.
+    """
+
+    def run(*arguments, stdin="", check=True):
+        result = subprocess.run(
+            [sys.executable, "main.py", *arguments],
+            cwd=workspace / "src",
+            input=stdin,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if check:
+            assert result.returncode == 0, result.stdout + result.stderr
+        return result.stdout
+
+    return run
+
+
+@pytest.fixture
+def read_outputs(workspace):
+    """
+    Read the output files of the workspace, without the logs and checkpoint files,
+    and remove them, so the next run cannot leave the outputs of this run behind.
+    """
+
+    def read():
+        generated_path = workspace / "generated"
+        OUTPUTS = {}
+        for dir_path, dir_names, file_names in os.walk(generated_path):
+            dir_names[:] = [
+                dir_name
+                for dir_name in dir_names
+                if dir_name not in ("logs", "checkpoint")
+            ]
+            for file_name in file_names:
+                path = os.path.join(dir_path, file_name)
+                with open(path, "rb") as file:
+                    OUTPUTS[os.path.relpath(path, generated_path)] = file.read()
+                os.remove(path)
+        return OUTPUTS
+
+    return read
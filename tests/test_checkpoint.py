@@ -0,0 +1,56 @@
+# ----------------------------------------------------------------------
+# File Name     : test_checkpoint.py
+# Author        : Worralop Srichainont
+# Description   : Tests for resuming an interrupted run from its checkpoint.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import pytest
+
+# The lines of main.py after which the run is interrupted.
+INTERRUPT_LINES = {
+    "after load": "self.checkpoint.save(checkpoint.PHASE_LOAD, self.randomizer)",
+    "after assign": "self.checkpoint.save(checkpoint.PHASE_ASSIGN, self.randomizer)",
+    "after students": "self.checkpoint.mark_students_written()",
+}
+
+
+def interrupt_after(main_path, line):
+    """
+    Rewrite main.py to raise an error right after a line, and return its source code
+    to restore it.
+    """
+
+    source = main_path.read_text(encoding="utf-8")
+    assert source.count(line) == 1
+    indent = source[: source.index(line)].rsplit("\n", 1)[1]
+    main_path.write_text(
+        source.replace(line, f'{line}\n{indent}raise RuntimeError("interrupted")'),
+        encoding="utf-8",
+    )
+    return source
+
+
+@pytest.mark.parametrize("interrupt", INTERRUPT_LINES)
+@pytest.mark.parametrize("mode_arguments", [["--seed", "RICE-SHOWER"], []])
+def test_resume_matches_uninterrupted_run(
+    workspace, run_main, read_outputs, interrupt, mode_arguments
+):
+    """
+    Resuming a run interrupted after each phase gives the same outputs as
+    an uninterrupted run.
+    """
+
+    stdin = "" if mode_arguments else "n\n"
+    run_main(*mode_arguments, stdin=stdin)
+    uninterrupted_outputs = read_outputs()
+
+    main_path = workspace / "src" / "main.py"
+    source = interrupt_after(main_path, INTERRUPT_LINES[interrupt])
+    interrupted_output = run_main(*mode_arguments, stdin=stdin, check=False)
+    main_path.write_text(source, encoding="utf-8")
+    assert "The results have been saved" not in interrupted_output
+
+    assert "Resuming the interrupted run" in run_main("--resume")
+    assert read_outputs() == uninterrupted_outputs
+    assert not (workspace / "generated" / "checkpoint").exists()
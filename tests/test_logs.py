@@ -0,0 +1,75 @@
+# ----------------------------------------------------------------------
+# File Name     : test_logs.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the segmented and compressed logs files.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+
+import pytest
+
+import config
+import logs
+
+
+@pytest.fixture(params=[config.LOGS_COMPRESSION_GZIP, config.LOGS_COMPRESSION_ZSTD])
+def compression(request, monkeypatch):
+    """
+    Use each compression with a small segment size limit.
+    """
+
+    if request.param == config.LOGS_COMPRESSION_ZSTD and logs.zstandard is None:
+        pytest.skip("The 'zstandard' package is not installed.")
+    monkeypatch.setattr(config, "LOGS_COMPRESSION", request.param)
+    monkeypatch.setattr(config, "LOGS_MAX_SEGMENT_BYTES", 2000)
+    return request.param
+
+
+def test_compressed_segments_rotate(tmp_path, compression):
+    """
+    The compressed segments are rotated at the size limit on disk,
+    and all lines are read back in order.
+    """
+
+    base_path = str(tmp_path / "logs.txt")
+    lines = [
+        f"TIMESTAMP: [{idx}]\n  - STUDENT OBJECT CREATED {idx}\n" for idx in range(5000)
+    ]
+    segments = logs.LogSegments(base_path, "LOGS")
+    for line in lines:
+        segments.write(line)
+    segments.close()
+
+    segment_paths = logs.LogSegments.get_segment_paths(base_path)
+    assert len(segment_paths) > 1
+    for segment_path in segment_paths:
+        assert segment_path.endswith(config.LOGS_COMPRESSION_EXTENSIONS[compression])
+        assert os.path.getsize(segment_path) <= config.LOGS_MAX_SEGMENT_BYTES + 512
+
+    text = "".join(logs.Logs.read_logs(base_path))
+    assert "".join(
+        line
+        for line in text.splitlines(keepends=True)
+        if not line.startswith(("-", "LOGS "))
+    ) == "".join(lines)
+
+
+def test_append_continues_in_last_segment(tmp_path, compression):
+    """
+    Appending continues in the segment with the highest index, even if an earlier
+    segment exists with several compressions.
+    """
+
+    base_path = str(tmp_path / "logs.txt")
+    for other_compression in config.LOGS_COMPRESSION_EXTENSIONS:
+        open(
+            logs.LogSegments.get_segment_path(base_path, 0, other_compression), "wb"
+        ).close()
+    open(logs.LogSegments.get_segment_path(base_path, 1, compression), "wb").close()
+
+    segments = logs.LogSegments(base_path, "LOGS", append=True)
+    segments.close()
+
+    assert logs.LogSegments.get_last_segment_index(base_path) == 1
+    assert segments.segment_index == 1
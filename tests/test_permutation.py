@@ -0,0 +1,58 @@
+# ----------------------------------------------------------------------
+# File Name     : test_permutation.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the keyed permutation seating arrangement and the
+#                 computation of the seat of one student.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import csv
+import io
+
+import pytest
+
+import permutation
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 5, 16, 17, 100, 1000])
+def test_feistel_permutation_is_a_bijection(size):
+    """
+    The keyed permutation maps the indices 0 to size - 1 one-to-one onto themselves.
+    """
+
+    feistel = permutation.FeistelPermutation(
+        size, permutation.FeistelPermutation.get_key("RICE-SHOWER", "STUDENTS")
+    )
+    assert sorted(feistel.permute(index) for index in range(size)) == list(range(size))
+    with pytest.raises(IndexError):
+        feistel.permute(size)
+
+
+@pytest.mark.parametrize("seed", ["RICE-SHOWER", "ANOTHER-SEED"])
+def test_compute_seat_matches_full_run(run_main, read_outputs, seed):
+    """
+    The --permutation run seats every student on a different seat, and --compute-seat
+    gives the same room and seat as the full run.
+    """
+
+    run_main("--permutation", "--seed", seed)
+    outputs = read_outputs()
+
+    rows = list(
+        csv.reader(io.StringIO(outputs["output_students.csv"].decode("utf-8-sig")))
+    )[1:]
+    seats = {row[0]: (row[2], int(row[3])) for row in rows}
+    assert len(seats) == len(rows) == 160
+    assert len(set(seats.values())) == len(seats)
+
+    for student_id in sorted(seats)[::40]:
+        lines = dict(
+            line.split(": ", 1)
+            for line in run_main(
+                "--compute-seat", student_id, "--seed", seed
+            ).splitlines()
+            if ": " in line
+        )
+        room_name = lines["Room"].split(" (", 1)[1].rstrip(")")
+        seat_name = lines["Seat"].split(" (", 1)[1].rstrip(")")
+        assert (room_name, int(seat_name)) == seats[student_id]
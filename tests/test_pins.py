@@ -0,0 +1,77 @@
+# ----------------------------------------------------------------------
+# File Name     : test_pins.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the students pinned to a room or a seat.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import csv
+import io
+
+import pytest
+
+# The pinned students, with their pinned room ID and seat ID, and their room name and
+# seat name in the outputs. The seat name is None for a student pinned to a room only.
+PINS = {
+    "6525683421": ("R01", "R01-01", "ROOM 01", "1"),
+    "6543950921": ("R03", "R03-12", "ROOM 03", "12"),
+    "6529497821": ("R05", "", "ROOM 05", None),
+}
+
+
+@pytest.fixture
+def pinned_workspace(workspace):
+    """
+    Add a pins database with seat pins and a room pin to the workspace.
+    """
+
+    (workspace / "database" / "pins").mkdir()
+    with open(
+        workspace / "database" / "pins" / "pins.csv", "w", encoding="utf-8"
+    ) as pins_file:
+        pins_file.write("student_id,room_id,seat_id\n")
+        pins_file.writelines(
+            f"{student_id},{room_id},{seat_id}\n"
+            for student_id, (room_id, seat_id, _, _) in PINS.items()
+        )
+    return workspace
+
+
+@pytest.mark.parametrize(
+    "arguments, stdin",
+    [
+        (["--seed", "RICE-SHOWER"], ""),
+        (["--seed", "ANOTHER-SEED"], ""),
+        (["--seed", "RICE-SHOWER", "--pipeline"], ""),
+        ([], "n\n"),
+    ],
+)
+def test_pinned_students_keep_their_seats(
+    pinned_workspace, run_main, read_outputs, arguments, stdin
+):
+    """
+    The pinned students land on their pinned room and seat, and no other student
+    gets a pinned seat.
+    """
+
+    run_main(*arguments, stdin=stdin)
+    outputs = read_outputs()
+
+    rows = list(
+        csv.reader(io.StringIO(outputs["output_students.csv"].decode("utf-8-sig")))
+    )
+    seats = {row[0]: (row[2], row[3]) for row in rows[1:]}
+    for student_id, (_, _, room_name, seat_name) in PINS.items():
+        assert seats[student_id][0] == room_name
+        if seat_name is not None:
+            assert seats[student_id][1] == seat_name
+
+    pinned_seats = {
+        (room_name, seat_name)
+        for _, _, room_name, seat_name in PINS.values()
+        if seat_name is not None
+    }
+    assert len(set(seats.values())) == len(seats)
+    assert {
+        student_id for student_id, seat in seats.items() if seat in pinned_seats
+    } == {student_id for student_id, pin in PINS.items() if pin[3] is not None}
@@ -0,0 +1,26 @@
+# ----------------------------------------------------------------------
+# File Name     : test_pipeline.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the pipelined generation of the output files.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import pytest
+
+
+@pytest.mark.parametrize("mode_arguments", [["--seed", "RICE-SHOWER"], []])
+def test_pipeline_matches_sequential(run_main, read_outputs, mode_arguments):
+    """
+    The --pipeline outputs are byte-identical to the sequential outputs with the
+    same seed, in random mode and in normal mode.
+    """
+
+    stdin = "" if mode_arguments else "n\n"
+    run_main(*mode_arguments, stdin=stdin)
+    sequential_outputs = read_outputs()
+
+    run_main(*mode_arguments, "--pipeline", stdin=stdin)
+    pipeline_outputs = read_outputs()
+
+    assert "output_students.csv" in sequential_outputs
+    assert pipeline_outputs == sequential_outputs
@@ -0,0 +1,25 @@
+# ----------------------------------------------------------------------
+# File Name     : test_sharder.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the sharded seating arrangement.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import pytest
+
+
+@pytest.mark.parametrize("mode_arguments", [["--seed", "RICE-SHOWER"], []])
+def test_outputs_do_not_depend_on_shards(run_main, read_outputs, mode_arguments):
+    """
+    The sharded outputs are byte-identical for any number of shards, including more
+    shards than rooms.
+    """
+
+    stdin = "" if mode_arguments else "n\n"
+    run_main(*mode_arguments, "--shards", "1", stdin=stdin)
+    single_shard_outputs = read_outputs()
+    assert "output_students.csv" in single_shard_outputs
+
+    for shards in ["2", "3", "7"]:
+        run_main(*mode_arguments, "--shards", shards, stdin=stdin)
+        assert read_outputs() == single_shard_outputs, shards
@@ -0,0 +1,222 @@
+# ----------------------------------------------------------------------
+# File Name     : test_validator.py
+# Author        : Worralop Srichainont
+# Description   : Tests for the validation of the input CSV databases.
+# Date          : 2026-10-19
+# ----------------------------------------------------------------------
+
+import os
+import shutil
+
+import pytest
+
+import config
+import validator
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    """
+    Use a copy of the sample databases, and only keep the logs in memory.
+    """
+
+    db_path = tmp_path / "database"
+    shutil.copytree(config.DB_PATH, db_path)
+    monkeypatch.setattr(config, "DB_PATH", str(db_path))
+    monkeypatch.setattr(
+        config, "STUDENTS_PATH", str(db_path / "students" / "students.csv")
+    )
+    monkeypatch.setattr(config, "ROOMS_PATH", str(db_path / "rooms" / "rooms.csv"))
+    monkeypatch.setattr(config, "SEATS_PATH", str(db_path / "rooms" / "seats"))
+    monkeypatch.setattr(config, "PINS_PATH", str(db_path / "pins" / "pins.csv"))
+    monkeypatch.setattr(config, "LOGS_MODE", config.LOGS_MODE_FLIGHT)
+    return db_path
+
+
+def append_lines(path, lines):
+    """
+    Append lines to a CSV database file.
+    """
+
+    with open(path, "a", encoding="utf-8") as file:
+        file.write("".join(f"{line}\n" for line in lines))
+
+
+def replace_text(path, old, new):
+    """
+    Replace a text in a CSV database file.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    assert old in text
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text.replace(old, new))
+
+
+def write_pins(db_path, lines):
+    """
+    Write a pins database file with the lines below its header.
+    """
+
+    os.makedirs(db_path / "pins", exist_ok=True)
+    with open(db_path / "pins" / "pins.csv", "w", encoding="utf-8") as file:
+        file.write("student_id,room_id,seat_id\n")
+        file.write("".join(f"{line}\n" for line in lines))
+
+
+def get_student_ids(db_path, amount):
+    """
+    Get the first student IDs of the students database.
+    """
+
+    with open(db_path / "students" / "students.csv", encoding="utf-8") as file:
+        return [line.split(",")[0] for line in file.read().splitlines()[1 : amount + 1]]
+
+
+def set_room_unavailable(db_path, room_id):
+    """
+    Make all seats of a room unavailable.
+    """
+
+    replace_text(db_path / "rooms" / "seats" / f"{room_id}.csv", ",True", ",False")
+
+
+CASES = {
+    "file not found": (
+        lambda db_path: os.remove(db_path / "students" / "students.csv"),
+        "students/students.csv: file not found.",
+    ),
+    "missing columns": (
+        lambda db_path: replace_text(
+            db_path / "rooms" / "rooms.csv", "room_id,room_name,capacity", "room_id"
+        ),
+        "rooms/rooms.csv: missing columns ['room_name', 'capacity'].",
+    ),
+    "empty student_id": (
+        lambda db_path: append_lines(
+            db_path / "students" / "students.csv", [",STUDENT NO ID"]
+        ),
+        "students.csv: empty student_id at rows",
+    ),
+    "duplicate student_id": (
+        lambda db_path: append_lines(
+            db_path / "students" / "students.csv",
+            [f"{get_student_ids(db_path, 1)[0]},STUDENT AGAIN"],
+        ),
+        "students.csv: duplicate student_id",
+    ),
+    "empty room_id": (
+        lambda db_path: append_lines(db_path / "rooms" / "rooms.csv", [",ROOM X,0"]),
+        "rooms.csv: empty room_id at rows",
+    ),
+    "duplicate room_id": (
+        lambda db_path: append_lines(
+            db_path / "rooms" / "rooms.csv", ["R01,ROOM 01 AGAIN,40"]
+        ),
+        "rooms.csv: duplicate room_id",
+    ),
+    "invalid capacity": (
+        lambda db_path: replace_text(
+            db_path / "rooms" / "rooms.csv", "R01,ROOM 01,40", "R01,ROOM 01,-40"
+        ),
+        "rooms.csv: capacity is not a non-negative integer at rows",
+    ),
+    "missing seats file": (
+        lambda db_path: os.remove(db_path / "rooms" / "seats" / "R05.csv"),
+        "rooms.csv: rooms without seats database file ['R05'].",
+    ),
+    "unknown seats file": (
+        lambda db_path: shutil.copy(
+            db_path / "rooms" / "seats" / "R01.csv",
+            db_path / "rooms" / "seats" / "R99.csv",
+        ),
+        "seats: seats database files of unknown rooms ['R99'].",
+    ),
+    "empty seat_id": (
+        lambda db_path: append_lines(
+            db_path / "rooms" / "seats" / "R01.csv", [",41,True"]
+        ),
+        "seats/R01.csv: empty seat_id.",
+    ),
+    "duplicate seat_id": (
+        lambda db_path: replace_text(
+            db_path / "rooms" / "seats" / "R01.csv", "R01-02,02", "R01-01,02"
+        ),
+        "seats/R01.csv: duplicate seat_id ['R01-01'].",
+    ),
+    "invalid is_available": (
+        lambda db_path: replace_text(
+            db_path / "rooms" / "seats" / "R01.csv", "R01-01,01,True", "R01-01,01,Yes"
+        ),
+        "seats/R01.csv: is_available is not True or False",
+    ),
+    "seats over capacity": (
+        lambda db_path: append_lines(
+            db_path / "rooms" / "seats" / "R01.csv", ["R01-41,41,True"]
+        ),
+        "seats/R01.csv: 41 seats, but the room capacity is 40.",
+    ),
+    "duplicate pinned student_id": (
+        lambda db_path: write_pins(
+            db_path,
+            [f"{get_student_ids(db_path, 1)[0]},R01,"] * 2,
+        ),
+        "pins.csv: duplicate student_id",
+    ),
+    "unknown pinned student_id": (
+        lambda db_path: write_pins(db_path, ["0000000000,R01,"]),
+        "pins.csv: unknown student_id at rows",
+    ),
+    "unknown pinned room_id": (
+        lambda db_path: write_pins(db_path, [f"{get_student_ids(db_path, 1)[0]},R99,"]),
+        "pins.csv: unknown room_id at rows",
+    ),
+    "unavailable pinned seat_id": (
+        lambda db_path: write_pins(
+            db_path, [f"{get_student_ids(db_path, 1)[0]},R01,R01-33"]
+        ),
+        "pins.csv: seat_id is not an available seat of room_id at rows",
+    ),
+    "seat pinned twice": (
+        lambda db_path: write_pins(
+            db_path,
+            [f"{student_id},R01,R01-01" for student_id in get_student_ids(db_path, 2)],
+        ),
+        "pins.csv: seats of room R01 pinned more than once ['R01-01'].",
+    ),
+    "room pinned over its seats": (
+        lambda db_path: write_pins(
+            db_path,
+            [f"{student_id},R01," for student_id in get_student_ids(db_path, 33)],
+        ),
+        "pins.csv: 33 students pinned to room R01, but it has 32 available seats.",
+    ),
+    "not enough seats": (
+        lambda db_path: [
+            set_room_unavailable(db_path, room_id) for room_id in ["R04", "R05"]
+        ],
+        "Total available seats (96) are less than total students (160).",
+    ),
+}
+
+
+def test_valid_databases(database):
+    """
+    The sample databases have no errors.
+    """
+
+    assert validator.Validator.validate_databases() == []
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_reports_each_error(database, case):
+    """
+    Each class of errors is reported with its file and the invalid values.
+    """
+
+    mutate, expected_error = CASES[case]
+    mutate(database)
+
+    errors = validator.Validator.validate_databases()
+    assert any(error.startswith(expected_error) for error in errors), errors